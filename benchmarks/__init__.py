@@ -0,0 +1,19 @@
+# Micro-benchmarks for the performance-sensitive paths of strict_dataframe and browser_module.
+# Run from the repository root, one module at a time, e.g.
+#
+#   python -m benchmarks.append_buffer
+#
+# Every module prints one line per measurement (best of 'repeat' runs, in seconds).
+from typing import Any, Callable
+import time
+
+def bestOf(function: Callable[[], Any], repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+def report(label: str, seconds: float) -> None:
+    print(label.ljust(56) + ("%.4f" % seconds).rjust(10) + " s")
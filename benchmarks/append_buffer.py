@@ -0,0 +1,25 @@
+# StrictDataFrame.append: one-row appends onto a 3-column frame, then getValue()
+# (buffered appends, concatenated once), against rebuilding the frame with pd.concat on every append
+import pandas as pd
+from strict_dataframe import StrictDataFrame, Schema
+from . import bestOf, report
+
+COLUMNS = Schema.compile([("a", int), ("b", str), ("c", float)])
+
+def _bufferedAppends(count: int) -> None:
+    one = StrictDataFrame(COLUMNS, pd.DataFrame({"a": [1], "b": ["x"], "c": [0.5]}))
+    result = StrictDataFrame(COLUMNS)
+    for _ in range(count):
+        result = result.append(one)
+    result.getValue()
+
+def _concatPerAppend(count: int) -> None:
+    one = pd.DataFrame({"a": [1], "b": ["x"], "c": [0.5]})
+    result = pd.DataFrame({"a": pd.Series(dtype=int), "b": pd.Series(dtype=object), "c": pd.Series(dtype=float)})
+    for _ in range(count):
+        result = pd.concat([result, one], ignore_index=True)
+
+if __name__ == "__main__":
+    for count in (2500, 5000, 10000):
+        report("StrictDataFrame.append x " + str(count), bestOf(lambda: _bufferedAppends(count)))
+        report("pd.concat per append x " + str(count), bestOf(lambda: _concatPerAppend(count), repeat=1))
@@ -0,0 +1,30 @@
+# curry: calling a curried 3-argument function, saturated at once and one argument at a time,
+# against the previous nested-lambda implementation (one closure and one Reader per argument)
+from typing import Any, Callable, List
+from strict_dataframe import curry, Reader
+from . import bestOf, report
+
+CALLS = 200000
+
+def _nestedLambdaCurry(aFunction: Callable) -> Reader:
+    def buildReader(argValues: List[Any], numArgs: int) -> Any:
+        if numArgs == 0:
+            return aFunction(*argValues)
+        return lambda x: buildReader(argValues + [x], numArgs - 1)
+    return Reader(buildReader([], aFunction.__code__.co_argcount))
+
+def _add(x: int, y: int, z: int) -> int:
+    return x + y + z
+
+def _saturated(add: Reader) -> None:
+    for i in range(CALLS):
+        add(i, 2, 3)
+
+def _oneByOne(add: Reader) -> None:
+    for i in range(CALLS):
+        add(i)(2)(3)
+
+if __name__ == "__main__":
+    for label, add in (("nested lambdas", _nestedLambdaCurry(_add)), ("curry", curry(_add))):
+        report(label + ": f(1, 2, 3) x " + str(CALLS), bestOf(lambda: _saturated(add)))
+        report(label + ": f(1)(2)(3) x " + str(CALLS), bestOf(lambda: _oneByOne(add)))
@@ -0,0 +1,30 @@
+# Just / Nothing: memory held by 100k live Just values (against an equivalent class with an
+# instance __dict__), and a Just(1).fmap().bind().fmap() chain
+import tracemalloc
+from strict_dataframe import Just, Nothing
+from . import bestOf, report
+
+COUNT = 100000
+CHAINS = 200000
+
+class _UnslottedJust:
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+def _bytesPerValue(build: type) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    values = [build(i) for i in range(COUNT)]
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    # excludes the list holding the values; the int values themselves are counted in both measurements
+    return (held - len(values) * 8) / COUNT
+
+def _chains() -> None:
+    for i in range(CHAINS):
+        Just(i).fmap(lambda x: x + 1).bind(lambda x: Just(x * 2) if x > 0 else Nothing).fmap(str)
+
+if __name__ == "__main__":
+    print("bytes per Just (slots)".ljust(56) + ("%.0f" % _bytesPerValue(Just)).rjust(10) + " B")
+    print("bytes per value (instance __dict__)".ljust(56) + ("%.0f" % _bytesPerValue(_UnslottedJust)).rjust(10) + " B")
+    report("Just(i).fmap().bind().fmap() x " + str(CHAINS), bestOf(_chains))
@@ -0,0 +1,30 @@
+# CumulativeMonoidSet.append: 1,000 steps each appending one monoid onto a set of 200 keyed monoids,
+# against rebuilding the set from both value lists on every append
+from strict_dataframe import CumulativeMonoidSet, Monoid
+from . import bestOf, report
+
+class _Counter(Monoid):
+    def __init__(self, value: int = 0) -> None:
+        super(_Counter, self).__init__(value)
+
+    @staticmethod
+    def mzero() -> '_Counter':
+        return _Counter()
+
+    def mplus(self, other: '_Counter') -> '_Counter':
+        return type(self)(self.value + other.value)
+
+KINDS = [type("Counter" + str(i), (_Counter,), {}) for i in range(200)]
+
+def _appendEach(rebuild: bool) -> None:
+    accumulated = CumulativeMonoidSet([kind() for kind in KINDS])
+    for step in range(1000):
+        added = CumulativeMonoidSet([KINDS[step % len(KINDS)](1)])
+        if rebuild:
+            accumulated = CumulativeMonoidSet(accumulated.getValueAsList() + added.getValueAsList())
+        else:
+            accumulated = accumulated + added
+
+if __name__ == "__main__":
+    report("append, rebuilt from lists", bestOf(lambda: _appendEach(rebuild=True)))
+    report("append, appended keys only", bestOf(lambda: _appendEach(rebuild=False)))
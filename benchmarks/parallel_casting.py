@@ -0,0 +1,25 @@
+# StrictDataFrame construction of a 400,000 x 50 frame that needs every column cast (int -> float),
+# serially and with ParallelCasting on 4 / 16 threads and 4 processes.
+# Threads only help on machines with several cores (numpy releases the GIL while casting).
+import numpy as np
+import pandas as pd
+from strict_dataframe import StrictDataFrame, Schema, ParallelCasting
+from . import bestOf, report
+
+ROWS = 400000
+WIDTH = 50
+
+def _build(dataframe: pd.DataFrame, schema: Schema, parallel: ParallelCasting) -> None:
+    StrictDataFrame(schema, dataframe, parallel=parallel).getValue()
+
+if __name__ == "__main__":
+    dataframe = pd.DataFrame({"c" + str(i): np.arange(ROWS) for i in range(WIDTH)})
+    schema = Schema.compile([("c" + str(i), float) for i in range(WIDTH)])
+    settings = [
+        ("serial", ParallelCasting()),
+        ("4 threads", ParallelCasting(workers=4)),
+        ("16 threads", ParallelCasting(workers=16)),
+        ("4 processes", ParallelCasting(workers=4, use_processes=True))
+    ]
+    for label, parallel in settings:
+        report("cast " + str(ROWS) + " x " + str(WIDTH) + ", " + label, bestOf(lambda: _build(dataframe, schema, parallel)))
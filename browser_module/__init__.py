@@ -14,6 +14,7 @@ __all__ = [
 	'SafeWebDriver',
 	'ChromeWebDriver',
 	'SafeWebElement',
+	'BlankSafeWebElement',
 	'BrowserSession',
 
 	# browser_module
@@ -23,15 +24,51 @@ __all__ = [
 	'ElementFunction',
 	'BrowserFunction',
 	'MonadicBrowserFunction',
-	'BlankSafeWebElement',
 	'FunctionDictionary',
+	'LogEntry',
+	'LogSink',
+	'setLogSink',
+	'getLogSink',
+	'BrowserPipeline',
 	'compose',
 	'build',
-	'Do'
+	'Do',
+
+	# browser_pool
+	'DriverFactory',
+	'PipelineBuilder',
+	'SessionResult',
+	'WebDriverPool',
+	'BrowserSessionPool',
+
+	# browser_async
+	'AsyncMonadicBrowserFunction',
+	'AnyMonadicBrowserFunction',
+	'AsyncBrowserPipeline',
+	'AsyncDo',
+	'composeAsync',
+
+	# browser_wait
+	'WaitCondition',
+	'BackoffPolicy',
+	'WaitScheduler',
+	'pollUntil',
+	'sharedWaitScheduler',
+
+	# browser_cache
+	'FramePath',
+	'ElementCacheKey',
+	'ElementCache',
+	'elementCacheOf',
+
+	# browser_logging
+	'LogLevel',
+	'QueuedLogSink',
+	'configureLogging'
 ]
 
 # Let users know if they're missing any of our hard dependencies
-hard_dependencies = ("typing", "functools", "selenium", "sys", "pandas", "enum", "strict_dataframe")
+hard_dependencies = ("typing", "functools", "concurrent", "multiprocessing", "asyncio", "logging", "json", "selenium", "sys", "pandas", "numpy", "enum", "strict_dataframe")
 missing_dependencies = []
 
 for dependency in hard_dependencies:
@@ -48,4 +85,9 @@ del hard_dependencies, dependency, missing_dependencies
 
 # Internal Imports
 from .browser_types import *
+from .browser_wait import *
+from .browser_cache import *
 from .browser_module import *
+from .browser_pool import *
+from .browser_async import *
+from .browser_logging import *
@@ -0,0 +1,168 @@
+# __________________________________________________________________________________________
+# DEPENDENCIES
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Tuple, Union
+from concurrent.futures import Executor, ThreadPoolExecutor
+from threading import Lock
+import asyncio
+import time
+
+from strict_dataframe import Monad, Nothing
+from .browser_types import SafeWebDriver, BrowserSessionLog, CumulativeMonoidSet, SafeWebElement, BrowserValue, BrowserSession \
+    , WebDriver, WebElementSignature, DataFrame
+from .browser_module import MonadicBrowserFunction, BrowserPipeline, Seconds, Expect, _asLoggedBrowserAction \
+    , _driverFunction_to_browserFunction, _elementFromCondition, _doNothing, _stepCounters, _stepName
+from .browser_wait import BackoffPolicy, WaitScheduler, sharedWaitScheduler
+from selenium.common.exceptions import TimeoutException
+
+# __________________________________________________________________________________________
+# NAMED TYPES
+AsyncMonadicBrowserFunction = Callable[[BrowserValue], Awaitable[BrowserSession]]
+AnyMonadicBrowserFunction = Union[MonadicBrowserFunction, AsyncMonadicBrowserFunction]
+
+# __________________________________________________________________________________________
+# FUNCTIONS
+
+# blocking WebDriver calls of async pipelines run on a bounded thread pool, shared by all
+# pipelines that aren't given their own executor
+_DEFAULT_EXECUTOR_WORKERS = 32
+_default_executor: Optional[Executor] = None
+_default_executor_lock = Lock()
+
+def _defaultExecutor() -> Executor:
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = ThreadPoolExecutor(max_workers=_DEFAULT_EXECUTOR_WORKERS, thread_name_prefix="AsyncBrowserPipeline")
+        return _default_executor
+
+def _keepBrowserValue(driver: SafeWebDriver, logs: BrowserSessionLog, data: CumulativeMonoidSet, element: SafeWebElement) -> BrowserValue:
+    return (driver, logs, data, element)
+
+def _composeAsync(functions: Sequence[AnyMonadicBrowserFunction], executor: Optional[Executor] = None) -> 'AsyncBrowserPipeline':
+    return AsyncBrowserPipeline(functions, executor)
+
+# __________________________________________________________________________________________
+# CLASSES
+class AsyncBrowserPipeline:
+    # Awaitable counterpart of BrowserPipeline: 'await pipeline(browser_value)' returns the BrowserSession.
+    # Steps can be plain monadic browser functions (e.g. Do.goToUrl(url)), which are bound on
+    # the executor so their blocking WebDriver calls don't block the event loop, or coroutine
+    # functions (e.g. AsyncDo.wait(1)), which are awaited directly. One event loop can drive
+    # many sessions concurrently:
+    #
+    #   await asyncio.gather(*[composeAsync([Do.goToUrl(url), AsyncDo.wait(2), ...])(value) for ...])
+    #
+    # Steps are kept flat like those of a BrowserPipeline (both kinds of pipelines are spliced in).
+    # It isn't a BrowserPipeline itself: it can't be run synchronously, and so can't be
+    # checkpointed or spliced into a BrowserPipeline.
+    def __init__(self, functions: Sequence[AnyMonadicBrowserFunction], executor: Optional[Executor] = None) -> None:
+        steps: List[AnyMonadicBrowserFunction] = []
+        for function in functions:
+            if isinstance(function, (BrowserPipeline, AsyncBrowserPipeline)):
+                steps.extend(function.getSteps())
+            else:
+                steps.append(function)
+        self.__steps: Tuple[AnyMonadicBrowserFunction, ...] = tuple(steps)
+        self.__executor: Optional[Executor] = executor
+
+    def getSteps(self) -> Tuple[AnyMonadicBrowserFunction, ...]:
+        return self.__steps
+
+    def getStepCount(self) -> int:
+        return len(self.__steps)
+
+    def getStepNames(self) -> List[str]:
+        return [_stepName(step) for step in self.__steps]
+
+    def __len__(self) -> int:
+        return len(self.__steps)
+
+    def getExecutor(self) -> Executor:
+        return self.__executor if self.__executor is not None else _defaultExecutor()
+
+    async def __call__(self, browser_value: BrowserValue) -> BrowserSession:
+        loop = asyncio.get_running_loop()
+        executor = self.getExecutor()
+        session = BrowserSession.unit(browser_value)
+        for step in self.__steps:
+            if asyncio.iscoroutinefunction(step):
+                session = await step(session.getValue())
+                if not isinstance(session, Monad): raise TypeError("Operator '>>' must return a Monad instance.")
+            else:
+                session = await loop.run_in_executor(executor, session.__rshift__, step)
+        return session
+
+    async def profile(self, browser_value: BrowserValue) -> Tuple[BrowserSession, DataFrame]:
+        # awaitable counterpart of BrowserPipeline.profile: wall-clock seconds per step, waiting included
+        timings: List[float] = []
+        session = BrowserSession.unit(browser_value)
+        for step in self.__steps:
+            started = time.perf_counter()
+            session = await AsyncBrowserPipeline([step], self.__executor)(session.getValue())
+            timings.append(time.perf_counter() - started)
+        return session, DataFrame({'step': self.getStepNames(), 'seconds': timings})
+
+class AsyncDo:
+    # non-blocking variants of the Do actions that wait; any other Do action can be used as is
+    # in an AsyncBrowserPipeline. Their WebDriver calls (liveness checks included) and logging
+    # run on the default executor, only the waiting itself happens on the event loop; the
+    # logged seconds include the wait
+
+    @staticmethod
+    def wait(seconds: Seconds) -> AsyncMonadicBrowserFunction:
+        name = "wait(" + str(seconds) + ")"
+        log_step = _asLoggedBrowserAction(name=name, function=_keepBrowserValue)
+        async def __impure__wait(browser_value: BrowserValue) -> BrowserSession:
+            loop = asyncio.get_running_loop()
+            executor = _defaultExecutor()
+            driver, _, _, _ = browser_value
+            started = _stepCounters(driver)
+            if await loop.run_in_executor(executor, driver.isUsable):
+                await asyncio.sleep(seconds)
+            return await loop.run_in_executor(executor, log_step, browser_value, started)
+        setattr(__impure__wait, "step_name", name)
+        return __impure__wait
+
+    @staticmethod
+    def waitUntil(
+        this: WebElementSignature,
+        becomes: Expect,
+        within: Seconds = 3,
+        then: Callable[[WebElementSignature], MonadicBrowserFunction] = _doNothing,
+        backoff: BackoffPolicy = BackoffPolicy(),
+        scheduler: Optional[WaitScheduler] = None
+    ) -> AsyncMonadicBrowserFunction:
+        # the condition is polled by a WaitScheduler (the shared one by default) while the event
+        # loop awaits its future; like Do.waitUntil, an unmet condition puts the driver in error
+        # once 'within' seconds passed, and the element is the one produced by the condition
+        name = "waitUntil(" + str(this) + ", " + str(becomes) + ", " + str(then) + ")"
+        async def __impure__waitUntil(browser_value: BrowserValue) -> BrowserSession:
+            loop = asyncio.get_running_loop()
+            executor = _defaultExecutor()
+            driver, _, _, _ = browser_value
+            started = _stepCounters(driver)
+            outcome: List[Any] = []
+            waits = scheduler if scheduler is not None else sharedWaitScheduler()
+            submitted = await loop.run_in_executor(executor, driver.applyLocal, lambda handle: waits.submit(becomes(this), handle, within, backoff))
+            if submitted != Nothing:
+                try:
+                    outcome.append((True, await asyncio.wrap_future(submitted.getValue())))
+                except Exception as error:
+                    # raised in the driver function below, so it puts the driver in error
+                    outcome.append((False, error))
+            def __impure__result(handle: WebDriver) -> SafeWebElement:
+                if len(outcome) == 0:
+                    raise TimeoutException("Condition not checked")
+                satisfied, result = outcome[0]
+                if not satisfied:
+                    raise result
+                return _elementFromCondition(result, find=this, using=handle)
+            log_step = _asLoggedBrowserAction(name=name, function=_driverFunction_to_browserFunction(__impure__result))
+            session = await loop.run_in_executor(executor, log_step, browser_value, started)
+            return await loop.run_in_executor(executor, session.__rshift__, then(this))
+        setattr(__impure__waitUntil, "step_name", name)
+        return __impure__waitUntil
+
+# __________________________________________________________________________________________
+# EXPORT SELECT UTILITY FUNCTIONS
+composeAsync = _composeAsync
@@ -0,0 +1,182 @@
+# __________________________________________________________________________________________
+# DEPENDENCIES
+from typing import Dict, List, Optional, Tuple, Any
+from weakref import WeakKeyDictionary
+from collections import OrderedDict
+import json
+
+from selenium.webdriver.common.by import By as by
+from selenium.webdriver.remote.webelement import WebElement as SeleniumWebElement
+from .browser_types import By, WebDriver, WebElementSignature, SafeWebElement, BlankSafeWebElement, Just
+
+# __________________________________________________________________________________________
+# NAMED TYPES
+FramePath = Tuple[WebElementSignature, ...]
+ElementCacheKey = Tuple[By, str, FramePath]
+
+# __________________________________________________________________________________________
+# FUNCTIONS
+
+# resolves a list of [kind, query] locators in the page, one entry per locator:
+# the element if it's the only match, otherwise the number of matches (0 or more than 1),
+# or null when the query is invalid (left to find_elements, which reports the error)
+_RESOLVE_SCRIPT = """
+var locators = arguments[0], resolved = [];
+for (var i = 0; i < locators.length; i++) {
+    var matches = [];
+    try {
+        if (locators[i][0] === 'css') {
+            matches = document.querySelectorAll(locators[i][1]);
+        } else {
+            var snapshot = document.evaluate(locators[i][1], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (var j = 0; j < snapshot.snapshotLength; j++) { matches.push(snapshot.snapshotItem(j)); }
+        }
+    } catch (e) { matches = null; }
+    resolved.push(matches === null ? null : (matches.length === 1 ? matches[0] : matches.length));
+}
+return resolved;
+"""
+
+def _scriptLocator(find: WebElementSignature) -> Optional[Tuple[str, str]]:
+    # (kind, query) understood by _RESOLVE_SCRIPT, None for locators that need find_elements
+    strategy, value = find
+    if strategy == by.CSS_SELECTOR:
+        return ('css', value)
+    if strategy == by.XPATH:
+        return ('xpath', value)
+    if strategy == by.ID:
+        return ('css', '[id=' + json.dumps(value) + ']')
+    if strategy == by.NAME:
+        return ('css', '[name=' + json.dumps(value) + ']')
+    if strategy == by.TAG_NAME and value.isalnum():
+        return ('css', value)
+    if strategy == by.CLASS_NAME and len(value) > 0 and not any(character.isspace() for character in value):
+        # an attribute selector: '.' + value is invalid css for class names like '1st'
+        return ('css', '[class~=' + json.dumps(value) + ']')
+    return None
+
+def _uniqueElement(results: List[Any]) -> SafeWebElement:
+    # same rule as _getSafeWebElement: anything but exactly one match is no element
+    if len(results) != 1:
+        return BlankSafeWebElement
+    return SafeWebElement(Just(results[0]))
+
+# __________________________________________________________________________________________
+# CLASSES
+class ElementCache:
+    # Elements found on the current page, keyed by (By, value, frame path), so consecutive steps
+    # targeting the same WebElementSignature don't repeat the find_elements round-trip.
+    # Only unique matches are cached (a missing element may still appear). Entries are dropped:
+    # - all of them on navigation, frame switches and actions that may change the page
+    #   (see Do), or by clear()
+    # - one of them when using it raised a StaleElementReferenceException (invalidate(find))
+    # - the least recently used once more than 'max_entries' are cached
+    def __init__(self, max_entries: int = 256) -> None:
+        self.__entries: 'OrderedDict[ElementCacheKey, SafeWebElement]' = OrderedDict()
+        self.__frame: FramePath = ()
+        self.__max_entries: int = max_entries
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__script_calls: int = 0
+
+    def __key(self, find: WebElementSignature) -> ElementCacheKey:
+        return (find[0], find[1], self.__frame)
+
+    def __impure__store(self, key: ElementCacheKey, element: SafeWebElement) -> None:
+        if element is BlankSafeWebElement:
+            return
+        self.__entries[key] = element
+        self.__entries.move_to_end(key)
+        if len(self.__entries) > self.__max_entries:
+            self.__entries.popitem(last=False)
+
+    def lookup(self, find: WebElementSignature, using: WebDriver) -> SafeWebElement:
+        key = self.__key(find)
+        cached = self.__entries.get(key)
+        if cached is not None:
+            self.__hits += 1
+            self.__entries.move_to_end(key)
+            return cached
+        self.__misses += 1
+        element = _uniqueElement(using.find_elements(by=find[0], value=find[1]))
+        self.__impure__store(key, element)
+        return element
+
+    def resolve(self, finds: List[WebElementSignature], using: WebDriver) -> List[SafeWebElement]:
+        # like lookup() for every signature, resolving all cache misses in a single
+        # execute_script round-trip (locators the script can't express use find_elements)
+        keys = [self.__key(find) for find in finds]
+        resolved: Dict[ElementCacheKey, SafeWebElement] = {}
+        scripted: List[Tuple[ElementCacheKey, Tuple[str, str]]] = []
+        for find, key in zip(finds, keys):
+            if key in resolved:
+                continue
+            cached = self.__entries.get(key)
+            if cached is not None:
+                self.__hits += 1
+                resolved[key] = cached
+                continue
+            self.__misses += 1
+            locator = _scriptLocator(find)
+            if locator is None:
+                resolved[key] = _uniqueElement(using.find_elements(by=find[0], value=find[1]))
+                self.__impure__store(key, resolved[key])
+            else:
+                scripted.append((key, locator))
+                resolved[key] = BlankSafeWebElement
+        if len(scripted) > 0:
+            self.__script_calls += 1
+            results = using.execute_script(_RESOLVE_SCRIPT, [list(locator) for _, locator in scripted])
+            for (key, _), result in zip(scripted, results):
+                if result is None:
+                    # the script found the query invalid
+                    resolved[key] = _uniqueElement(using.find_elements(by=key[0], value=key[1]))
+                    self.__impure__store(key, resolved[key])
+                elif isinstance(result, SeleniumWebElement):
+                    resolved[key] = SafeWebElement(Just(result))
+                    self.__impure__store(key, resolved[key])
+        return [resolved[key] for key in keys]
+
+    def store(self, find: WebElementSignature, element: SafeWebElement) -> None:
+        # caches an element found by other means (e.g. returned by a wait condition)
+        self.__impure__store(self.__key(find), element)
+
+    def invalidate(self, find: WebElementSignature) -> None:
+        self.__entries.pop(self.__key(find), None)
+
+    def clear(self) -> None:
+        self.__entries.clear()
+
+    def enterFrame(self, frame: WebElementSignature) -> None:
+        self.__frame = self.__frame + (frame,)
+        self.clear()
+
+    def leaveFrames(self) -> None:
+        # back to the top-level document (e.g. after navigation)
+        self.__frame = ()
+        self.clear()
+
+    def getFramePath(self) -> FramePath:
+        return self.__frame
+
+    def getHits(self) -> int:
+        return self.__hits
+
+    def getMisses(self) -> int:
+        return self.__misses
+
+    def getScriptCalls(self) -> int:
+        return self.__script_calls
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+# one cache per WebDriver handle (i.e. per browser session), dropped together with the handle
+_element_caches: 'WeakKeyDictionary[WebDriver, ElementCache]' = WeakKeyDictionary()
+
+def elementCacheOf(handle: WebDriver) -> ElementCache:
+    cache = _element_caches.get(handle)
+    if cache is None:
+        cache = ElementCache()
+        _element_caches[handle] = cache
+    return cache
@@ -0,0 +1,166 @@
+# __________________________________________________________________________________________
+# DEPENDENCIES
+from typing import Any, Dict, List, Optional, TextIO
+from queue import Queue, Empty, Full
+from threading import Thread, Event, Lock
+import atexit
+import json
+import logging
+import sys
+import time
+
+from .browser_module import LogEntry, LogSink, setLogSink, getLogSink
+
+# __________________________________________________________________________________________
+# NAMED TYPES
+# levels are the standard logging levels (logging.DEBUG, logging.INFO, ...)
+LogLevel = int
+
+# __________________________________________________________________________________________
+# FUNCTIONS
+_LEVEL_OF_OUTCOME: Dict[str, LogLevel] = {
+    "Complete": logging.INFO,
+    "Skipped": logging.WARNING,
+    "Browser became unusable": logging.ERROR
+}
+
+def _entryLevel(entry: LogEntry) -> LogLevel:
+    return _LEVEL_OF_OUTCOME.get(str(entry.get('log')), logging.INFO)
+
+def _jsonLine(entry: LogEntry, level: LogLevel, logged_at: float) -> str:
+    record = dict(entry)
+    record['level'] = logging.getLevelName(level)
+    record['time'] = logged_at
+    return json.dumps(record, default=str)
+
+# __________________________________________________________________________________________
+# CLASSES
+class QueuedLogSink:
+    # A LogSink (see setLogSink) that never writes on the calling thread: entries at or above
+    # 'level' are queued and a background thread writes them in batches of up to 'batch_size',
+    # at least every 'flush_interval' seconds
+    # - path: JSON lines appended to this file (one object per entry, with level and time)
+    # - console: echo 'step...log' lines to stdout (off by default)
+    # When the queue holds 'max_queued' entries, further entries are dropped (and counted)
+    # rather than blocking the browser steps. The sessions' BrowserSessionLog is unaffected.
+    # Once closed, the sink ignores entries and stops being the installed sink (see close()).
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        level: LogLevel = logging.INFO,
+        console: bool = False,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+        max_queued: int = 100000
+    ) -> None:
+        self.__level: LogLevel = level
+        self.__console: bool = console
+        self.__batch_size: int = max(batch_size, 1)
+        self.__flush_interval: float = flush_interval
+        self.__queue: Queue = Queue(maxsize=max_queued)
+        self.__file: Optional[TextIO] = open(path, "a", encoding="utf-8") if path is not None else None
+        self.__stop: Event = Event()
+        self.__lock: Lock = Lock()
+        self.__written: int = 0
+        self.__dropped: int = 0
+        self.__writer: Thread = Thread(target=self.__impure__run, name="QueuedLogSink", daemon=True)
+        self.__writer.start()
+        atexit.register(self.close)
+
+    def __call__(self, entry: LogEntry) -> None:
+        level = _entryLevel(entry)
+        if level < self.__level:
+            return
+        with self.__lock:
+            # checked under the lock close() stops the writer with, so nothing is queued once
+            # the writer has drained the queue for the last time (flush() would never return)
+            if self.__stop.is_set():
+                return
+            try:
+                self.__queue.put_nowait((entry, level, time.time()))
+            except Full:
+                self.__dropped += 1
+
+    def setLevel(self, level: LogLevel) -> None:
+        self.__level = level
+
+    def getLevel(self) -> LogLevel:
+        return self.__level
+
+    def getWrittenCount(self) -> int:
+        return self.__written
+
+    def getDroppedCount(self) -> int:
+        return self.__dropped
+
+    def __impure__write(self, batch: List[Any]) -> None:
+        if self.__file is not None:
+            self.__file.write("".join(_jsonLine(entry, level, logged_at) + "\n" for entry, level, logged_at in batch))
+            self.__file.flush()
+        if self.__console:
+            sys.stdout.write("".join(entry['step'] + "..." + entry['log'] + "\n" for entry, _, _ in batch))
+            sys.stdout.flush()
+        with self.__lock:
+            self.__written += len(batch)
+
+    def __impure__drain(self, first_timeout: Optional[float]) -> bool:
+        # writes one batch, returns False if there was nothing to write
+        try:
+            batch = [self.__queue.get(timeout=first_timeout) if first_timeout is not None else self.__queue.get_nowait()]
+        except Empty:
+            return False
+        while len(batch) < self.__batch_size:
+            try:
+                batch.append(self.__queue.get_nowait())
+            except Empty:
+                break
+        self.__impure__write(batch)
+        for _ in batch:
+            self.__queue.task_done()
+        return True
+
+    def __impure__run(self) -> None:
+        while not self.__stop.is_set():
+            self.__impure__drain(self.__flush_interval)
+        while self.__impure__drain(None):
+            pass
+
+    def flush(self) -> None:
+        # blocks until every entry queued so far is written
+        self.__queue.join()
+
+    def close(self) -> None:
+        # writes what is queued, closes the file and uninstalls the sink if it is the current one
+        with self.__lock:
+            if self.__stop.is_set():
+                return
+            self.__stop.set()
+        if getLogSink() is self:
+            setLogSink(None)
+        self.__writer.join()
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+        atexit.unregister(self.close)
+
+def _configureLogging(
+    path: Optional[str] = None,
+    level: LogLevel = logging.INFO,
+    console: bool = False,
+    batch_size: int = 256,
+    flush_interval: float = 0.5
+) -> Optional[QueuedLogSink]:
+    # installs a QueuedLogSink as the sink of all logged browser actions and returns it; without
+    # a path and console echo there is nothing to write, so output is switched off altogether.
+    # A QueuedLogSink installed before (e.g. by an earlier call) is closed
+    sink = None
+    if path is not None or console:
+        sink = QueuedLogSink(path=path, level=level, console=console, batch_size=batch_size, flush_interval=flush_interval)
+    previous = setLogSink(sink)
+    if isinstance(previous, QueuedLogSink):
+        previous.close()
+    return sink
+
+# __________________________________________________________________________________________
+# EXPORT SELECT UTILITY FUNCTIONS
+configureLogging = _configureLogging
@@ -1,16 +1,23 @@
 # __________________________________________________________________________________________
 # DEPENDENCIES
 # from pymonad_types import *
-from strict_dataframe import curry
-from typing import TypeVar, Callable, Tuple, Dict, List
-from .browser_types import WebDriver, WebElement, SafeWebDriver, BrowserSessionLog, CumulativeMonoidSet, SafeWebElement \
-    , BrowserValue, BrowserSession, Nothing, Printable, WebElementSignature, Just, WebDriverWait, BrowserSessionLogsDataFrame \
+from strict_dataframe import curry, Reader, Schema, StrictDataFrame, NamedStrictDataFrame, StringTypeTupleList
+from typing import TypeVar, Callable, Tuple, Dict, List, Optional, Union, Any, Sequence, Protocol
+from .browser_types import WebDriver, WebElement, SafeWebDriver, BrowserSessionLog, CumulativeMonoidSet, SafeWebElement, BlankSafeWebElement \
+    , BrowserValue, BrowserSession, Nothing, Printable, WebElementSignature, Just, BrowserSessionLogsDataFrame \
     , DataFrame
+from .browser_wait import BackoffPolicy, WaitScheduler, pollUntil
+from .browser_cache import elementCacheOf
 
-from functools import reduce
 import time
+import os
+import pickle
+import numpy as np
+import pandas as pd
 
 import selenium
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.remote.webelement import WebElement as SeleniumWebElement
 # from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.support import expected_conditions as Expect
 from selenium.webdriver.common.by import By as by
@@ -24,14 +31,15 @@ from selenium.webdriver.common.by import By as by
 # class WebElement(selenium.webdriver.remote.webelement.WebElement): pass # <- satisfied by browser_types 
 # __________________________________________________________________________________________
 # NAMED TYPES
-Seconds = int
+Seconds = float # <- fractions of a second allowed
 R = TypeVar('R')
 DriverFunction = Callable[[WebDriver], R]
 ElementFunction = Callable[[WebElement], R]
 BrowserFunction = Callable[[SafeWebDriver, BrowserSessionLog, CumulativeMonoidSet, SafeWebElement], BrowserValue]
 MonadicBrowserFunction = Callable[[BrowserValue], BrowserSession]
-BlankSafeWebElement = SafeWebElement(Nothing)
 FunctionDictionary = Dict[str, Callable]
+LogEntry = Dict[str, Any] # <- one BrowserSessionLog entry: step, log, action, seconds, driver_calls, liveness_probes
+LogSink = Callable[[LogEntry], None]
 
 # class DriverFunction(Generic[T]):
 #     pass
@@ -39,30 +47,145 @@ FunctionDictionary = Dict[str, Callable]
 
 # __________________________________________________________________________________________
 # FUNCTIONS
-def _browserSessionLogEntry(step: str, log: str) -> BrowserSessionLog:
-    return BrowserSessionLog(
-        BrowserSessionLogsDataFrame(
-            DataFrame.from_dict({
-                'step': [step],
-                'log': [log]}
-            )
-        )
-    )
-
-def _compose(functions: List[MonadicBrowserFunction]) -> MonadicBrowserFunction:
-    def __compose(f1: MonadicBrowserFunction, f2: MonadicBrowserFunction) -> MonadicBrowserFunction:
-        return lambda browser_value: f1(browser_value) >> f2
-    return reduce(__compose, functions + [BrowserSession.unit])
-
-def _driverFunction_to_browserFunction(function: DriverFunction[SafeWebElement]) -> BrowserFunction:
+# steps restoring browser state when a pipeline resumes from a checkpoint (see BrowserPipeline.runWithCheckpoints)
+_REPLAY_NAVIGATION = "navigation"
+_REPLAY_FRAME = "frame"
+_CHECKPOINT_VERSION = 1
+
+def _replayOnResume(step: MonadicBrowserFunction, kind: str) -> MonadicBrowserFunction:
+    setattr(step, "replay_on_resume", kind)
+    return step
+
+def _readCheckpoint(path: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as checkpoint_file:
+        checkpoint = pickle.load(checkpoint_file)
+    if checkpoint.get('version') != _CHECKPOINT_VERSION:
+        raise ValueError("Unsupported checkpoint version in '" + path + "'")
+    return checkpoint
+
+def _writeCheckpoint(path: str, checkpoint: Dict[str, Any]) -> None:
+    # written next to the target and moved into place, so a crash never leaves a torn checkpoint
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as checkpoint_file:
+        pickle.dump(checkpoint, checkpoint_file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary_path, path)
+
+def _unwrapStep(step: Callable[..., Any]) -> Callable[..., Any]:
+    # a fully applied curried step (e.g. Do.sendKeys(keys)(to)) comes back wrapped in a Reader,
+    # the step attributes (step_name, replay_on_resume) are on the function it holds
+    while isinstance(step, Reader) and step.getValue() is not step:
+        step = step.getValue()
+    return step
+
+def _stepName(step: Callable[..., Any]) -> str:
+    # logged browser actions carry the name they log under, anything else falls back to its python
+    # name; never to repr, whose memory address would differ between runs (see runWithCheckpoints)
+    step = _unwrapStep(step)
+    return getattr(step, "step_name", getattr(step, "__qualname__", type(step).__qualname__))
+
+class BrowserPipeline:
+    # A composed sequence of monadic browser functions, itself a MonadicBrowserFunction.
+    # Steps are kept in a flat tuple (nested pipelines are spliced in) and run by a loop,
+    # so a pipeline of any length runs in constant stack depth. Each step is bound with '>>'
+    # exactly as a hand-written chain would be: bv >> f1 >> f2 >> ... 
+    def __init__(self, functions: Sequence[MonadicBrowserFunction]) -> None:
+        steps: List[MonadicBrowserFunction] = []
+        for function in functions:
+            if isinstance(function, BrowserPipeline):
+                steps.extend(function.getSteps())
+            else:
+                steps.append(function)
+        self.__steps: Tuple[MonadicBrowserFunction, ...] = tuple(steps)
+
+    def getSteps(self) -> Tuple[MonadicBrowserFunction, ...]:
+        return self.__steps
+
+    def getStepCount(self) -> int:
+        return len(self.__steps)
+
+    def getStepNames(self) -> List[str]:
+        return [_stepName(step) for step in self.__steps]
+
+    def __len__(self) -> int:
+        return len(self.__steps)
+
+    def __call__(self, browser_value: BrowserValue) -> BrowserSession:
+        session = BrowserSession.unit(browser_value)
+        for step in self.__steps:
+            session = session >> step
+        return session
+
+    def profile(self, browser_value: BrowserValue) -> Tuple[BrowserSession, DataFrame]:
+        # runs the pipeline like __call__, additionally returning the wall-clock seconds spent in each step
+        session = BrowserSession.unit(browser_value)
+        timings: List[float] = []
+        for step in self.__steps:
+            started = time.perf_counter()
+            session = session >> step
+            timings.append(time.perf_counter() - started)
+        return session, DataFrame({'step': self.getStepNames(), 'seconds': timings})
+
+    def _replaySteps(self, completed: int) -> List[MonadicBrowserFunction]:
+        # the last navigation among the completed steps and the frame switches made after it
+        steps = self.__steps[:completed]
+        kinds = [getattr(_unwrapStep(step), "replay_on_resume", None) for step in steps]
+        navigations = [index for index, kind in enumerate(kinds) if kind == _REPLAY_NAVIGATION]
+        first = navigations[-1] if len(navigations) > 0 else 0
+        return [step for step, kind in zip(steps[first:], kinds[first:]) if kind is not None]
+
+    def runWithCheckpoints(self, browser_value: BrowserValue, path: str, every: int = 10) -> BrowserSession:
+        # Runs the pipeline like __call__, saving the session's data, logs and the number of
+        # completed steps to 'path' every 'every' steps (as long as the session has no error).
+        # Run again after a failure (with the same pipeline and a fresh driver), it resumes from
+        # the checkpoint: the completed steps are not run again, their data and logs are restored,
+        # and only the last navigation (goToUrl) and the frame switches after it are replayed to
+        # bring the browser back to the page it was on. The checkpoint is removed once the whole
+        # pipeline ran without error. Data monoids must be picklable.
+        if every <= 0:
+            raise ValueError("Checkpoint interval 'every' must be a positive number of steps")
+        names = self.getStepNames()
+        driver, _, _, _ = browser_value
+        session = BrowserSession.unit(browser_value)
+        start = 0
+        checkpoint = _readCheckpoint(path)
+        if checkpoint is not None:
+            if checkpoint['steps'] != names:
+                raise ValueError("Checkpoint '" + path + "' was written by a different pipeline")
+            start = checkpoint['completed']
+            replayed = BrowserSession(driver)
+            for step in self._replaySteps(start):
+                replayed = replayed >> step
+            session = BrowserSession(driver, checkpoint['logs'], checkpoint['data'], replayed.getElement())
+        for index in range(start, len(self.__steps)):
+            session = session >> self.__steps[index]
+            completed = index + 1
+            if completed % every == 0 and completed < len(self.__steps) and not session.hasError():
+                _writeCheckpoint(path, {
+                    'version': _CHECKPOINT_VERSION,
+                    'steps': names,
+                    'completed': completed,
+                    'data': session.getData(),
+                    'logs': session.getLogs()
+                })
+        if not session.hasError() and os.path.exists(path):
+            os.remove(path)
+        return session
+
+def _compose(functions: Sequence[MonadicBrowserFunction]) -> BrowserPipeline:
+    return BrowserPipeline(functions)
+
+def _driverFunction_to_browserFunction(function: DriverFunction[SafeWebElement], local: bool = False) -> BrowserFunction:
+    # 'local': the function doesn't talk to the browser (see SafeWebDriver.applyLocal)
     def __impure__applyDriverFunction(
         driver: SafeWebDriver, 
         logs: BrowserSessionLog, 
         data: CumulativeMonoidSet, 
         element: SafeWebElement
     ) -> BrowserValue:
-        new_element = driver.apply(function)
-        next_element = SafeWebElement(Nothing) if(new_element == Nothing) else new_element.getValue()
+        new_element = driver.applyLocal(function) if local else driver.apply(function)
+        next_element = BlankSafeWebElement if(new_element == Nothing) else new_element.getValue()
         return (driver, logs, data, next_element) 
      
     return __impure__applyDriverFunction
@@ -75,15 +198,45 @@ def _elementFunction_to_browserFunction(function: ElementFunction[SafeWebElement
         element: SafeWebElement
     ) -> BrowserValue:
         new_element = element.apply(function)
-        next_element = SafeWebElement(Nothing) if(new_element == Nothing) else new_element.getValue()
+        next_element = BlankSafeWebElement if(new_element == Nothing) else new_element.getValue()
         return (driver, logs, data, next_element) 
      
     return __impure__applyDriverFunction
 
-def _asLoggedBrowserAction(name: str, function: BrowserFunction, ignore_error_flag: bool = False) -> MonadicBrowserFunction:
+def _printSink(entry: LogEntry) -> None:
+    print(entry['step'] + "..." + entry['log'])
+
+# every logged browser action hands its log entry to the current sink (see setLogSink)
+_log_sink: Optional[LogSink] = _printSink
+
+def _setLogSink(sink: Optional[LogSink]) -> Optional[LogSink]:
+    # replaces the sink receiving the entry of every logged browser action (None: no output,
+    # the entries are still kept in the session's BrowserSessionLog), returns the previous sink
+    global _log_sink
+    previous = _log_sink
+    _log_sink = sink
+    return previous
+
+def _getLogSink() -> Optional[LogSink]:
+    return _log_sink
+
+StepCounters = Tuple[float, int, int] # <- wall clock, WebDriver commands and liveness probes when a step started
+
+class LoggedBrowserFunction(Protocol):
+    # a MonadicBrowserFunction which can also be given the counters of an earlier start
+    def __call__(self, browser_value: BrowserValue, since: Optional[StepCounters] = None) -> BrowserSession: ...
 
-    def __impure__browserAction(browser_value: BrowserValue) -> BrowserSession:
+def _stepCounters(driver: SafeWebDriver) -> StepCounters:
+    return (time.perf_counter(), driver.getCommandCount(), driver.getProbeCount())
+
+def _asLoggedBrowserAction(name: str, function: BrowserFunction, ignore_error_flag: bool = False) -> LoggedBrowserFunction:
+    # the logged action measures itself, unless given the counters of an earlier start ('since',
+    # e.g. an async step logging once its wait is over, see AsyncDo)
+    action = name.split("(", 1)[0]
+
+    def __impure__browserAction(browser_value: BrowserValue, since: Optional[StepCounters] = None) -> BrowserSession:
         driver, logs, data, element = browser_value
+        started, commands_before, probes_before = since if since is not None else _stepCounters(driver)
         driver_was_usable = driver.isUsable()
         driver_was_effectively_usable = driver.isUsable(ignore_error=ignore_error_flag)
         driver, logs, data, element = function(driver, logs, data, element)
@@ -93,16 +246,27 @@ def _asLoggedBrowserAction(name: str, function: BrowserFunction, ignore_error_fl
         else: 
             new_log_message = "Browser became unusable"
 
-        print(name + "..." + new_log_message)
+        entry: LogEntry = {
+            'step': name,
+            'log': new_log_message,
+            'action': action,
+            'seconds': time.perf_counter() - started,
+            'driver_calls': driver.getCommandCount() - commands_before,
+            'liveness_probes': driver.getProbeCount() - probes_before
+        }
+        sink = _log_sink
+        if sink is not None:
+            sink(entry)
         
-        new_log = _browserSessionLogEntry(step=name, log=new_log_message)
+        new_log = BrowserSessionLog.fromEntry(**entry)
         return BrowserSession(driver = driver, logs = logs + new_log, data = data, element = element)
 
+    setattr(__impure__browserAction, "step_name", name) # <- read by BrowserPipeline for step names / profiling
     return __impure__browserAction
 
 def _closeBrowser(driver: SafeWebDriver, logs: BrowserSessionLog, data: CumulativeMonoidSet, element: SafeWebElement) -> BrowserValue:
-    driver.apply(function = lambda handle: Just(handle.quit()), ignore_error_flag = True)
-    return (driver, logs, data, SafeWebElement(Nothing))
+    driver.quit()
+    return (driver, logs, data, BlankSafeWebElement)
 
 def _disregardError(driver: SafeWebDriver, logs: BrowserSessionLog, data: CumulativeMonoidSet, element: SafeWebElement) -> BrowserValue:
     driver.setError(set_error_to = False)
@@ -117,16 +281,118 @@ def _doNothing(this: WebElementSignature) -> MonadicBrowserFunction:
 
 def _getSafeWebElement(find: WebElementSignature, using: WebDriver) -> SafeWebElement:
     # use 'find_elements' as safe way of searching for unique element
-    results = using.find_elements(by=find[0], value=find[1])
-    if(len(results) != 1):
-        # either no matching element found, or non unique results found
-        return SafeWebElement(Nothing)
-    else:
-        return SafeWebElement(Just(results[0]))
+    # (either no matching element or non unique results give BlankSafeWebElement), 
+    # answered from the session's element cache when the page hasn't changed since
+    return elementCacheOf(using).lookup(find, using)
+
+def _applyToSafeWebElement(find: WebElementSignature, using: WebDriver, function: ElementFunction[None]) -> SafeWebElement:
+    # applies 'function' to the element found by 'find', looking it up again if the cached
+    # element turned out to be stale
+    element = _getSafeWebElement(find=find, using=using)
+    try:
+        element.apply(function)
+    except StaleElementReferenceException:
+        elementCacheOf(using).invalidate(find)
+        element = _getSafeWebElement(find=find, using=using)
+        element.apply(function)
+    return element
+
+def _pageMayHaveChanged(function: DriverFunction[SafeWebElement]) -> DriverFunction[SafeWebElement]:
+    # drops the session's cached elements after a driver function that can change the page
+    def __impure__thenClearElementCache(driver: WebDriver) -> SafeWebElement:
+        try:
+            return function(driver)
+        finally:
+            elementCacheOf(driver).clear()
+    return __impure__thenClearElementCache
+
+def _browserFunction_thenClearElementCache(function: BrowserFunction) -> BrowserFunction:
+    # browser function counterpart of _pageMayHaveChanged
+    def __impure__thenClearElementCache(
+        driver: SafeWebDriver, 
+        logs: BrowserSessionLog, 
+        data: CumulativeMonoidSet, 
+        element: SafeWebElement
+    ) -> BrowserValue:
+        try:
+            return function(driver, logs, data, element)
+        finally:
+            # local bookkeeping: no liveness check, not a WebDriver command (see SafeWebDriver.applyLocal)
+            driver.applyLocal(lambda handle: elementCacheOf(handle).clear(), ignore_error_flag = True)
+    return __impure__thenClearElementCache
+
+def _elementFromCondition(result: Any, find: WebElementSignature, using: WebDriver) -> SafeWebElement:
+    # the element produced by a satisfied wait condition (e.g. element_to_be_clickable), 
+    # otherwise a fresh lookup made after the condition was met
+    if isinstance(result, list) and len(result) == 1:
+        result = result[0]
+    if isinstance(result, SeleniumWebElement):
+        element = SafeWebElement(Just(result))
+        elementCacheOf(using).store(find, element)
+        return element
+    return _getSafeWebElement(find=find, using=using)
+
+# reads the text of every cell of a table-like element in one go: arguments are the element,
+# the row selector, the cell selector (null: the row is its own single cell) and the number of
+# columns; rows without cells (e.g. header rows made of <th>) are skipped, missing cells are null
+_EXTRACT_CELLS_SCRIPT = """
+var container = arguments[0], rowSelector = arguments[1], cellSelector = arguments[2], width = arguments[3];
+var rows = container.querySelectorAll(rowSelector), values = [];
+for (var i = 0; i < rows.length; i++) {
+    var cells = cellSelector === null ? [rows[i]] : rows[i].querySelectorAll(cellSelector);
+    if (cells.length === 0) { continue; }
+    var row = [];
+    for (var j = 0; j < width; j++) {
+        row.push(j < cells.length ? (cells[j].innerText !== undefined ? cells[j].innerText : cells[j].textContent).trim() : null);
+    }
+    values.push(row);
+}
+return values;
+"""
+
+def _isNumericType(datatype: Any) -> bool:
+    if datatype in (int, float):
+        return True
+    try:
+        return isinstance(datatype, str) and np.issubdtype(np.dtype(datatype), np.number)
+    except TypeError:
+        return False
+
+def _nullableType(datatype: Any) -> Any:
+    # integer columns of extracted tables are stored as nullable integers (e.g. int -> 'Int64'),
+    # so blank or unparsable cells are missing values rather than a reason to fall back to float;
+    # str columns as pandas 'string', so missing cells stay missing rather than becoming 'None'
+    if datatype is int:
+        return "Int64"
+    if datatype is str:
+        return "string"
+    if isinstance(datatype, str) and _isNumericType(datatype) and np.dtype(datatype).kind in "iu":
+        name = np.dtype(datatype).name
+        return "UInt" + name[len("uint"):] if name.startswith("uint") else "Int" + name[len("int"):]
+    return datatype
+
+def _tableSchema(schema: Schema) -> Schema:
+    # the columns of an extracted table, see _nullableType
+    return Schema.compile([(name, _nullableType(datatype)) for name, datatype in schema.getColumns()])
+
+def _cellsToStrictDataFrame(cells: List[List[Optional[str]]], schema: Schema) -> StrictDataFrame:
+    # cell texts -> schema-checked frame: numeric columns are parsed leniently (thousands separators,
+    # unparsable cells become missing values), bool columns accept true/yes/1, everything else is 
+    # cast by StrictDataFrame; integer and str columns are nullable (see _nullableType).
+    # Raises a ValueError when a column still can't be cast (e.g. 1.5 in an int column)
+    names = list(schema.getOrder())
+    text = DataFrame(cells, columns=names, dtype=object) if len(cells) > 0 else DataFrame(columns=names, dtype=object)
+    for name, datatype in schema.getColumns():
+        if _isNumericType(datatype):
+            text[name] = pd.to_numeric(text[name].str.replace(",", "", regex=False), errors="coerce")
+        elif datatype is bool or datatype == "bool":
+            text[name] = text[name].str.lower().isin(["true", "yes", "1"])
+    return StrictDataFrame(columns=_tableSchema(schema), dataframe=text)
 
 def _buildDriverFunction_goToUrl(url: str) -> DriverFunction[SafeWebElement]:
     def __impure__goToUrl(driver: WebDriver) -> SafeWebElement:
         driver.get(url)
+        elementCacheOf(driver).leaveFrames()
         return BlankSafeWebElement
     return __impure__goToUrl
 
@@ -140,6 +406,8 @@ def _debug_unwrapSafeElementValue(safe_element: SafeWebElement) -> WebElement:
 # EXPORT SELECT UTILITY FUNCTIONS
 
 compose = _compose 
+setLogSink = _setLogSink
+getLogSink = _getLogSink
 
 build: Dict[str, FunctionDictionary] = {
     'driver_function': {
@@ -156,10 +424,10 @@ class Do:
     # PARAMETRIC FUNCTIONS
     @staticmethod
     def goToUrl(url: str) -> MonadicBrowserFunction:
-        return _asLoggedBrowserAction(
+        return _replayOnResume(_asLoggedBrowserAction(
             name = "goToUrl("+url+")", 
             function = _driverFunction_to_browserFunction(_buildDriverFunction_goToUrl(url))
-        )
+        ), _REPLAY_NAVIGATION)
 
     @staticmethod
     @curry
@@ -168,20 +436,18 @@ class Do:
         def __impure__sendKeysViaElement(elem: WebElement) -> None:
             elem.send_keys(keys)
         def __impure__sendKeysViaDriver(driver: WebDriver) -> SafeWebElement:
-            input_element = _getSafeWebElement(find=to, using=driver)
-            input_element.apply(__impure__sendKeysViaElement)
-            return input_element
+            return _applyToSafeWebElement(find=to, using=driver, function=__impure__sendKeysViaElement)
         return _asLoggedBrowserAction(
             name = "sendKeys(" + str(to) + ")", 
-            function = _driverFunction_to_browserFunction(__impure__sendKeysViaDriver)
+            function = _driverFunction_to_browserFunction(_pageMayHaveChanged(__impure__sendKeysViaDriver))
         )
 
     @staticmethod
-    def wait(seconds: int) -> MonadicBrowserFunction:
+    def wait(seconds: Seconds) -> MonadicBrowserFunction:
         def __impure__wait(driver: WebDriver) -> SafeWebElement:
             time.sleep(seconds)
             return BlankSafeWebElement
-        return _asLoggedBrowserAction(name="wait("+str(seconds)+")", function=_driverFunction_to_browserFunction(__impure__wait))  
+        return _asLoggedBrowserAction(name="wait("+str(seconds)+")", function=_driverFunction_to_browserFunction(__impure__wait, local=True))  
 
     @staticmethod
     def click(this: WebElementSignature) -> MonadicBrowserFunction:
@@ -189,12 +455,10 @@ class Do:
         def __clickViaElement(elem: WebElement) -> None:
             elem.click()
         def __impure__clickViaDriver(driver: WebDriver) -> SafeWebElement:
-            clickable_element = _getSafeWebElement(find=this, using=driver)
-            clickable_element.apply(__clickViaElement)
-            return clickable_element
+            return _applyToSafeWebElement(find=this, using=driver, function=__clickViaElement)
         return _asLoggedBrowserAction(
             name = "click(" + str(this) + ")", 
-            function = _driverFunction_to_browserFunction(__impure__clickViaDriver)
+            function = _driverFunction_to_browserFunction(_pageMayHaveChanged(__impure__clickViaDriver))
         )
 
     @staticmethod
@@ -202,13 +466,12 @@ class Do:
         def __impure__switchToFrame(driver: WebDriver) -> SafeWebElement:
             def __impure__applySwitchToFrame(frame_element: WebElement) -> None:
                 driver.switch_to.frame(frame_element)
-            frame_element = _getSafeWebElement(find=this, using=driver)
-            frame_element.apply(__impure__applySwitchToFrame)
-            return frame_element
-        return _asLoggedBrowserAction(
+                elementCacheOf(driver).enterFrame(this)
+            return _applyToSafeWebElement(find=this, using=driver, function=__impure__applySwitchToFrame)
+        return _replayOnResume(_asLoggedBrowserAction(
             name = "switchToFrame(" + str(this) + ")", 
             function = _driverFunction_to_browserFunction(__impure__switchToFrame)
-        )
+        ), _REPLAY_FRAME)
     
     @staticmethod
     def find(this: WebElementSignature, within_element: bool = True) -> MonadicBrowserFunction:
@@ -224,12 +487,81 @@ class Do:
         )
 
     @staticmethod
-    def waitUntil(this: WebElementSignature, becomes: Expect, within: Seconds = 3, then: Callable[[WebElementSignature], MonadicBrowserFunction] = _doNothing) -> MonadicBrowserFunction:
-        # TODO: should DEFINITELY return the element that was waiting for
+    def extractTable(
+        this: WebElementSignature, 
+        columns: Union[StringTypeTupleList, Schema], 
+        name: str, 
+        rows: str = "tr", 
+        cells: Optional[str] = ":scope > td"
+    ) -> MonadicBrowserFunction:
+        # reads the cells of the (unique) element 'this' in a single script execution, cell i of a 
+        # row going to column i, and adds them to the session data as NamedStrictDataFrame 'name'
+        # (read back with session.readData(name)). Lists work too: rows="li", cells=None.
+        # The element becomes the session's element; a missing element adds no data.
+        # Integer and str columns come out nullable (int -> 'Int64', str -> 'string', missing or
+        # blank cells are missing values); cells that can't be cast to their column (e.g. 1.5 for
+        # an int) fail the step, and so does extracting into a name already holding a table with
+        # other columns
+        schema = Schema.compile(columns)
+        table_schema = _tableSchema(schema)
+        def __impure__readTable(driver: WebDriver, existing: Any) -> Tuple[SafeWebElement, Optional[StrictDataFrame]]:
+            # raising here fails the step (driver in error)
+            if existing is not None and getattr(existing, "getSchema", lambda: None)() is not table_schema:
+                raise ValueError("Data '" + name + "' already holds a table with other columns than " + repr(table_schema))
+            container = _getSafeWebElement(find=this, using=driver)
+            extracted = container.apply(lambda element: driver.execute_script(_EXTRACT_CELLS_SCRIPT, element, rows, cells, len(schema)))
+            if extracted.getValue() is None:
+                return container, None
+            return container, _cellsToStrictDataFrame(extracted.getValue(), schema)
+        def __impure__extractTable(
+            driver: SafeWebDriver, 
+            logs: BrowserSessionLog, 
+            data: CumulativeMonoidSet, 
+            element: SafeWebElement
+        ) -> BrowserValue:
+            existing = data.getValue().get(name)
+            read = driver.apply(lambda handle: __impure__readTable(handle, existing))
+            if read == Nothing:
+                return (driver, logs, data, BlankSafeWebElement)
+            container, table = read.getValue()
+            if table is None:
+                return (driver, logs, data, container)
+            return (driver, logs, data + CumulativeMonoidSet([NamedStrictDataFrame(name, table)]), container)
+        return _asLoggedBrowserAction(
+            name = "extractTable(" + str(this) + ", " + name + ")", 
+            function = __impure__extractTable
+        )
+
+    @staticmethod
+    def prefetch(these: List[WebElementSignature]) -> MonadicBrowserFunction:
+        # resolves all signatures into the element cache with a single script round-trip,
+        # so the steps that follow (find, click, ...) don't look them up one by one
+        def __impure__prefetch(driver: WebDriver) -> SafeWebElement:
+            elementCacheOf(driver).resolve(these, using=driver)
+            return BlankSafeWebElement
+        return _asLoggedBrowserAction(
+            name = "prefetch(" + str(these) + ")", 
+            function = _driverFunction_to_browserFunction(__impure__prefetch)
+        )
+
+    @staticmethod
+    def waitUntil(
+        this: WebElementSignature, 
+        becomes: Expect, 
+        within: Seconds = 3, 
+        then: Callable[[WebElementSignature], MonadicBrowserFunction] = _doNothing,
+        backoff: BackoffPolicy = BackoffPolicy(),
+        scheduler: Optional[WaitScheduler] = None
+    ) -> MonadicBrowserFunction:
+        # polls with adaptive backoff, in this thread or (given a scheduler) on the scheduler's
+        # shared checker threads; the element is the one produced by the satisfied condition
         def __impure__waitUntil(driver: WebDriver) -> SafeWebElement:
-            web_element = _getSafeWebElement(find=this, using=driver)
-            WebDriverWait(driver, within).until(becomes(this))
-            return web_element
+            condition = becomes(this)
+            if scheduler is None:
+                result = pollUntil(condition, driver, within, backoff)
+            else:
+                result = scheduler.waitUntil(condition, driver, within, backoff)
+            return _elementFromCondition(result, find=this, using=driver)
         return _compose([
             _asLoggedBrowserAction(
                 name = "waitUntil(" + str(this) + ", " + str(becomes) + ", " + str(then) + ")", 
@@ -254,19 +586,19 @@ class Do:
     def customDriverFunction(function: DriverFunction[SafeWebElement]) -> MonadicBrowserFunction:
        return _asLoggedBrowserAction(
             name = "customDriverFunction(" + str(function.__code__.co_name) + ")", 
-            function = _driverFunction_to_browserFunction(function)
+            function = _driverFunction_to_browserFunction(_pageMayHaveChanged(function))
         )
 
     @staticmethod
     def customElementFunction(function: ElementFunction[SafeWebElement]) -> MonadicBrowserFunction:
        return _asLoggedBrowserAction(
             name = "customElementFunction(" + str(function.__code__.co_name) + ")", 
-            function = _elementFunction_to_browserFunction(function)
+            function = _browserFunction_thenClearElementCache(_elementFunction_to_browserFunction(function))
         )
 
     @staticmethod
     def customBrowserFunction(function: BrowserFunction) -> MonadicBrowserFunction:
         return _asLoggedBrowserAction(
             name = "customBrowserFunction(" + str(function.__code__.co_name) + ")", 
-            function = function
+            function = _browserFunction_thenClearElementCache(function)
         )
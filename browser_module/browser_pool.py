@@ -0,0 +1,412 @@
+# __________________________________________________________________________________________
+# DEPENDENCIES
+from typing import Callable, Iterable, List, Optional, Tuple, Dict, Any
+from queue import Queue, Empty
+from threading import Lock, Event
+from collections import deque
+from time import perf_counter
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Executor
+from multiprocessing import util as multiprocessing_util
+
+from strict_dataframe import mconcat
+import numpy as np
+from .browser_types import SafeWebDriver, ChromeWebDriver, BrowserSession, BrowserSessionLog, CumulativeMonoidSet, WebDriver
+from .browser_module import MonadicBrowserFunction
+from .browser_cache import elementCacheOf
+from .browser_wait import BackoffPolicy
+
+# __________________________________________________________________________________________
+# NAMED TYPES
+DriverFactory = Callable[[], SafeWebDriver]
+PipelineBuilder = Callable[[Any], MonadicBrowserFunction]
+SessionResult = Tuple[CumulativeMonoidSet, BrowserSessionLog]
+
+# __________________________________________________________________________________________
+# FUNCTIONS
+def _runPipeline(build: PipelineBuilder, item: Any, driver: SafeWebDriver) -> SessionResult:
+    session = build(item)(BrowserSession(driver).getValue())
+    return session.getData(), session.getLogs()
+
+def _mergeResults(results: List[SessionResult]) -> SessionResult:
+    if len(results) == 0:
+        return CumulativeMonoidSet([]), BrowserSessionLog()
+    return mconcat([data for data, _ in results]), mconcat([logs for _, logs in results])
+
+def _resetDriver(handle: WebDriver) -> bool:
+    # leaves a browser as if freshly launched: no cookies / web storage, top frame, blank page.
+    # Chrome clears the cookies and storage of every site through the DevTools protocol; without
+    # it (other browsers) only those of the current page's origin can be cleared
+    execute_cdp_cmd = getattr(handle, "execute_cdp_cmd", None)
+    if callable(execute_cdp_cmd):
+        execute_cdp_cmd("Network.clearBrowserCookies", {})
+        execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": "*", "storageTypes": "all"})
+    else:
+        # (storage is cleared before leaving the page, it belongs to the page's origin)
+        handle.delete_all_cookies()
+        handle.execute_script("try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}")
+    handle.switch_to.default_content()
+    handle.get("about:blank")
+    elementCacheOf(handle).leaveFrames()
+    return True
+
+def _prepareForNextInput(driver: SafeWebDriver) -> bool:
+    # resets a driver between two inputs (see _resetDriver), False when it died or could not be reset
+    return (
+        driver.isUsable(ignore_error=True)
+        and driver.apply(_resetDriver, ignore_error_flag=True).getValue() is True
+    )
+
+# process pools: every worker process owns a single driver, launched on its first task and
+# relaunched whenever a task left it dead or quit (e.g. a pipeline ending with Do.closeBrowser)
+_worker_factory: Optional[DriverFactory] = None
+_worker_driver: Optional[SafeWebDriver] = None
+
+def _quitWorkerDriver() -> None:
+    if _worker_driver is not None:
+        _worker_driver.quit()
+
+def _startWorker(factory: DriverFactory) -> None:
+    global _worker_factory
+    _worker_factory = factory
+    # quit the browser when the worker process shuts down (atexit does not run in pool workers)
+    multiprocessing_util.Finalize(None, _quitWorkerDriver, exitpriority=10)
+
+def _runPipelineInWorker(build: PipelineBuilder, item: Any) -> SessionResult:
+    global _worker_driver
+    if _worker_driver is None:
+        if _worker_factory is None:
+            raise RuntimeError("Worker process was not started by a BrowserSessionPool")
+        _worker_driver = _worker_factory()
+    driver = _worker_driver
+    try:
+        return _runPipeline(build, item, driver)
+    finally:
+        if _prepareForNextInput(driver):
+            driver.setError(False)
+        else:
+            driver.quit()
+            _worker_driver = None
+
+# __________________________________________________________________________________________
+# CLASSES
+class _LaunchFailure:
+    # put on the idle queue to wake acquire() once launching drivers keeps failing
+    __slots__ = ('error',)
+
+    def __init__(self, error: BaseException) -> None:
+        self.error: BaseException = error
+
+class _PooledDriver:
+    __slots__ = ('driver', 'uses', 'errors')
+
+    def __init__(self, driver: SafeWebDriver) -> None:
+        self.driver: SafeWebDriver = driver
+        self.uses: int = 0
+        self.errors: int = 0
+
+class WebDriverPool:
+    # Keeps 'size' warm drivers so scripts don't pay a browser cold start, e.g.
+    #
+    #   drivers = WebDriverPool(lambda: ChromeWebDriver(), size=2)
+    #   driver = drivers.acquire()
+    #   session = compose([...])(BrowserSession(driver).getValue())
+    #   drivers.release(driver)
+    #
+    # - drivers are launched in the background by 'driver_factory', all 'size' of them at
+    #   construction time when prelaunch is set, otherwise on first acquire
+    # - release() resets the browser (cookies, web storage, frames, about:blank) and the error
+    #   flag, and hands the driver to the next acquire(). Cookies and storage of every site
+    #   visited are cleared on Chrome (DevTools protocol); on other browsers only those of the
+    #   page the driver was left on are, so don't share such drivers across users or accounts
+    # - a driver is quit and replaced (in the background) once it served 'max_uses' sessions,
+    #   ended 'max_errors' sessions in error, died, or could not be reset
+    # - a failed launch is retried after a delay growing as per 'launch_backoff'; after
+    #   'max_launch_failures' failures in a row the pool stops launching and acquire() raises
+    #   a RuntimeError carrying the launch error
+    # getMetrics() reports how long acquire() had to wait for a driver.
+    def __init__(
+        self, 
+        driver_factory: DriverFactory = ChromeWebDriver, 
+        size: int = 2, 
+        max_uses: int = 50, 
+        max_errors: int = 3, 
+        prelaunch: bool = True,
+        metrics_window: int = 10000,
+        launch_backoff: BackoffPolicy = BackoffPolicy(initial=0.5, factor=2.0, maximum=30.0),
+        max_launch_failures: int = 5
+    ) -> None:
+        self.__factory: DriverFactory = driver_factory
+        self.__size: int = max(size, 1)
+        self.__max_uses: int = max_uses
+        self.__max_errors: int = max_errors
+        self.__launch_backoff: BackoffPolicy = launch_backoff
+        self.__max_launch_failures: int = max(max_launch_failures, 1)
+        self.__launch_failures_in_a_row: int = 0
+        self.__closing: Event = Event()
+        self.__idle: Queue = Queue()
+        self.__in_use: Dict[int, _PooledDriver] = {}
+        self.__lock: Lock = Lock()
+        self.__launcher: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=self.__size, thread_name_prefix="WebDriverPool")
+        self.__launched: int = 0
+        self.__recycled: int = 0
+        self.__launch_errors: int = 0
+        self.__acquire_seconds: deque = deque(maxlen=metrics_window)
+        self.__started: bool = False
+        self.__closed: bool = False
+        if prelaunch:
+            self.__impure__start()
+
+    def __impure__start(self) -> None:
+        with self.__lock:
+            if self.__started:
+                return
+            self.__started = True
+        for _ in range(self.__size):
+            self.__launcher.submit(self.__impure__launch)
+
+    def __isFailing(self) -> bool:
+        return self.__launch_failures_in_a_row >= self.__max_launch_failures
+
+    def __impure__launch(self) -> None:
+        delays = self.__launch_backoff.intervals()
+        while not self.__closed:
+            try:
+                driver = self.__factory()
+            except Exception as error:
+                with self.__lock:
+                    self.__launch_errors += 1
+                    self.__launch_failures_in_a_row += 1
+                    failing = self.__isFailing()
+                if failing:
+                    self.__idle.put(_LaunchFailure(error))
+                    return
+                self.__closing.wait(next(delays)) # <- returns early when the pool is closed
+                continue
+            with self.__lock:
+                self.__launched += 1
+                self.__launch_failures_in_a_row = 0
+                closed = self.__closed
+            if closed:
+                driver.quit()
+            else:
+                self.__idle.put(_PooledDriver(driver))
+            return
+
+    def acquire(self, timeout: Optional[float] = None) -> SafeWebDriver:
+        # blocks until a warm driver is available (raises queue.Empty after 'timeout' seconds,
+        # RuntimeError once launching drivers failed 'max_launch_failures' times in a row)
+        if self.__closed:
+            raise RuntimeError("WebDriverPool is closed")
+        self.__impure__start()
+        started = perf_counter()
+        while True:
+            remaining = None if timeout is None else max(timeout - (perf_counter() - started), 0)
+            pooled = self.__idle.get(timeout=remaining)
+            if not isinstance(pooled, _LaunchFailure):
+                break
+            if self.__isFailing():
+                # left on the queue for every other waiting acquire()
+                self.__idle.put(pooled)
+                raise RuntimeError("WebDriverPool could not launch a driver") from pooled.error
+            # a later launch succeeded: the failure is stale
+        waited = perf_counter() - started
+        with self.__lock:
+            self.__acquire_seconds.append(waited)
+            self.__in_use[id(pooled.driver)] = pooled
+        return pooled.driver
+
+    def release(self, driver: SafeWebDriver) -> None:
+        with self.__lock:
+            pooled = self.__in_use.pop(id(driver))
+        pooled.uses += 1
+        if driver.hasError():
+            pooled.errors += 1
+        reusable = (
+            not self.__closed
+            and pooled.uses < self.__max_uses 
+            and pooled.errors < self.__max_errors 
+            and _prepareForNextInput(driver)
+        )
+        if reusable:
+            driver.setError(False)
+            self.__idle.put(pooled)
+            return
+        driver.quit()
+        with self.__lock:
+            self.__recycled += 1
+        if not self.__closed:
+            self.__launcher.submit(self.__impure__launch)
+
+    def getSize(self) -> int:
+        return self.__size
+
+    def getMetrics(self) -> Dict[str, float]:
+        with self.__lock:
+            waits = np.array(self.__acquire_seconds, dtype=float)
+            metrics = {
+                'acquires': float(len(waits)),
+                'launched': float(self.__launched),
+                'recycled': float(self.__recycled),
+                'launch_errors': float(self.__launch_errors),
+                'launch_failures_in_a_row': float(self.__launch_failures_in_a_row),
+                'idle': float(self.__idle.qsize()),
+                'in_use': float(len(self.__in_use))
+            }
+        if len(waits) > 0:
+            metrics['acquire_mean_seconds'] = float(waits.mean())
+            metrics['acquire_p95_seconds'] = float(np.percentile(waits, 95))
+            metrics['acquire_max_seconds'] = float(waits.max())
+        return metrics
+
+    def close(self) -> None:
+        # quits idle drivers now, drivers still in use are quit when released
+        self.__closed = True
+        self.__closing.set()
+        self.__launcher.shutdown(wait=True)
+        while True:
+            try:
+                pooled = self.__idle.get_nowait()
+            except Empty:
+                break
+            if isinstance(pooled, _PooledDriver):
+                pooled.driver.quit()
+
+    def __enter__(self) -> 'WebDriverPool':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+class BrowserSessionPool:
+    # Runs one pipeline over many inputs on up to 'size' drivers concurrently, e.g.
+    #
+    #   with BrowserSessionPool(lambda: ChromeWebDriver(), size=4) as pool:
+    #       data, logs = pool.run(lambda url: compose([Do.goToUrl(url), ...]), urls)
+    #
+    # - threads (default): drivers are created on demand by 'driver_factory' (concurrently, 
+    #   each in the thread that needs it) and kept warm in an idle queue between tasks. A driver
+    #   whose pipeline errored is reused once its error flag is cleared, a driver that died (or
+    #   was closed by the pipeline) is quit and its slot freed, to be relaunched by the next 
+    #   task that needs a driver.
+    # - processes (use_processes=True): each worker process creates one driver on its first
+    #   task, keeps it for the tasks that follow and relaunches it when it died or was closed.
+    #   'driver_factory' and 'build' must be picklable (module-level functions), and so must 
+    #   the data collected by the pipeline.
+    # Between two inputs a reused driver is reset like a WebDriverPool's (cookies, web storage,
+    # frames, element cache, about:blank), a driver that can't be reset is replaced.
+    # - threads with a WebDriverPool (driver_pool=...): drivers are acquired from / released
+    #   to the given pool instead of being owned by this one
+    # Each input runs in a fresh BrowserSession (empty logs and data); the data and logs of
+    # all inputs are merged with mconcat in input order.
+    def __init__(
+        self, 
+        driver_factory: DriverFactory = ChromeWebDriver, 
+        size: int = 4, 
+        use_processes: bool = False, 
+        driver_pool: Optional[WebDriverPool] = None
+    ) -> None:
+        self.__factory: DriverFactory = driver_factory
+        self.__driver_pool: Optional[WebDriverPool] = driver_pool
+        self.__size: int = max(size, 1)
+        self.__use_processes: bool = use_processes
+        self.__idle: Queue = Queue() # <- idle drivers, or None for a slot freed by a dead driver
+        self.__drivers: List[SafeWebDriver] = []
+        self.__reserved: int = 0 # <- driver slots taken: drivers created or being launched
+        self.__lock: Lock = Lock()
+        self.__executor: Optional[Executor] = None
+
+    def getSize(self) -> int:
+        return self.__size
+
+    def getDriverCount(self) -> int:
+        # number of drivers created so far in this process (always 0 for process pools)
+        return len(self.__drivers)
+
+    def __getExecutor(self) -> Executor:
+        if self.__executor is None:
+            if self.__use_processes:
+                self.__executor = ProcessPoolExecutor(
+                    max_workers = self.__size,
+                    initializer = _startWorker,
+                    initargs = (self.__factory,)
+                )
+            else:
+                self.__executor = ThreadPoolExecutor(max_workers=self.__size, thread_name_prefix="BrowserSessionPool")
+        return self.__executor
+
+    def __impure__acquire(self) -> SafeWebDriver:
+        if self.__driver_pool is not None:
+            return self.__driver_pool.acquire()
+        while True:
+            # a free slot is reserved under the lock, the (slow) launch happens outside of it
+            with self.__lock:
+                reserved = self.__idle.empty() and self.__reserved < self.__size
+                if reserved:
+                    self.__reserved += 1
+            if reserved:
+                return self.__impure__launch()
+            driver = self.__idle.get()
+            if driver is not None:
+                return driver
+            # a slot was freed by a dead driver: try to reserve it
+
+    def __impure__launch(self) -> SafeWebDriver:
+        try:
+            driver = self.__factory()
+        except BaseException:
+            with self.__lock:
+                self.__reserved -= 1
+            self.__idle.put(None) # <- a task waiting for a driver may retry the slot
+            raise
+        with self.__lock:
+            self.__drivers.append(driver)
+        return driver
+
+    def __impure__release(self, driver: SafeWebDriver) -> None:
+        if self.__driver_pool is not None:
+            self.__driver_pool.release(driver)
+            return
+        if _prepareForNextInput(driver):
+            driver.setError(False)
+            self.__idle.put(driver)
+            return
+        driver.quit()
+        with self.__lock:
+            self.__drivers.remove(driver)
+            self.__reserved -= 1
+        self.__idle.put(None)
+
+    def __impure__runOnPooledDriver(self, build: PipelineBuilder, item: Any) -> SessionResult:
+        driver = self.__impure__acquire()
+        try:
+            return _runPipeline(build, item, driver)
+        finally:
+            self.__impure__release(driver)
+
+    def map(self, build: PipelineBuilder, inputs: Iterable[Any]) -> List[SessionResult]:
+        # (data, logs) of every input, in input order
+        if self.__use_processes:
+            items = list(inputs)
+            return list(self.__getExecutor().map(_runPipelineInWorker, [build] * len(items), items))
+        return list(self.__getExecutor().map(lambda item: self.__impure__runOnPooledDriver(build, item), inputs))
+
+    def run(self, build: PipelineBuilder, inputs: Iterable[Any]) -> SessionResult:
+        # data and logs of all inputs merged into one CumulativeMonoidSet / BrowserSessionLog
+        return _mergeResults(self.map(build, inputs))
+
+    def close(self) -> None:
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True)
+            self.__executor = None
+        with self.__lock:
+            for driver in self.__drivers:
+                driver.quit()
+            self.__drivers = []
+            self.__reserved = 0
+        self.__idle = Queue()
+
+    def __enter__(self) -> 'BrowserSessionPool':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -1,6 +1,7 @@
 # __________________________________________________________________________________________
 # DEPENDENCIES
 from sys import platform
+from time import monotonic
 
 # Enable Static Typing
 # import typing as t
@@ -17,6 +18,7 @@ from sys import platform
 
 # Module Dependencies
 import pandas as pd # <- import for namespace referencing during development
+import numpy as np
 
 from enum import Enum
 
@@ -29,8 +31,8 @@ from selenium.webdriver.common.by import By as by
 
 # Internal Imports
 import strict_dataframe as sd # <- import for namespace referencing during development
-from typing import TypeVar, Type, Dict, Set, Union, List, Generic, Any, Tuple, Callable
-from strict_dataframe import CumulativeMonoidSet, HasStrictDataframe, StrictDataFrame, Monoid, Printable, Just, Nothing, DataFrame, Maybe, T, Monad
+from typing import TypeVar, Type, Dict, Set, Union, List, Generic, Any, Tuple, Callable, Optional
+from strict_dataframe import CumulativeMonoidSet, HasStrictDataframe, StrictDataFrame, Schema, Monoid, Printable, Just, Nothing, DataFrame, Maybe, T, Monad
 
 # from dataframe_types import *
 # __________________________________________________________________________________________
@@ -56,26 +58,167 @@ WebElementSignature = Tuple[By, str]
 
 
 class BrowserSessionLogsDataFrame(HasStrictDataframe):
-    def __init__(self, dataframe: DataFrame = DataFrame()) -> None:
+    schema: Schema = Schema.compile([
+        ("step", "category"),
+        ("log", "category"),
+        ("action", "category"),         # <- step name without its arguments, e.g. "goToUrl"
+        ("seconds", "float64"),         # <- wall time of the step
+        ("driver_calls", "Int64"),      # <- WebDriver commands sent during the step
+        ("liveness_probes", "Int64")    # <- liveness checks that needed a WebDriver round-trip
+                                        #    (nullable: missing for entries logged without counters)
+    ])
+
+    def __init__(self, dataframe: Union[DataFrame, StrictDataFrame] = DataFrame()) -> None:
         super(BrowserSessionLogsDataFrame, self).__init__(
             classname = "BrowserSessionLogsDataFrame", 
-            value = StrictDataFrame( dataframe = dataframe, columns = [("step", str),("log", str)] ))
+            value = StrictDataFrame( dataframe = dataframe, columns = BrowserSessionLogsDataFrame.schema ))
 
     def append(self, other: 'BrowserSessionLogsDataFrame') -> 'BrowserSessionLogsDataFrame':
         return BrowserSessionLogsDataFrame(self._appendInternal(other))
 
+    @staticmethod
+    def concat(values: List['BrowserSessionLogsDataFrame']) -> 'BrowserSessionLogsDataFrame':
+        return BrowserSessionLogsDataFrame(HasStrictDataframe._concatInternal(values))
+
+class _SessionLogStore:
+    # Column arrays shared by BrowserSessionLog values that were appended from one another.
+    # Entries are addressed by sequence number: entry i is stored at row i, or at row i % maxlen 
+    # when the store is a ring buffer keeping only the latest 'maxlen' entries.
+    __slots__ = ('columns', 'count', 'maxlen')
+
+    def __init__(self, names: Tuple[str, ...], capacity: int, maxlen: Optional[int]) -> None:
+        capacity = maxlen if maxlen is not None else max(capacity, 16)
+        self.columns: Dict[str, np.ndarray] = {name: np.empty(capacity, dtype=object) for name in names}
+        self.count: int = 0
+        self.maxlen: Optional[int] = maxlen
+
+    def firstStored(self) -> int:
+        # sequence number of the oldest entry still held by the store
+        return 0 if self.maxlen is None else max(0, self.count - self.maxlen)
+
+    def write(self, columns: Dict[str, np.ndarray], length: int) -> None:
+        if self.maxlen is None:
+            self.__impure__reserve(self.count + length)
+            for name, column in self.columns.items():
+                column[self.count:self.count + length] = columns[name]
+        else:
+            # only the latest 'maxlen' of the written entries survive
+            kept = min(length, self.maxlen)
+            rows = np.arange(self.count + length - kept, self.count + length) % self.maxlen
+            for name, column in self.columns.items():
+                column[rows] = columns[name][length - kept:]
+        self.count += length
+
+    def read(self, start: int, stop: int) -> Dict[str, np.ndarray]:
+        if self.maxlen is None:
+            return {name: column[start:stop] for name, column in self.columns.items()}
+        rows = np.arange(start, stop) % self.maxlen
+        return {name: column[rows] for name, column in self.columns.items()}
+
+    def __impure__reserve(self, length: int) -> None:
+        capacity = len(next(iter(self.columns.values())))
+        if length <= capacity:
+            return
+        capacity = max(length, 2 * capacity)
+        for name, column in self.columns.items():
+            grown = np.empty(capacity, dtype=object)
+            grown[:self.count] = column[:self.count]
+            self.columns[name] = grown
+
 class BrowserSessionLog(Monoid, Printable):
-    def __init__(self, value: BrowserSessionLogsDataFrame = BrowserSessionLogsDataFrame()) -> None:
-        self.__value: BrowserSessionLogsDataFrame = value
+    # A session log kept as column arrays (see _SessionLogStore) rather than a DataFrame:
+    # appending a log writes its entries into the store, and the (categorical) DataFrame
+    # is only built when getValue() is called.
+    # A log is an immutable value: it sees the first 'count' entries of its store. Appending to
+    # the newest log of a store extends the store in place (amortised O(1) per entry), appending
+    # to an older log copies its entries into a new store first.
+    # With maxlen set the log is a ring buffer keeping only the latest 'maxlen' entries; an older
+    # log sharing a ring buffer loses the entries overwritten by the logs appended after it.
+    __slots__ = ('__store', '__count', '__frame')
+
+    def __init__(self, value: Optional[BrowserSessionLogsDataFrame] = None, maxlen: Optional[int] = None) -> None:
+        names = BrowserSessionLogsDataFrame.schema.getOrder()
+        self.__store: _SessionLogStore = _SessionLogStore(names, 0 if value is None else len(value.getValue()), maxlen)
+        if value is not None:
+            frame = value.getValue()
+            self.__store.write({name: frame[name].to_numpy(dtype=object) for name in names}, len(frame))
+        self.__count: int = self.__store.count
+        self.__frame: Optional[DataFrame] = None
+
+    @classmethod
+    def _view(cls, store: _SessionLogStore, count: int) -> 'BrowserSessionLog':
+        log = cls.__new__(cls)
+        log.__store = store
+        log.__count = count
+        log.__frame = None
+        return log
+
+    @staticmethod
+    def fromEntry(**entry: Any) -> 'BrowserSessionLog':
+        # a single-entry log, e.g. BrowserSessionLog.fromEntry(step="click", log="Complete"),
+        # columns left out are missing values
+        store = _SessionLogStore(BrowserSessionLogsDataFrame.schema.getOrder(), 1, None)
+        store.write({name: np.array([entry.get(name)], dtype=object) for name in store.columns}, 1)
+        return BrowserSessionLog._view(store, 1)
+
+    def getMaxlen(self) -> Optional[int]:
+        return self.__store.maxlen
+
+    def __len__(self) -> int:
+        return self.__count - self.__start()
+
+    def __start(self) -> int:
+        # sequence number of the first entry of this log that is still stored
+        return min(self.__store.firstStored(), self.__count)
+
+    def _columns(self) -> Dict[str, np.ndarray]:
+        return self.__store.read(self.__start(), self.__count)
 
     def getValue(self) -> DataFrame:
-        return self.__value.getValue()
+        if self.__frame is None:
+            self.__frame = BrowserSessionLogsDataFrame(DataFrame(self._columns())).getValue()
+        return self.__frame
 
     def append(self, other: 'BrowserSessionLog') -> 'BrowserSessionLog':
-        return BrowserSessionLog(BrowserSessionLogsDataFrame(self.getValue().append(other.getValue(), sort=True)))
+        length = len(other)
+        if length == 0:
+            return self
+        if self.__count == 0 and self.__store.maxlen is None:
+            return other
+        store = self.__store
+        if store.count != self.__count:
+            # self is not the newest log of its store: branch off a copy
+            store = _SessionLogStore(tuple(store.columns), 2 * (len(self) + length), store.maxlen)
+            store.write(self._columns(), len(self))
+        store.write(other._columns(), length)
+        return BrowserSessionLog._view(store, store.count)
     
     def __asString__(self) -> str:
-        return "BrowserSessionLog:\n\n" + str(self.__value)
+        return "BrowserSessionLog:\n\n" + str(self.getValue())
+
+    def summarize(self, by: str = "action") -> DataFrame:
+        # per step (by="action") or per full step name (by="step"): number of runs, 
+        # p50 / p95 / max / total wall time, mean WebDriver commands and total liveness probes
+        frame = self.getValue()
+        grouped = frame.groupby(by, observed=True, sort=True)
+        summary = DataFrame({
+            'count': grouped['seconds'].count(),
+            'p50_seconds': grouped['seconds'].quantile(0.5),
+            'p95_seconds': grouped['seconds'].quantile(0.95),
+            'max_seconds': grouped['seconds'].max(),
+            'total_seconds': grouped['seconds'].sum(),
+            'mean_driver_calls': grouped['driver_calls'].mean(),
+            'liveness_probes': grouped['liveness_probes'].sum()
+        })
+        return summary.sort_values('total_seconds', ascending=False)
+
+    @classmethod
+    def mconcat_many(cls, values: List['BrowserSessionLog']) -> 'BrowserSessionLog':
+        # appending in sequence extends a single store, linear in the total number of entries
+        result = values[0]
+        for value in values[1:]:
+            result = result.append(value)
+        return result
 
     @staticmethod
     def mzero():
@@ -85,12 +228,64 @@ class BrowserSessionLog(Monoid, Printable):
         return self.append(other)
 
 class SafeWebDriver:
-    def __init__(self, handle: WebDriver) -> None:
+    # Liveness is tracked from the driver's own outcomes rather than probed on every check:
+    # - a successful apply() that sent WebDriver commands proves the browser was alive at that
+    #   moment (for handles whose commands can't be counted, see __impure__countCommands, any
+    #   successful apply() does); local work (sleeping, cache reads) goes through applyLocal(),
+    #   which neither counts as a command nor proves anything
+    # - quit() marks the driver as dead for good
+    # - after an error (or once probe_interval seconds passed without any proof of life)
+    #   the next isAlive() probes the browser with a real WebDriver round-trip
+    def __init__(self, handle: WebDriver, probe_interval: float = 30.0) -> None:
         self.__handle: WebDriver = handle
         self.__error: bool = False
+        self.__quit: bool = False
+        self.__probe_interval: float = probe_interval
+        self.__confirmed_at: Optional[float] = monotonic() # <- a freshly created handle is alive
+        self.__probes: int = 0
+        self.__probes_saved: int = 0
+        self.__commands: int = 0
+        self.__counts_commands: bool = self.__impure__countCommands(handle)
+
+    def __impure__countCommands(self, handle: WebDriver) -> bool:
+        # every WebDriver command (of the driver and of its elements) goes through handle.execute,
+        # which is shadowed on the instance by a counting wrapper; handles without an 'execute'
+        # method (e.g. test doubles) count one command per apply() instead
+        execute = getattr(handle, "execute", None)
+        if not callable(execute):
+            return False
+        def __impure__countedExecute(*args: Any, **kwargs: Any) -> Any:
+            self.__commands += 1
+            return execute(*args, **kwargs)
+        try:
+            setattr(handle, "execute", __impure__countedExecute)
+            return True
+        except AttributeError:
+            return False
 
     def apply(self, function: Callable[[WebDriver], T], ignore_error_flag: bool = False) -> Maybe[T]:
         if(self.isUsable(ignore_error = ignore_error_flag)): 
+            if not self.__counts_commands:
+                self.__commands += 1
+            commands_before = self.__commands
+            try:
+                result = Just(function(self.__handle))
+                if not self.__counts_commands or self.__commands > commands_before:
+                    self.__confirmed_at = monotonic()
+                return result
+            except:
+                self.__error = True
+                self.__confirmed_at = None # <- the browser may have gone away, probe before trusting it again
+                return Nothing
+        else:
+            return Nothing
+
+    def applyLocal(self, function: Callable[[WebDriver], T], ignore_error_flag: bool = False) -> Maybe[T]:
+        # like apply(), for functions that don't talk to the browser (e.g. waiting, element cache 
+        # bookkeeping): runs unless the driver quit or is in error (unless ignore_error_flag),
+        # without a liveness check, isn't counted as a WebDriver command and proves no liveness;
+        # an exception still puts the driver in error
+        if not self.__quit and (ignore_error_flag or not self.__error): 
             try:
                 return Just(function(self.__handle))
             except:
@@ -103,30 +298,62 @@ class SafeWebDriver:
         return self.__error
 
     def isAlive(self) -> bool:
-        # TODO: This function is subject to external conditions (what happens to the browser)
-        #       hence violating the referential transperancy. This means function interacting
-        #       with this class may return different outcome given same input. 
-        #       better alternative is needed to make this module a pure function.
-        #       perhaps override .quit() method of specific webdriver modules (e.g. Chrome)
-        #       and track whether browser is open or closed. Note however, even if such 
-        #       alternative is implemented, browser drivers are still subject to side-effects
+        # NOTE: still subject to external conditions (what happens to the browser between
+        #       probes), a browser closed by hand is noticed on the first failing action 
+        #       or once the probe interval has passed
+        if self.__quit:
+            return False
+        if self.__confirmed_at is not None and monotonic() - self.__confirmed_at < self.__probe_interval:
+            self.__probes_saved += 1
+            return True
+        return self.__impure__probe()
+
+    def __impure__probe(self) -> bool:
+        self.__probes += 1
         try:
             self.__handle.title
+            self.__confirmed_at = monotonic()
             return True
         except:
+            self.__confirmed_at = None
             return False
     
     def isUsable(self, ignore_error: bool = False) -> bool:
         if ignore_error:
             return self.isAlive()
         else:
-            return self.isAlive() and not self.hasError()
+            return not self.hasError() and self.isAlive()
     
     def setError(self, set_error_to: bool) -> None:
         self.__error = set_error_to
 
+    def quit(self) -> None:
+        # quits the browser (if still running) and marks the driver as dead without further probes
+        if not self.__quit:
+            try:
+                self.__handle.quit()
+            except:
+                pass
+            self.__quit = True
+            self.__confirmed_at = None
+
+    def hasQuit(self) -> bool:
+        return self.__quit
+
+    def getProbeCount(self) -> int:
+        # number of liveness checks that needed a WebDriver round-trip
+        return self.__probes
+
+    def getProbesSaved(self) -> int:
+        # number of liveness checks answered from tracked state
+        return self.__probes_saved
+
+    def getCommandCount(self) -> int:
+        # number of WebDriver commands sent so far (see __impure__countCommands)
+        return self.__commands
+
 class ChromeWebDriver(SafeWebDriver):
-    def __init__(self, use_headless_browser: bool = True, window_width: int = 800, window_height: int = 600, driver_path: str = None) -> None:
+    def __init__(self, use_headless_browser: bool = True, window_width: int = 800, window_height: int = 600, driver_path: str = None, probe_interval: float = 30.0) -> None:
             
         browser_options = webdriver.ChromeOptions()
         browser_options.add_argument("window-size=" + str(window_width) + "x" + str(window_height)) # <- WARNING: large screen resolution crashes code in linux
@@ -144,9 +371,11 @@ class ChromeWebDriver(SafeWebDriver):
         super(ChromeWebDriver, self).__init__(handle = webdriver.Chrome(
             executable_path = driver_path, 
             chrome_options = browser_options
-        ))
+        ), probe_interval = probe_interval)
 
 class SafeWebElement(Printable):
+    __slots__ = ('__value',)
+
     def __init__(self, value: Maybe[WebElement]) -> None:
         self.__value: Maybe[WebElement] = value
     
@@ -159,14 +388,19 @@ class SafeWebElement(Printable):
         else:
             return Nothing
 
+# an element-less SafeWebElement holds no state, so a single shared instance is used everywhere
+BlankSafeWebElement = SafeWebElement(Nothing)
+
 class BrowserSession(Monad, Printable):
     def __init__(
         self, 
         driver: SafeWebDriver, 
         logs: BrowserSessionLog = BrowserSessionLog(), 
         data: CumulativeMonoidSet = CumulativeMonoidSet([]),
-        element: SafeWebElement = SafeWebElement(Nothing)
+        element: Optional[SafeWebElement] = None
     ) -> None:
+        if element is None:
+            element = BlankSafeWebElement
         # self.__driver: SafeWebDriver = driver
         # self.__logs: List[str] = logs
         # self.__data: CumulativeMonoidSet = data
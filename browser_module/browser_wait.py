@@ -0,0 +1,187 @@
+# __________________________________________________________________________________________
+# DEPENDENCIES
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Thread, Condition, Lock
+from time import monotonic, sleep
+import heapq
+
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from .browser_types import WebDriver
+
+# __________________________________________________________________________________________
+# NAMED TYPES
+WaitCondition = Callable[[WebDriver], Any]
+
+# exceptions raised by a condition that only mean "not yet" (as for WebDriverWait)
+_IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+# __________________________________________________________________________________________
+# CLASSES
+class BackoffPolicy:
+    # intervals between polls of a wait: 'initial' seconds at first, growing by 'factor'
+    # after every unsuccessful poll up to 'maximum' seconds, so conditions that are met quickly
+    # are noticed quickly and long waits don't hammer the driver
+    def __init__(self, initial: float = 0.05, factor: float = 1.5, maximum: float = 1.0) -> None:
+        self.__initial: float = initial
+        self.__factor: float = max(factor, 1.0)
+        self.__maximum: float = max(maximum, initial)
+
+    def getInitial(self) -> float:
+        return self.__initial
+
+    def getFactor(self) -> float:
+        return self.__factor
+
+    def getMaximum(self) -> float:
+        return self.__maximum
+
+    def intervals(self) -> Iterator[float]:
+        interval = self.__initial
+        while True:
+            yield interval
+            interval = min(interval * self.__factor, self.__maximum)
+
+def _checkCondition(condition: WaitCondition, handle: WebDriver) -> Any:
+    try:
+        return condition(handle)
+    except _IGNORED_EXCEPTIONS:
+        return False
+
+def pollUntil(condition: WaitCondition, handle: WebDriver, within: float, backoff: BackoffPolicy = BackoffPolicy()) -> Any:
+    # polls 'condition' in the calling thread until it returns a truthy value, which is returned
+    # (e.g. the WebElement of presence_of_element_located / element_to_be_clickable),
+    # raises TimeoutException once 'within' seconds (fractions allowed) passed
+    deadline = monotonic() + within
+    for interval in backoff.intervals():
+        result = _checkCondition(condition, handle)
+        if result:
+            return result
+        remaining = deadline - monotonic()
+        if remaining <= 0:
+            raise TimeoutException("Condition not met within " + str(within) + " seconds")
+        sleep(min(interval, remaining))
+
+class _ScheduledWait:
+    __slots__ = ('condition', 'handle', 'deadline', 'intervals', 'future', 'within')
+
+    def __init__(self, condition: WaitCondition, handle: WebDriver, within: float, backoff: BackoffPolicy) -> None:
+        self.condition: WaitCondition = condition
+        self.handle: WebDriver = handle
+        self.within: float = within
+        self.deadline: float = monotonic() + within
+        self.intervals: Iterator[float] = backoff.intervals()
+        self.future: Future = Future()
+
+# what a scheduled entry is due for
+_POLL = 0
+_DEADLINE = 1
+
+class WaitScheduler:
+    # One scheduling thread shared by many waits (e.g. the sessions of a BrowserSessionPool or of
+    # an asyncio event loop): submit() returns a Future resolved with the condition's result, or
+    # failed with TimeoutException, instead of tying up a sleeping thread per wait.
+    # The scheduling thread only keeps time: due conditions are evaluated on a bounded pool of
+    # 'checkers' threads, one check at a time per wait, so a slow or hung driver holds up a single
+    # checker rather than every wait. A wait fails at its deadline even if its check is still
+    # running (the late result is ignored).
+    def __init__(self, name: str = "WaitScheduler", checkers: int = 4) -> None:
+        self.__queue: List[Tuple[float, int, int, _ScheduledWait]] = []
+        self.__condition: Condition = Condition()
+        self.__sequence: int = 0
+        self.__closed: bool = False
+        self.__polls: int = 0
+        self.__checkers: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max(checkers, 1), thread_name_prefix=name + "Check")
+        self.__thread: Thread = Thread(target=self.__impure__run, name=name, daemon=True)
+        self.__thread.start()
+
+    def submit(self, condition: WaitCondition, handle: WebDriver, within: float, backoff: BackoffPolicy = BackoffPolicy()) -> Future:
+        wait = _ScheduledWait(condition, handle, within, backoff)
+        with self.__condition:
+            if self.__closed:
+                raise RuntimeError("WaitScheduler is closed")
+            self.__impure__schedule(monotonic(), _POLL, wait)
+            self.__impure__schedule(wait.deadline, _DEADLINE, wait)
+            self.__condition.notify()
+        return wait.future
+
+    def waitUntil(self, condition: WaitCondition, handle: WebDriver, within: float, backoff: BackoffPolicy = BackoffPolicy()) -> Any:
+        # blocking form of submit(), same contract as pollUntil
+        return self.submit(condition, handle, within, backoff).result()
+
+    def getPending(self) -> int:
+        with self.__condition:
+            return len({id(wait) for _, _, _, wait in self.__queue if not wait.future.done()})
+
+    def getPollCount(self) -> int:
+        return self.__polls
+
+    def close(self) -> None:
+        # pending waits fail with TimeoutException
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify()
+        self.__thread.join()
+        self.__checkers.shutdown(wait=False, cancel_futures=True)
+
+    def __impure__schedule(self, at: float, kind: int, wait: _ScheduledWait) -> None:
+        self.__sequence += 1
+        heapq.heappush(self.__queue, (at, self.__sequence, kind, wait))
+
+    def __impure__settle(self, wait: _ScheduledWait, result: Any = None, error: Optional[BaseException] = None) -> None:
+        # resolves the wait's future unless it already was (e.g. by its deadline)
+        with self.__condition:
+            if wait.future.done():
+                return
+            if error is not None:
+                wait.future.set_exception(error)
+            else:
+                wait.future.set_result(result)
+
+    def __impure__check(self, wait: _ScheduledWait) -> None:
+        # runs on a checker thread
+        try:
+            result = _checkCondition(wait.condition, wait.handle)
+        except BaseException as error:
+            self.__impure__settle(wait, error=error)
+            return
+        if result:
+            self.__impure__settle(wait, result=result)
+            return
+        now = monotonic()
+        with self.__condition:
+            if wait.future.done() or self.__closed or now >= wait.deadline:
+                return # <- the deadline entry fails the wait
+            self.__impure__schedule(min(now + next(wait.intervals), wait.deadline), _POLL, wait)
+            self.__condition.notify()
+
+    def __impure__run(self) -> None:
+        while True:
+            with self.__condition:
+                while not self.__closed and (len(self.__queue) == 0 or self.__queue[0][0] > monotonic()):
+                    self.__condition.wait(None if len(self.__queue) == 0 else self.__queue[0][0] - monotonic())
+                if self.__closed:
+                    pending = [wait for _, _, _, wait in self.__queue]
+                    self.__queue = []
+                    break
+                _, _, kind, wait = heapq.heappop(self.__queue)
+            if wait.future.done():
+                continue
+            if kind == _DEADLINE:
+                self.__impure__settle(wait, error=TimeoutException("Condition not met within " + str(wait.within) + " seconds"))
+            else:
+                self.__polls += 1
+                self.__checkers.submit(self.__impure__check, wait)
+        for wait in pending:
+            self.__impure__settle(wait, error=TimeoutException("WaitScheduler closed"))
+
+_shared_scheduler: Optional[WaitScheduler] = None
+_shared_scheduler_lock = Lock()
+
+def sharedWaitScheduler() -> WaitScheduler:
+    # process-wide scheduler, started on first use
+    global _shared_scheduler
+    with _shared_scheduler_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = WaitScheduler(name="SharedWaitScheduler")
+        return _shared_scheduler
@@ -22,6 +22,8 @@ __all__ = [
 	'Reader',
 	'curry',
 	'Monoid',
+	'mzero',
+	'mconcat',
 	'Maybe',
 	'Just',
 	'Nothing',
@@ -36,9 +38,17 @@ __all__ = [
 	'StringSet',
 	'StringTypeTupleList',
 	'Printable',
+	'TypeInference',
+	'ParallelCasting',
+	'Schema',
 	'CumulativeMonoidSet',
 	'StrictDataFrame',
-	'HasStrictDataframe'
+	'HasStrictDataframe',
+	'NamedStrictDataFrame',
+
+	# dataframe_stream
+	'StreamSource',
+	'streamStrictDataFrames'
 ]
 
 
@@ -60,4 +70,5 @@ del hard_dependencies, dependency, missing_dependencies
 
 from .generic_types import *
 from .pymonad_types import *
-from .dataframe_types import *
\ No newline at end of file
+from .dataframe_types import *
+from .dataframe_stream import *
\ No newline at end of file
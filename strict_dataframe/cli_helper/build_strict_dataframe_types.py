@@ -8,7 +8,7 @@ if __name__ == "__main__":
                         contents = [
                             define.strictDataframe(name = "BankAccounts", 
                                                 columns = [
-                                                    ("bank", str), 
+                                                    ("bank", "category"), 
                                                     ("client", int), 
                                                     ("bsb", int), 
                                                     ("account", int), 
@@ -19,12 +19,12 @@ if __name__ == "__main__":
                                                 ]),
                             define.strictDataframe(name = "BankTransactions", 
                                                 columns = [
-                                                    ("bank", str),
+                                                    ("bank", "category"),
                                                     ("client", int),
                                                     ("bsb", int),
                                                     ("account", int),
                                                     ("date", str),
-                                                    ("description", str),
+                                                    ("description", "interned"),
                                                     ("amount", float),
                                                     ("total", float)
                                                 ])
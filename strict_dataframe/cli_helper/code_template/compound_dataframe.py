@@ -24,6 +24,12 @@ class {{compound_dataclass_uppercase_name}}(df.Printable, m.Monoid):
     def __asString__(self) -> str:
         return "{{compound_dataclass_uppercase_name}}:\n\n" + {{list_pattern(pattern="str(self.__{{dataframe_lowercase_name}})", sep=" + '\n\n' + ")}}
 
+    @classmethod
+    def mconcat_many(cls, values: t.List['{{compound_dataclass_uppercase_name}}']) -> '{{compound_dataclass_uppercase_name}}':
+        return {{compound_dataclass_uppercase_name}}(
+            {{list_pattern(pattern="df_{{dataframe_lowercase_name}} = {{dataframe_uppercase_name}}DataFrame(df.HasStrictDataframe._concatInternal([value.__{{dataframe_lowercase_name}} for value in values]))", sep=",\n")}}
+        )
+
     @staticmethod
     def mzero():
         return {{compound_dataclass_uppercase_name}}()
@@ -1,10 +1,11 @@
 class {{dataframe_uppercase_name}}DataFrame(df.HasStrictDataframe):
+    schema: df.Schema = df.Schema.compile([{{list_pattern(list="columns", pattern="('{{column_name}}', {{data_type}})", sep=",\n")}}])
 
-    def __init__(self, dataframe: df.DataFrame = df.DataFrame()) -> None:
+    def __init__(self, dataframe: t.Union[df.DataFrame, df.StrictDataFrame] = df.DataFrame()) -> None:
         super({{dataframe_uppercase_name}}DataFrame, self).__init__(
             classname = "{{dataframe_uppercase_name}}DataFrame", 
-            value = df.DataFrame(dataframe = dataframe, 
-                                    columns   = [{{list_pattern(list="columns", pattern="('{{column_name}}', {{data_type}})", sep=",\n")}}]))
+            value = df.StrictDataFrame(dataframe = dataframe, 
+                                       columns   = {{dataframe_uppercase_name}}DataFrame.schema))
 
     def append(self, other: '{{dataframe_uppercase_name}}DataFrame') -> '{{dataframe_uppercase_name}}DataFrame':
         return {{dataframe_uppercase_name}}DataFrame(self._appendInternal(other))
\ No newline at end of file
@@ -61,7 +61,7 @@ class DataframeDefinition(ParamDict):
                 'dataframe_lowercase_name': _toLowercaseName(name)
                 },
             '_list': {
-                'columns': [{'column_name': colname, 'data_type': datatype.__name__} for colname, datatype in contents]
+                'columns': [{'column_name': colname, 'data_type': datatype.__name__ if isinstance(datatype, type) else repr(datatype)} for colname, datatype in contents]
             }
         }
         super(DataframeDefinition, self).__init__(value = value)
@@ -152,7 +152,7 @@ if __name__ == "__main__":
         contents = [
             define.strictDataframe(name = "BankAccounts", 
                                 columns = [
-                                    ("bank", str), 
+                                    ("bank", "category"), 
                                     ("client", int), 
                                     ("bsb", int), 
                                     ("account", int), 
@@ -163,12 +163,12 @@ if __name__ == "__main__":
                                 ]),
             define.strictDataframe(name = "BankTransactions", 
                                 columns = [
-                                    ("bank", str),
+                                    ("bank", "category"),
                                     ("client", int),
                                     ("bsb", int),
                                     ("account", int),
                                     ("date", str),
-                                    ("description", str),
+                                    ("description", "interned"),
                                     ("amount", float),
                                     ("total", float)
                                 ])
@@ -0,0 +1,128 @@
+from typing import Iterator, Iterable, Optional, Union, Dict, List, Any
+from threading import Thread, Event
+from queue import Queue, Full
+from .dataframe_types import *
+from .dataframe_types import _INTERNED
+import pandas as pd
+
+# __________________________________________________________________________________________
+# FUNCTIONAL DATA STRUCTURES
+# a source is either a path to a .csv / .jsonl file, or an iterable of records (dicts) or dataframes
+StreamSource = Union[str, Iterable[Dict[str, Any]], Iterable[DataFrame]]
+
+# __________________________________________________________________________________________
+# FUNCTIONS
+
+def _sourceFormat(source: str, format: Optional[str]) -> str:
+    if format is not None:
+        return format
+    if source.endswith(".csv"):
+        return "csv"
+    if source.endswith(".jsonl") or source.endswith(".json"):
+        return "jsonl"
+    raise ValueError("Can't tell the format of '" + source + "', pass format='csv' or format='jsonl'")
+
+def _readFile(source: str, format: str, schema: Schema, chunk_size: int) -> Iterator[DataFrame]:
+    names = schema.getNames()
+    if format == "csv":
+        # text columns are read as text (e.g. keeps leading zeros), columns outside the schema are never parsed
+        text_columns = {name: str for name, datatype in schema.getColumns() if datatype is str or datatype == _INTERNED}
+        return pd.read_csv(source, chunksize=chunk_size, usecols=lambda name: name in names, dtype=text_columns)
+    if format == "jsonl":
+        return pd.read_json(source, lines=True, chunksize=chunk_size, dtype=False)
+    raise ValueError("Unsupported format '" + format + "'")
+
+def _chunkIterable(source: Iterable[Any], chunk_size: int) -> Iterator[DataFrame]:
+    # records and dataframe rows go through one buffer, so chunks keep the order of the source
+    # and hold exactly chunk_size rows (except for the last one), however the rows arrived
+    parts: List[DataFrame] = []
+    records: List[Dict[str, Any]] = []
+    buffered = 0
+    for item in source:
+        if isinstance(item, DataFrame):
+            if len(item) == 0:
+                continue
+            if len(records) > 0:
+                parts.append(DataFrame.from_records(records))
+                records = []
+            parts.append(item)
+            buffered += len(item)
+        else:
+            records.append(item)
+            buffered += 1
+        if buffered < chunk_size:
+            continue
+        if len(records) > 0:
+            parts.append(DataFrame.from_records(records))
+            records = []
+        rows = parts[0] if len(parts) == 1 else pd.concat(parts, ignore_index=True)
+        full = len(rows) - len(rows) % chunk_size
+        for start in range(0, full, chunk_size):
+            yield rows.iloc[start:start + chunk_size]
+        parts = [rows.iloc[full:]] if full < len(rows) else []
+        buffered = len(rows) - full
+    if len(records) > 0:
+        parts.append(DataFrame.from_records(records))
+    if len(parts) > 0:
+        yield parts[0] if len(parts) == 1 else pd.concat(parts, ignore_index=True)
+
+def _rawChunks(source: StreamSource, schema: Schema, chunk_size: int, format: Optional[str]) -> Iterator[DataFrame]:
+    if isinstance(source, str):
+        return iter(_readFile(source, _sourceFormat(source, format), schema, chunk_size))
+    return _chunkIterable(source, chunk_size)
+
+class _EndOfStream:
+    pass
+
+class _StreamError:
+    def __init__(self, error: BaseException) -> None:
+        self.error: BaseException = error
+
+def streamStrictDataFrames(
+    source: StreamSource,
+    columns: Union[StringTypeTupleList, Schema],
+    chunk_size: int = 10000,
+    format: Optional[str] = None,
+    prefetch: int = 1
+) -> Iterator[StrictDataFrame]:
+    # yields already-cast StrictDataFrame chunks of chunk_size rows (the last one may be shorter), in source order
+    # - parsing happens in a background thread while the caller's thread casts the previous chunk
+    # - at most 'prefetch' parsed chunks wait to be cast, so peak memory stays at a few chunks
+    #   regardless of the size of the source
+    # chunks can be handed to a HasStrictDataframe subclass with the same columns without
+    # another cast, e.g. BankTransactionsDataFrame(chunk)
+    schema = Schema.compile(columns)
+    parsed: Queue = Queue(maxsize=max(prefetch, 1))
+    stop = Event()
+
+    def __impure__put(item: Any) -> bool:
+        # blocks while the queue is full, gives up once the consumer has gone away
+        while not stop.is_set():
+            try:
+                parsed.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def __impure__parse() -> None:
+        try:
+            for chunk in _rawChunks(source, schema, chunk_size, format):
+                if not __impure__put(chunk):
+                    return
+            __impure__put(_EndOfStream())
+        except BaseException as error:
+            __impure__put(_StreamError(error))
+
+    parser = Thread(target=__impure__parse, name="streamStrictDataFrames", daemon=True)
+    parser.start()
+    try:
+        while True:
+            item = parsed.get()
+            if isinstance(item, _EndOfStream):
+                return
+            if isinstance(item, _StreamError):
+                raise item.error
+            yield StrictDataFrame(columns=schema, dataframe=item)
+    finally:
+        stop.set()
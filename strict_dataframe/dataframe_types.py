@@ -2,6 +2,13 @@
 from abc import ABCMeta, abstractmethod
 from .pymonad_types import * # <-- mypy typecheck doesn't seem to work with externally imported classes, 
                             #     copied pymonad content to a local file as temporary solution
+from typing import Optional, Mapping, FrozenSet, Sequence
+from types import MappingProxyType
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from threading import Lock
+import sys
+import os
+import json
 import pandas as pd
 import numpy as np
 from pandas import DataFrame
@@ -12,7 +19,8 @@ from pandas import DataFrame
 
 # __________________________________________________________________________________________
 # FUNCTIONAL DATA STRUCTURES
-BasicType = Type[Union[str, int, float]]
+BasicType = Union[Type[Union[str, int, float, bool]], str] # <- str: any dtype name understood by pandas, e.g. 'int8', 'category' or 'datetime64[ns]'
+                                                           #    or 'interned' (str values, stored as one shared python object per distinct value)
 TypeDict = Dict[str, BasicType]
 StringList = List[str]
 StringSet = Set[str]
@@ -23,6 +31,7 @@ StringTypeTupleList = List[Tuple[str, BasicType]]
 
 class Printable:
     __metaclass__ = ABCMeta
+    __slots__ = () # <- lets slotted subclasses (e.g. SafeWebElement) stay dict-free
 
     @abstractmethod
     def _asString(self) -> str:
@@ -42,11 +51,18 @@ class CumulativeMonoidSet(Printable, Monoid):
     def __init__(self, value: List[Monoid] = []) -> None:
         self.__value: Dict[str, Monoid] = self._listToTypeSet(value)
     
+    @staticmethod
+    def _keyOf(monoid_value: Monoid) -> str:
+        # values are keyed by their class name, unless they name their own key through a
+        # 'getMonoidKey' method (e.g. NamedStrictDataFrame, one key per name)
+        get_key = getattr(monoid_value, "getMonoidKey", None)
+        return get_key() if get_key is not None else monoid_value.__class__.__name__
+
     def _listToTypeSet(self, monoid_list: List[Monoid]) -> Dict[str, Monoid]:
         new_typeset: Dict[str, Monoid] = {}
         for monoid_value in monoid_list:
             # key = str(type(monoid_value))
-            key = monoid_value.__class__.__name__
+            key = CumulativeMonoidSet._keyOf(monoid_value)
             existing_keys = new_typeset.keys()
             new_typeset[key] = new_typeset[key] + monoid_value if key in existing_keys else monoid_value
         return new_typeset
@@ -77,11 +93,36 @@ class CumulativeMonoidSet(Printable, Monoid):
     def getValueAsList(self) -> List[Monoid]:
         return list(self.getValue().values())
 
+    @staticmethod
+    def _fromTypeSet(typeset: Dict[str, Monoid]) -> 'CumulativeMonoidSet':
+        # wraps an already keyed dictionary, skipping _listToTypeSet
+        new_set = CumulativeMonoidSet()
+        new_set.__value = typeset
+        return new_set
+
     def append(self, other: 'CumulativeMonoidSet') -> 'CumulativeMonoidSet':
-        if type(other) is CumulativeMonoidSet:
-            return CumulativeMonoidSet(self.getValueAsList() + other.getValueAsList()) 
-        else: 
-            return CumulativeMonoidSet(self.getValueAsList())
+        # only the keys present in 'other' are merged; every other entry of self is shared
+        # (not copied or re-added) with the resulting set. Both sets are immutable, so an empty
+        # operand simply yields the other set
+        if type(other) is not CumulativeMonoidSet or len(other.__value) == 0:
+            return self
+        if len(self.__value) == 0:
+            return other
+        new_typeset: Dict[str, Monoid] = dict(self.__value)
+        for key, monoid_value in other.__value.items():
+            new_typeset[key] = new_typeset[key] + monoid_value if key in new_typeset else monoid_value
+        return CumulativeMonoidSet._fromTypeSet(new_typeset)
+
+    @classmethod
+    def mconcat_many(cls, values: List['CumulativeMonoidSet']) -> 'CumulativeMonoidSet':
+        # values are grouped by key first, so each key is combined by a single mconcat
+        # (which in turn uses the bulk protocol of that key's monoid type, if any)
+        grouped: Dict[str, List[Monoid]] = {}
+        for monoid_set in values:
+            if type(monoid_set) is CumulativeMonoidSet:
+                for key, monoid_value in monoid_set.__value.items():
+                    grouped.setdefault(key, []).append(monoid_value)
+        return CumulativeMonoidSet._fromTypeSet({key: mconcat(monoid_values) for key, monoid_values in grouped.items()})
 
     @staticmethod
     def mzero():
@@ -90,6 +131,516 @@ class CumulativeMonoidSet(Printable, Monoid):
     def mplus(self, other: 'CumulativeMonoidSet') -> 'CumulativeMonoidSet':
         return self.append(other)
 
+_INTERNED = "interned"
+
+def _dtypeMap(index: TypeDict) -> Dict[str, Any]:
+    # translate a TypeDict into arguments for astype()
+    # ('str' is kept as is: pandas stores it as python objects, but astype(str) also converts the values;
+    #  'interned' has no pandas equivalent and is handled by _internStrings)
+    return {
+        name: datatype if datatype is str or datatype == _INTERNED else pd.api.types.pandas_dtype(datatype) 
+        for name, datatype in index.items()
+    }
+
+def _isCategory(dtype: Any) -> bool:
+    return isinstance(dtype, pd.CategoricalDtype)
+
+def _hasDtype(column: pd.Series, dtype: Any) -> bool:
+    if dtype is str:
+        # object columns only count as 'str' if every value already is a string
+        return column.dtype == np.dtype(object) and (len(column) == 0 or pd.api.types.infer_dtype(column, skipna=False) == "string")
+    if dtype == _INTERNED:
+        # there is no cheap way to tell whether strings are already interned
+        return len(column) == 0 and column.dtype == np.dtype(object)
+    if _isCategory(dtype) and dtype.categories is None:
+        # plain 'category': any set of categories will do
+        return _isCategory(column.dtype)
+    return column.dtype == dtype
+
+def _castColumn(column: pd.Series, dtype: Any) -> pd.Series:
+    # raises a ValueError naming the column if its values can't be stored as dtype
+    try:
+        return _internStrings(column) if dtype == _INTERNED else column.astype(dtype, copy=False)
+    except (ValueError, TypeError) as error:
+        raise ValueError(
+            "Column '" + str(column.name) + "' can't be cast to " + getattr(dtype, '__name__', str(dtype)) + ": " + str(error)
+            + " (use a nullable dtype such as 'Int64' or 'boolean' for columns with missing values)"
+        ) from error
+
+def _keepsValues(column: pd.Series, cast: pd.Series) -> bool:
+    # whether an object column cast to integers / bools still holds the same values
+    # (astype silently truncates 2.5 to 2); other casts are taken as they are
+    if column.dtype != np.dtype(object) or cast.dtype.kind not in "biu":
+        return True
+    return bool(np.all(cast.to_numpy(dtype=object) == column.to_numpy()))
+
+def _castsLosslessly(column: pd.Series, dtype: Any) -> bool:
+    try:
+        return _keepsValues(column, _castColumn(column, dtype))
+    except ValueError:
+        return False
+
+def _internStrings(column: pd.Series) -> pd.Series:
+    # every distinct value is converted to str and interned once; the resulting column holds
+    # references to those shared objects only
+    codes, uniques = pd.factorize(column.astype(str), sort=False)
+    interned = np.array([sys.intern(value) for value in uniques], dtype=object)
+    return pd.Series(interned[codes], index=column.index, name=column.name)
+
+def _castFrame(dataframe: DataFrame, dtype_map: Mapping[str, Any]) -> DataFrame:
+    # casts every column of dataframe whose dtype differs from dtype_map, in one astype() call;
+    # a column that can't be cast raises a ValueError (it is never kept with its original dtype)
+    cast_map = {
+        colname: dtype for colname, dtype in dtype_map.items() 
+        if colname in dataframe.columns and not _hasDtype(dataframe[colname], dtype)
+    }
+    if len(cast_map) == 0:
+        # nothing to cast: hand back the very same dataframe, no copy
+        return dataframe
+    interned_names = [colname for colname, dtype in cast_map.items() if dtype == _INTERNED]
+    if len(interned_names) > 0:
+        dataframe = dataframe.assign(**{colname: _internStrings(dataframe[colname]) for colname in interned_names})
+        cast_map = {colname: dtype for colname, dtype in cast_map.items() if dtype != _INTERNED}
+        if len(cast_map) == 0:
+            return dataframe
+    try:
+        # copy=False: columns that are not in cast_map are not copied
+        return dataframe.astype(cast_map, copy=False)
+    except (ValueError, TypeError):
+        # at least one column can't be cast (e.g. NaN in an int column):
+        # cast column by column to report the first offending column
+        for colname, dtype in cast_map.items():
+            _castColumn(dataframe[colname], dtype)
+        raise
+
+_executors: Dict[Tuple[bool, int], Executor] = {}
+
+def _executor(use_processes: bool, workers: int) -> Executor:
+    # pools are created once per (kind, size) and reused by every cast
+    key = (use_processes, workers)
+    if key not in _executors:
+        _executors[key] = ProcessPoolExecutor(max_workers=workers) if use_processes else ThreadPoolExecutor(max_workers=workers)
+    return _executors[key]
+
+def _frameOf(dataframe: DataFrame, names: List[str]) -> DataFrame:
+    # column subset that (unlike dataframe[names]) does not copy the column data
+    return DataFrame({name: dataframe[name] for name in names}, index=dataframe.index, copy=False)
+
+class ParallelCasting:
+    # options for validating & casting large dataframes on several cores
+    # - workers: size of the thread (or process) pool; 1 (default) casts serially
+    # - min_rows: dataframes with fewer rows are always cast serially
+    # - use_processes: use a process pool instead of a thread pool. Threads suffice for numeric
+    #   casts (numpy releases the GIL), while 'str'/'interned' casts hold the GIL and only scale
+    #   with processes, at the cost of pickling each part to a worker and back
+    # a dataframe is split by column groups when there are at least as many columns as workers,
+    # otherwise by row ranges ('category' and 'interned' columns need to see all rows, so in that
+    # case they are cast afterwards, serially)
+    def __init__(self, workers: int = 1, min_rows: int = 100000, use_processes: bool = False) -> None:
+        self.__workers: int = workers
+        self.__min_rows: int = min_rows
+        self.__use_processes: bool = use_processes
+
+    def getWorkers(self) -> int:
+        return self.__workers
+
+    def appliesTo(self, dataframe: DataFrame) -> bool:
+        return self.__workers > 1 and len(dataframe) >= self.__min_rows
+
+    def cast(self, dataframe: DataFrame, dtype_map: Mapping[str, Any]) -> DataFrame:
+        names = [colname for colname in dataframe.columns if colname in dtype_map]
+        if len(names) >= self.__workers:
+            return self._castColumnGroups(dataframe, names, dtype_map)
+        return self._castRowRanges(dataframe, names, dtype_map)
+
+    def _castColumnGroups(self, dataframe: DataFrame, names: List[str], dtype_map: Mapping[str, Any]) -> DataFrame:
+        groups = [names[i::self.__workers] for i in range(self.__workers)]
+        frames = [_frameOf(dataframe, group) for group in groups]
+        parts = list(_executor(self.__use_processes, self.__workers).map(
+            _castFrame, frames, [{name: dtype_map[name] for name in group} for group in groups]
+        ))
+        if all(part is frame for part, frame in zip(parts, frames)):
+            return dataframe
+        casted = {name: part[name] for part in parts for name in part.columns}
+        return DataFrame(
+            {name: casted[name] if name in casted else dataframe[name] for name in dataframe.columns}, 
+            index = dataframe.index, 
+            copy = False
+        )
+
+    def _castRowRanges(self, dataframe: DataFrame, names: List[str], dtype_map: Mapping[str, Any]) -> DataFrame:
+        global_names = [name for name in names if dtype_map[name] == _INTERNED or _isCategory(dtype_map[name])]
+        local_map = {name: dtype_map[name] for name in names if name not in global_names}
+        bounds = np.linspace(0, len(dataframe), self.__workers + 1).astype(int)
+        ranges = [dataframe.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+        parts = list(_executor(self.__use_processes, self.__workers).map(_castFrame, ranges, [local_map] * len(ranges)))
+        combined = dataframe if all(part is frame for part, frame in zip(parts, ranges)) else pd.concat(parts)
+        return _castFrame(combined, {name: dtype_map[name] for name in global_names})
+
+class TypeInference:
+    # options for inferring column types when a StrictDataFrame is built from a dataframe only
+    # - sample_size: object columns are classified from at most this many (evenly spaced) rows
+    # - full_scan: confirm the type guessed from the sample against the whole column;
+    #   columns that fail confirmation fall back to 'str'
+    # - downcast: store int and float columns in the smallest width that holds all of their values
+    # - category_ratio (opt-in): string columns whose share of distinct values is at most this
+    #   ratio are stored as 'category'; by default string columns are always 'str'
+    # a column whose values turn out not to fit the type guessed from its sample is stored as 'str'
+    def __init__(self, sample_size: int = 10000, full_scan: bool = False, downcast: bool = False, category_ratio: Optional[float] = None) -> None:
+        self.__sample_size: int = sample_size
+        self.__full_scan: bool = full_scan
+        self.__downcast: bool = downcast
+        self.__category_ratio: Optional[float] = category_ratio
+
+    def getSampleSize(self) -> int:
+        return self.__sample_size
+
+    def isFullScan(self) -> bool:
+        return self.__full_scan
+
+    def isDowncast(self) -> bool:
+        return self.__downcast
+
+    def getCategoryRatio(self) -> Optional[float]:
+        return self.__category_ratio
+
+    def inferColumnType(self, column: pd.Series) -> BasicType:
+        dtype = column.dtype
+        if pd.api.types.is_bool_dtype(dtype):
+            return bool
+        if pd.api.types.is_integer_dtype(dtype):
+            return _smallestIntType(column) if self.__downcast else int
+        if pd.api.types.is_float_dtype(dtype):
+            return _smallestFloatType(column) if self.__downcast else float
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return str(dtype)
+        if isinstance(dtype, pd.CategoricalDtype):
+            return "category"
+        return self._inferObjectColumnType(column)
+
+    def _inferObjectColumnType(self, column: pd.Series) -> BasicType:
+        sample = _evenlySpacedSample(column, self.__sample_size)
+        kind = pd.api.types.infer_dtype(sample, skipna=True)
+        is_sampled = len(sample) < len(column)
+
+        def __confirm(accepted_kinds: Tuple[str, ...]) -> bool:
+            # the whole column needs to agree with the sample if a full scan is requested
+            if not (is_sampled and self.__full_scan):
+                return True
+            return pd.api.types.infer_dtype(column, skipna=True) in accepted_kinds
+
+        if kind == "boolean" and not sample.isna().any() and __confirm(("boolean",)):
+            return bool
+        if kind == "integer" and not sample.isna().any() and __confirm(("integer",)):
+            # (only downcast once every value has been seen)
+            return _smallestIntType(pd.to_numeric(column)) if self.__downcast and (self.__full_scan or not is_sampled) else int
+        if kind in ("integer", "floating", "mixed-integer-float") and __confirm(("integer", "floating", "mixed-integer-float")):
+            return float
+        if kind in ("datetime", "datetime64") and __confirm(("datetime", "datetime64")):
+            return "datetime64[ns]"
+        if kind == "string" and __confirm(("string",)):
+            if self.__category_ratio is None:
+                return str
+            distinct_ratio = sample.nunique(dropna=False) / max(len(sample), 1)
+            return "category" if distinct_ratio <= self.__category_ratio else str
+        return str
+
+def _evenlySpacedSample(column: pd.Series, sample_size: int) -> pd.Series:
+    if len(column) <= sample_size:
+        return column
+    step = -(-len(column) // sample_size) # <- ceiling division
+    return column.iloc[::step]
+
+def _smallestIntType(column: pd.Series) -> BasicType:
+    if len(column) == 0:
+        return int
+    low, high = column.min(), column.max()
+    for dtype in ("int8", "int16", "int32"):
+        if np.iinfo(dtype).min <= low and high <= np.iinfo(dtype).max:
+            return dtype
+    return int
+
+def _smallestFloatType(column: pd.Series) -> BasicType:
+    values = column.to_numpy()
+    with np.errstate(over="ignore"):
+        narrowed = values.astype("float32")
+    # float32 is only 'safe' if every value survives the round trip unchanged
+    return "float32" if np.array_equal(narrowed.astype(values.dtype), values, equal_nan=True) else float
+
+class Schema:
+    # compiled, immutable form of a StrictDataFrame column definition (StringTypeTupleList)
+    # - compiled once per distinct column definition and interned: Schema.compile() returns the
+    #   very same Schema object for equal definitions, so it can be shared by every StrictDataFrame
+    #   (and every append) using those columns
+    # - precomputes the TypeDict, the column order, the name set and the astype() dtype mapping
+    __slots__ = ('__key', '__index', '__order', '__names', '__dtype_map')
+
+    __key: Tuple[Tuple[str, BasicType], ...]
+    __index: Mapping[str, BasicType]
+    __order: Tuple[str, ...]
+    __names: FrozenSet[str]
+    __dtype_map: Mapping[str, Any]
+
+    __cache: Dict[Tuple[Tuple[str, BasicType], ...], 'Schema'] = {}
+
+    def __init__(self, key: Tuple[Tuple[str, BasicType], ...]) -> None:
+        # do not call directly, use Schema.compile()
+        index: TypeDict = {name: datatype for name, datatype in key}
+        self.__key = key
+        self.__index = MappingProxyType(index)
+        self.__order = tuple(index)
+        self.__names = frozenset(index)
+        self.__dtype_map = MappingProxyType(_dtypeMap(index))
+
+    @staticmethod
+    def compile(columns: Union[StringTypeTupleList, 'Schema']) -> 'Schema':
+        if isinstance(columns, Schema):
+            return columns
+        key = tuple((name, datatype) for name, datatype in columns)
+        schema = Schema.__cache.get(key)
+        if schema is None:
+            schema = Schema.__cache.setdefault(key, Schema(key))
+        return schema
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # every slot is set once, by __init__
+        if hasattr(self, name):
+            raise AttributeError("Schema is immutable")
+        super(Schema, self).__setattr__(name, value)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # unpickled (e.g. from a checkpoint or another process) through compile(), so it stays interned
+        return (Schema.compile, (self.getColumns(),))
+
+    def __hash__(self) -> int:
+        return hash(self.__key)
+
+    def __eq__(self, other: Any) -> bool:
+        return self is other or (isinstance(other, Schema) and self.__key == other.__key)
+
+    def __len__(self) -> int:
+        return len(self.__order)
+
+    def __repr__(self) -> str:
+        return "Schema(" + ", ".join([name + ": " + getattr(datatype, '__name__', str(datatype)) for name, datatype in self.__index.items()]) + ")"
+
+    def getIndex(self) -> Mapping[str, BasicType]:
+        return self.__index
+
+    def getColumns(self) -> StringTypeTupleList:
+        return [(name, self.__index[name]) for name in self.__order]
+
+    def getOrder(self) -> Tuple[str, ...]:
+        return self.__order
+
+    def getNames(self) -> FrozenSet[str]:
+        return self.__names
+
+    def getDtypeMap(self) -> Mapping[str, Any]:
+        return self.__dtype_map
+
+# __________________________________________________________________________________________
+# COLUMNAR PERSISTENCE
+# A saved StrictDataFrame is a directory holding one .npy file (or a codes/categories pair) per
+# column plus 'schema.json', which embeds the schema, the row index and how each column is stored.
+# Numeric, bool and datetime columns and the codes of categorical columns are memory-mapped on load.
+
+_SCHEMA_FILE = "schema.json"
+_NAME_FILE = "name.json" # <- NamedStrictDataFrame only
+_TYPE_NAMES: Dict[Any, str] = {str: "str", int: "int", float: "float", bool: "bool"}
+
+def _typeToName(datatype: BasicType) -> str:
+    return _TYPE_NAMES[datatype] if datatype in _TYPE_NAMES else str(datatype)
+
+def _nameToType(name: str) -> BasicType:
+    types = {type_name: datatype for datatype, type_name in _TYPE_NAMES.items()}
+    return types[name] if name in types else name
+
+def _saveArray(path: str, filename: str, values: np.ndarray) -> bool:
+    # returns whether the array had to be pickled (arbitrary python objects)
+    if values.dtype == np.dtype(object):
+        if pd.api.types.infer_dtype(values, skipna=False) == "string":
+            values = values.astype(str)
+        else:
+            np.save(os.path.join(path, filename), values, allow_pickle=True)
+            return True
+    np.save(os.path.join(path, filename), values, allow_pickle=False)
+    return False
+
+def _loadArray(path: str, filename: str, pickled: bool, memory_map: bool) -> np.ndarray:
+    if pickled:
+        return np.load(os.path.join(path, filename), allow_pickle=True)
+    values = np.load(os.path.join(path, filename), mmap_mode="r" if memory_map else None)
+    return values.astype(object) if values.dtype.kind == "U" else values
+
+_MASKED_ARRAYS = (pd.arrays.IntegerArray, pd.arrays.FloatingArray, pd.arrays.BooleanArray)
+
+def _saveColumn(path: str, key: str, column: Union[pd.Series, pd.Index]) -> Dict[str, Any]:
+    if _isCategory(column.dtype):
+        categorical = column.array if isinstance(column, pd.Series) else column.values
+        storage = "categorical"
+        codes, categories = categorical.codes, categorical.categories.to_numpy()
+    elif column.dtype == np.dtype(object) or isinstance(column.dtype, pd.StringDtype):
+        # strings (and other objects) are dictionary encoded, missing values get code -1
+        storage = "encoded"
+        codes, uniques = pd.factorize(column, sort=False)
+        categories = np.asarray(uniques, dtype=object)
+    elif isinstance(column.array, _MASKED_ARRAYS):
+        # nullable dtypes (e.g. 'Int64'): values with the missing ones zeroed, plus the mask
+        missing = column.isna().to_numpy()
+        np.save(os.path.join(path, key + ".npy"), column.to_numpy(dtype=column.dtype.numpy_dtype, na_value=0), allow_pickle=False)
+        np.save(os.path.join(path, key + ".mask.npy"), missing, allow_pickle=False)
+        return {"storage": "masked", "dtype": str(column.dtype)}
+    else:
+        np.save(os.path.join(path, key + ".npy"), column.to_numpy(), allow_pickle=False)
+        return {"storage": "values"}
+    np.save(os.path.join(path, key + ".codes.npy"), codes, allow_pickle=False)
+    pickled = _saveArray(path, key + ".categories.npy", categories)
+    return {"storage": storage, "pickled": pickled}
+
+def _loadColumn(path: str, key: str, layout: Dict[str, Any], memory_map: bool) -> Any:
+    if layout["storage"] == "values":
+        return np.load(os.path.join(path, key + ".npy"), mmap_mode="r" if memory_map else None)
+    if layout["storage"] == "masked":
+        masked = pd.array(np.load(os.path.join(path, key + ".npy")), dtype=layout["dtype"])
+        masked[np.load(os.path.join(path, key + ".mask.npy"))] = pd.NA
+        return masked
+    codes = np.load(os.path.join(path, key + ".codes.npy"), mmap_mode="r" if memory_map else None)
+    categories = _loadArray(path, key + ".categories.npy", layout["pickled"], memory_map=False)
+    if layout.get("type") == _INTERNED:
+        categories = np.array([sys.intern(value) for value in categories], dtype=object)
+    if layout["storage"] == "categorical":
+        return pd.Categorical.from_codes(codes, categories=categories)
+    # 'encoded': decoding needs to materialize one python object reference per row
+    values = np.empty(len(codes), dtype=object)
+    values[:] = np.nan
+    present = np.asarray(codes) >= 0
+    values[present] = categories[np.asarray(codes)[present]]
+    return pd.array(values, dtype=layout["type"]) if layout.get("type") == "string" else values
+
+def _saveDataFrame(path: str, schema: 'Schema', dataframe: DataFrame) -> None:
+    os.makedirs(path, exist_ok=True)
+    columns = []
+    for position, (name, datatype) in enumerate(schema.getColumns()):
+        layout = _saveColumn(path, str(position), dataframe[name])
+        columns.append(dict(name=name, type=_typeToName(datatype), **layout))
+    index = dataframe.index
+    if isinstance(index, pd.RangeIndex):
+        index_layout: Dict[str, Any] = {"storage": "range", "start": index.start, "stop": index.stop, "step": index.step}
+    else:
+        index_layout = _saveColumn(path, "index", index)
+    with open(os.path.join(path, _SCHEMA_FILE), "w") as schema_file:
+        json.dump({"rows": len(dataframe), "columns": columns, "index": index_layout}, schema_file, indent=1)
+
+def _loadDataFrame(path: str, memory_map: bool) -> Tuple['Schema', DataFrame]:
+    with open(os.path.join(path, _SCHEMA_FILE), "r") as schema_file:
+        layout = json.load(schema_file)
+    schema = Schema.compile([(column["name"], _nameToType(column["type"])) for column in layout["columns"]])
+    index_layout = layout["index"]
+    if index_layout["storage"] == "range":
+        index = pd.RangeIndex(index_layout["start"], index_layout["stop"], index_layout["step"])
+    else:
+        index = pd.Index(_loadColumn(path, "index", index_layout, memory_map))
+    values = {column["name"]: _loadColumn(path, str(position), column, memory_map) for position, column in enumerate(layout["columns"])}
+    # copy=False keeps the memory-mapped arrays as the backing store of the dataframe
+    return schema, DataFrame(values, index=index, copy=False)
+
+def _missingValues(dtype: Any, rows: int) -> np.ndarray:
+    # fills a column missing from an appended chunk, as DataFrame.append would: NaT for
+    # datetime / timedelta columns (NaN could not be concatenated with their chunks), NaN otherwise
+    try:
+        numpy_dtype = np.dtype(dtype)
+    except TypeError:
+        numpy_dtype = np.dtype(object)
+    if numpy_dtype.kind in "mM":
+        return np.full(rows, numpy_dtype.type("NaT"), dtype=numpy_dtype)
+    return np.full(rows, np.nan)
+
+class _ColumnChunkBuffer:
+    # append-only store of raw (uncast) chunks, kept per column
+    # a single buffer is shared by every StrictDataFrame produced by a chain of appends;
+    # each of those StrictDataFrames only remembers how many chunks of the buffer belong to it
+    # 'category' columns are kept as Categoricals and concatenated by unioning their categories
+    def __init__(self, schema: 'Schema') -> None:
+        self.__schema: Schema = schema
+        self.__names: Tuple[str, ...] = schema.getOrder()
+        self.__dtypes: Mapping[str, Any] = schema.getDtypeMap()
+        self.__categorical: FrozenSet[str] = frozenset(name for name, dtype in self.__dtypes.items() if _isCategory(dtype))
+        self.__columns: Dict[str, List[Any]] = {name: [] for name in self.__names}
+        self.__index: List[pd.Index] = []
+        self.__lock: Lock = Lock()
+
+    def getLength(self) -> int:
+        return len(self.__index)
+
+    def copy(self, length: int) -> '_ColumnChunkBuffer':
+        # branch off a new buffer holding only the first 'length' chunks
+        # (chunk arrays themselves are shared, only the chunk lists are copied)
+        new_buffer = _ColumnChunkBuffer(self.__schema)
+        for name in self.__names:
+            new_buffer.__columns[name] = self.__columns[name][:length]
+        new_buffer.__index = self.__index[:length]
+        return new_buffer
+
+    def appendAt(self, length: int, dataframes: List[DataFrame]) -> Tuple['_ColumnChunkBuffer', int]:
+        # adds 'dataframes' after the first 'length' chunks: in place when those are all the chunks
+        # of the buffer (the caller holds its tip), otherwise onto a copy of them (the caller was
+        # already appended to). Returns the buffer and its new length; the check and the extension
+        # happen under the buffer's lock, so concurrent appends to one StrictDataFrame can't mix
+        # their chunks
+        with self.__lock:
+            buffer = self if self.getLength() == length else self.copy(length)
+            for dataframe in dataframes:
+                buffer.extend(dataframe)
+            return buffer, buffer.getLength()
+
+    def extend(self, dataframe: DataFrame) -> None:
+        rows = len(dataframe)
+        if rows == 0:
+            return
+        existing_names = set(dataframe.columns)
+        for name in self.__names:
+            # columns missing from the chunk are filled with NaN, as DataFrame.append would do
+            if name in self.__categorical:
+                if name not in existing_names:
+                    chunk = pd.Categorical.from_codes(np.full(rows, -1), categories=pd.Index([], dtype=object))
+                elif _isCategory(dataframe[name].dtype):
+                    chunk = dataframe[name].array
+                else:
+                    chunk = pd.Categorical(dataframe[name])
+            else:
+                chunk = dataframe[name].to_numpy() if name in existing_names else _missingValues(self.__dtypes[name], rows)
+            self.__columns[name].append(chunk)
+        self.__index.append(dataframe.index)
+
+    def concat(self, length: int) -> DataFrame:
+        # concatenate the first 'length' chunks into a single (uncast) dataframe
+        if length == 0:
+            return DataFrame(columns=list(self.__names))
+        index = self.__index[0].append(self.__index[1:length]) if length > 1 else self.__index[0]
+        return DataFrame(
+            {name: self._concatColumn(name, length) for name in self.__names}, 
+            index = index, 
+            columns = list(self.__names)
+        )
+
+    def _concatColumn(self, name: str, length: int) -> Any:
+        chunks = self.__columns[name][:length]
+        if name in self.__categorical:
+            # categories of all chunks are unioned (in order of appearance), codes are recoded once
+            if length == 1:
+                return chunks[0]
+            try:
+                return pd.api.types.union_categoricals(chunks)
+            except TypeError:
+                # categories of different dtypes (e.g. int and str) can't be unioned
+                return pd.Categorical(np.concatenate([np.asarray(chunk, dtype=object) for chunk in chunks]))
+        try:
+            return np.concatenate(chunks)
+        except TypeError:
+            # chunks of dtypes numpy can't combine (e.g. datetimes and numbers) are left to the cast
+            return np.concatenate([np.asarray(chunk, dtype=object) for chunk in chunks])
+
 class StrictDataFrame(Printable):
     
     # StrictDataFrame itself is kind of like a basic type
@@ -100,7 +651,14 @@ class StrictDataFrame(Printable):
     # Dataframe with immutable column names and colum data types
     # Purpose: construct a new type of dataframe that garuntees presensce of specific column names and data types
 
-    def __init__(self, columns: StringTypeTupleList = [], dataframe: DataFrame = DataFrame()) -> None:
+    def __init__(
+        self, 
+        columns: Union[StringTypeTupleList, Schema] = [], 
+        dataframe: Union[DataFrame, 'StrictDataFrame'] = DataFrame(), 
+        shallow_copy: bool = False,
+        inference: TypeInference = TypeInference(),
+        parallel: ParallelCasting = ParallelCasting()
+    ) -> None:
 
         # names: Union[StringSet, TypeDict] = set()
         # column_order: List[str] = []
@@ -118,87 +676,228 @@ class StrictDataFrame(Printable):
         # (in which case data types per column is inferred) or a strict type dictionary (TypeDict) that
         # contians both the names of columns and the data type for each column, in which case the 
         # specified types will be enforced
+
+        # 'columns' parameter:
+        # either a StringTypeTupleList or an already compiled Schema. A list is compiled into a
+        # (cached) Schema, so repeated constructions with the same columns share one Schema object
+
+        # 'dataframe' parameter:
+        # may also be another StrictDataFrame (e.g. the result of StrictDataFrame.append), in which
+        # case its (possibly still buffered) value is shared rather than rebuilt, as long as the
+        # columns match
+
+        # 'shallow_copy' parameter:
+        # in scenario 3, a dataframe that already conforms to the columns (same names, same order,
+        # same data types) is wrapped as is, without any copy. This means the StrictDataFrame and the
+        # caller share the same DataFrame object. If shallow_copy is set, a shallow copy (a new
+        # DataFrame object over the same column data) is wrapped instead: columns added, dropped or
+        # replaced on either side don't show in the other, but values written in place still do.
+        # Pass dataframe.copy() for a fully independent StrictDataFrame.
+        # getConstructionPath() reports which path was taken
+
+        # 'inference' parameter:
+        # controls how column types are inferred (scenarios 0B and 2), see TypeInference
+
+        # 'parallel' parameter:
+        # opt-in multi-core validation & casting of large dataframes, see ParallelCasting.
+        # Also applies when the buffered appends of this StrictDataFrame are concatenated
         
-        names: TypeDict = { name: datatype for name, datatype in columns}
-        column_order: List[str] = [name for name, _ in columns]
+        schema: Schema = Schema.compile(columns)
+        self.__parallel: ParallelCasting = parallel
+
+        # append buffer (see StrictDataFrame.append); unused until the first append
+        self.__buffer: Optional[_ColumnChunkBuffer] = None
+        self.__chunks: int = 0
+
+        if isinstance(dataframe, StrictDataFrame):
+            if schema is dataframe.__schema:
+                self.__value: Optional[DataFrame] = dataframe.__value
+                self.__schema: Schema = schema
+                self.__buffer = dataframe.__buffer
+                self.__chunks = dataframe.__chunks
+                self.__path: str = "shared"
+                return
+            dataframe = dataframe.getValue()
         
-        self.__value: DataFrame = dataframe  
-        self.__index: TypeDict = self._inferTypeDict(names=names, dataframe=dataframe) 
+        self.__value = dataframe  
+        self.__schema = self._inferSchema(schema=schema, dataframe=dataframe, inference=inference) 
         
-        if(len(names) == 0 and len(dataframe) == 0):
+        if(len(schema) == 0 and len(dataframe) == 0):
             # scenario 0A or 0B (same treatment)
             self.__value = dataframe
-        elif(len(names) > 0 and len(dataframe) == 0):
+            self.__path = "empty"
+        elif(len(schema) > 0 and len(dataframe) == 0):
             # scenario 1
-            self.__value = self._buildValueFromNames(index=self.__index)
-        elif(len(names) == 0 and len(dataframe) > 0):
-            # scenario 2
-            self.__value = dataframe
+            self.__value = self._buildValueFromNames(schema=self.__schema)
+            self.__path = "names"
+        elif(len(schema) == 0 and len(dataframe) > 0):
+            # scenario 2 (only casts when the inferred type is more compact than the data, 
+            # e.g. 'category' or downcast numbers)
+            self.__schema, self.__value = self._castInferredTypes(schema=self.__schema, dataframe=dataframe)
+            self.__path = "dataframe"
+        elif(self._conformsTo(schema=self.__schema, dataframe=dataframe)):
+            # scenario 3, fast path: nothing to select, reorder or cast
+            self.__value = dataframe.copy(deep=False) if shallow_copy else dataframe
+            self.__path = "shallow_copy" if shallow_copy else "zero_copy"
         else:
-            # scenario 3
-            self.__value = self._buildValueFromNamesAndDataframe(index=self.__index, dataframe=dataframe)
-        
-        if(len(column_order) > 0):
-            # if column order is defined, sort columns of underlying dataframe
-            ordered_names = list(filter(lambda colname: colname in list(names), column_order))
-            remaining_names = np.setdiff1d(list(names),ordered_names).tolist()
-            self.__value = self.__value.reindex(ordered_names + remaining_names, axis=1)
+            # scenario 3 (the rebuilt dataframe is already in column order)
+            self.__value = self._buildValueFromNamesAndDataframe(schema=self.__schema, dataframe=dataframe)
+            self.__path = "rebuild"
 
     def _indexToNames(self, index: TypeDict) -> StringSet:
         return set(index.keys())
 
-    def _inferTypeDict(self, names: TypeDict, dataframe: DataFrame) -> TypeDict:
+    def _inferSchema(self, schema: Schema, dataframe: DataFrame, inference: TypeInference) -> Schema:
+        if len(schema) > 0:
+            return schema
+        return Schema.compile(list(self._inferTypeDict(names={}, dataframe=dataframe, inference=inference).items()))
+
+    def _inferTypeDict(self, names: TypeDict, dataframe: DataFrame, inference: TypeInference = TypeInference()) -> TypeDict:
 
         if(len(names) == 0):
             # if names are not defined, infer names & types from dataframe
-            # currently all types are set to 'str' by default
-            # TODO: more sophisticated type inference
-            return {name: str for name in list(dataframe.columns)}
+            # numeric, boolean, datetime and categorical columns keep a matching (compact) type,
+            # object columns are classified from a sample (see TypeInference)
+            return {name: inference.inferColumnType(dataframe[name]) for name in list(dataframe.columns)}
         else:
             # is TypeDict, statically type name as TypeDict
             return names
     
-    def _castColumnTypes(self, index: TypeDict, dataframe: DataFrame) -> DataFrame:
-        for colname in index.keys():
-            dataframe[[colname]] = dataframe[[colname]].apply(lambda ls: ls.astype(index[colname]))
-        return dataframe
+    def _castInferredTypes(self, schema: Schema, dataframe: DataFrame) -> Tuple[Schema, DataFrame]:
+        # types inferred from a sample (see TypeInference) may not hold for the whole column;
+        # the columns that can't be cast to their inferred type, or would lose values in the
+        # cast (e.g. 2.5 in a column sampled as int), are stored as 'str' instead
+        try:
+            value = self._castColumnTypes(schema=schema, dataframe=dataframe)
+            if all(_keepsValues(dataframe[name], value[name]) for name in schema.getOrder()):
+                return schema, value
+        except ValueError:
+            pass
+        dtype_map = schema.getDtypeMap()
+        relaxed = Schema.compile([
+            (name, datatype if _castsLosslessly(dataframe[name], dtype_map[name]) else str) for name, datatype in schema.getColumns()
+        ])
+        return relaxed, self._castColumnTypes(schema=relaxed, dataframe=dataframe)
+
+    def _conformsTo(self, schema: Schema, dataframe: DataFrame) -> bool:
+        # cheap checks first: column names & order, then data types
+        if tuple(dataframe.columns) != schema.getOrder():
+            return False
+        dtype_map = schema.getDtypeMap()
+        return all(_hasDtype(dataframe[colname], dtype_map[colname]) for colname in schema.getOrder())
+
+    def _castColumnTypes(self, schema: Schema, dataframe: DataFrame) -> DataFrame:
+        # all columns are converted by a single astype() call (or one per part, see ParallelCasting), 
+        # using a dtype mapping that only contains the columns whose dtype does not already match the schema
+        if self.__parallel.appliesTo(dataframe):
+            return self.__parallel.cast(dataframe=dataframe, dtype_map=schema.getDtypeMap())
+        return _castFrame(dataframe=dataframe, dtype_map=schema.getDtypeMap())
 
-    def _buildValueFromNames(self, index: TypeDict) -> DataFrame:
+    def _buildValueFromNames(self, schema: Schema) -> DataFrame:
         return self._castColumnTypes(
-            index = index, 
-            dataframe = DataFrame(columns=self._indexToNames(index))
+            schema = schema, 
+            dataframe = DataFrame(columns=list(schema.getOrder()))
         )
         
-    def _buildValueFromNamesAndDataframe(self, index: TypeDict, dataframe: DataFrame) -> DataFrame:
-        names: StringSet = self._indexToNames(index)
-        extracted_names = pd.Series(list(dataframe))
-        matching_names = extracted_names[extracted_names.isin(names)]
-        df_names = self._castColumnTypes(
-            index = index, 
-            dataframe = self._buildValueFromNames(index = index)
-        )
-        df_data = dataframe[matching_names] if len(matching_names) > 0 else DataFrame()
-        return pd.concat([df_names,df_data], sort=True)
+    def _buildValueFromNamesAndDataframe(self, schema: Schema, dataframe: DataFrame) -> DataFrame:
+        # a single reindex keeps the overlapping columns, drops the others and adds the missing
+        # ones (as NaN) in declared order (skipped, as it copies, when the columns already are
+        # in that order); the result is then cast in one go
+        if tuple(dataframe.columns) != schema.getOrder():
+            dataframe = dataframe.reindex(columns = list(schema.getOrder()))
+        return self._castColumnTypes(schema=schema, dataframe=dataframe)
+
+    def getSchema(self) -> Schema:
+        return self.__schema
     
     def getIndex(self) -> TypeDict:
-        return self.__index
+        return dict(self.__schema.getIndex())
 
     def getColumns(self) -> StringTypeTupleList:
-        return [(name, self.__index[name]) for name in self.__index]
+        return self.__schema.getColumns()
 
     def getNames(self) -> StringSet:
-        return self._indexToNames(self.__index)
+        return set(self.__schema.getNames())
     
+    def getConstructionPath(self) -> str:
+        # how the underlying dataframe was obtained:
+        # "empty", "names", "dataframe" (scenarios 0, 1, 2), "zero_copy", "shallow_copy", "rebuild" (scenario 3),
+        # "append" (buffered append), "shared" (adopted from another StrictDataFrame) or "load"
+        return self.__path
+
     def getValue(self) -> DataFrame:
+        if self.__value is None:
+            # buffered appends are concatenated and cast only once, on first access
+            assert self.__buffer is not None
+            self.__value = self._castColumnTypes(
+                schema = self.__schema, 
+                dataframe = self.__buffer.concat(self.__chunks)
+            )
         return self.__value
+
+    def _appendBuffered(self, dataframes: List[DataFrame]) -> 'StrictDataFrame':
+        # a StrictDataFrame holding the chunks of self followed by 'dataframes' (see _ColumnChunkBuffer.appendAt)
+        buffer = self.__buffer
+        if buffer is None:
+            buffer = _ColumnChunkBuffer(self.__schema)
+            buffer.extend(self.getValue())
+            self.__buffer, self.__chunks = buffer, buffer.getLength()
+        buffer, chunks = buffer.appendAt(self.__chunks, dataframes)
+        return StrictDataFrame._wrap(schema=self.__schema, value=None, path="append", buffer=buffer, chunks=chunks, parallel=self.__parallel)
     
     def append(self, other: 'StrictDataFrame') -> 'StrictDataFrame':
         # alwyas persist the column names of self
-        return StrictDataFrame(
-            columns = self.getColumns(), 
-            dataframe = self.getValue().append(other.getValue(), sort=True)
-        )
+        if len(self.__schema) == 0:
+            return StrictDataFrame(dataframe = pd.concat([self.getValue(), other.getValue()], sort=True))
+        # 'other' is only buffered; concatenation and casting is deferred until getValue()
+        # so that N successive appends cost O(N) rather than O(N^2) copies
+        return self._appendBuffered([other.getValue()])
+
+    @staticmethod
+    def concat(frames: List['StrictDataFrame']) -> 'StrictDataFrame':
+        # appends all frames onto the first one in one go (persisting the columns of the first);
+        # like append, the concatenation and cast only happen once, on getValue()
+        if len(frames[0].__schema) == 0:
+            return StrictDataFrame(dataframe = pd.concat([frame.getValue() for frame in frames], sort=True))
+        return frames[0]._appendBuffered([frame.getValue() for frame in frames[1:]])
+
+    @staticmethod
+    def _wrap(
+        schema: Schema, 
+        value: Optional[DataFrame], 
+        path: str, 
+        buffer: Optional[_ColumnChunkBuffer] = None, 
+        chunks: int = 0,
+        parallel: ParallelCasting = ParallelCasting()
+    ) -> 'StrictDataFrame':
+        # builds a StrictDataFrame around a value that is already known to conform to schema
+        # (or around the first 'chunks' chunks of a buffer that will produce such a value), 
+        # bypassing all constructor checks
+        wrapped = StrictDataFrame.__new__(StrictDataFrame)
+        wrapped.__value = value
+        wrapped.__schema = schema
+        wrapped.__buffer = buffer
+        wrapped.__chunks = chunks
+        wrapped.__path = path
+        wrapped.__parallel = parallel
+        return wrapped
     
+    def save(self, path: str) -> None:
+        # writes the value as a directory of per-column .npy files with the schema embedded
+        _saveDataFrame(path=path, schema=self.__schema, dataframe=self.getValue())
+
+    @staticmethod
+    def load(path: str, columns: Optional[Union[StringTypeTupleList, Schema]] = None, memory_map: bool = True) -> 'StrictDataFrame':
+        # reads a StrictDataFrame written by save(); numeric, bool, datetime and categorical columns
+        # are memory-mapped (read-only) unless memory_map is False
+        # if columns are given, the saved schema must match them exactly. A matching file is
+        # wrapped without any cast (see 'zero_copy' path of the constructor)
+        saved_schema, dataframe = _loadDataFrame(path=path, memory_map=memory_map)
+        if columns is not None and Schema.compile(columns) is not saved_schema:
+            raise ValueError("Saved schema " + repr(saved_schema) + " does not match " + repr(Schema.compile(columns)))
+        # columns were written from a value conforming to saved_schema: no need to check or cast again
+        return StrictDataFrame._wrap(schema=saved_schema, value=dataframe, path="load")
+
     def _asString(self) -> str:
         return "StrictDataFrame:\n" + str(self.getValue())
 
@@ -213,6 +912,12 @@ class HasStrictDataframe(Printable):
     def getValue(self) -> DataFrame:
         return self.__value.getValue()
 
+    def getStrictDataFrame(self) -> StrictDataFrame:
+        return self.__value
+
+    def getSchema(self) -> Schema:
+        return self.__value.getSchema()
+
     def getIndex(self) -> TypeDict:
         return self.__value.getIndex()
 
@@ -222,9 +927,80 @@ class HasStrictDataframe(Printable):
     def _asString(self) -> str:
         return self.__classname + ":\n" + str(self.getValue())
 
-    def _appendInternal(self, other: 'HasStrictDataframe') -> DataFrame:
-        return self.getValue().append(other.getValue(), sort=True)
+    def save(self, path: str) -> None:
+        self.__value.save(path)
+
+    @classmethod
+    def load(cls, path: str, memory_map: bool = True) -> Any:
+        # subclasses are expected to take the dataframe as their only constructor argument
+        # (as BrowserSessionLogsDataFrame and the generated *DataFrame classes do);
+        # the file is validated against the columns declared by the subclass
+        construct: Callable[..., Any] = cls
+        declared_schema = construct().getSchema()
+        return construct(StrictDataFrame.load(path=path, columns=declared_schema, memory_map=memory_map))
+
+    @staticmethod
+    def _concatInternal(values: Sequence['HasStrictDataframe']) -> StrictDataFrame:
+        # bulk version of _appendInternal, e.g. for implementing mconcat_many
+        return StrictDataFrame.concat([value.getStrictDataFrame() for value in values])
+
+    def _appendInternal(self, other: 'HasStrictDataframe') -> StrictDataFrame:
+        # returns the (lazily concatenated) StrictDataFrame, which subclasses can pass
+        # straight back into their constructor as 'dataframe'
+        return self.__value.append(other.getStrictDataFrame())
     
     @abstractmethod
     def append(self, other):
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+class NamedStrictDataFrame(HasStrictDataframe, Monoid):
+    # a StrictDataFrame stored in a CumulativeMonoidSet under a name of its own rather than its
+    # class name, so frames of different shapes can be collected side by side without declaring
+    # a HasStrictDataframe subclass for each (e.g. the tables deposited by Do.extractTable);
+    # frames of the same name are appended to one another
+    def __init__(self, name: str = "", value: StrictDataFrame = StrictDataFrame()) -> None:
+        super(NamedStrictDataFrame, self).__init__(classname = name, value = value)
+        self.__name: str = name
+
+    def getName(self) -> str:
+        return self.__name
+
+    def getMonoidKey(self) -> str:
+        return self.__name
+
+    def save(self, path: str) -> None:
+        # the name is kept next to the columns (the schema is already embedded by StrictDataFrame.save)
+        super(NamedStrictDataFrame, self).save(path)
+        with open(os.path.join(path, _NAME_FILE), "w") as name_file:
+            json.dump({"name": self.__name}, name_file)
+
+    @classmethod
+    def load(cls, path: str, memory_map: bool = True) -> 'NamedStrictDataFrame':
+        # name and columns are those saved, there is no declared schema to validate against
+        with open(os.path.join(path, _NAME_FILE), "r") as name_file:
+            name = json.load(name_file)["name"]
+        return NamedStrictDataFrame(name, StrictDataFrame.load(path=path, memory_map=memory_map))
+
+    def __isIdentity(self) -> bool:
+        return self.__name == "" and len(self.getSchema()) == 0
+
+    def append(self, other: 'NamedStrictDataFrame') -> 'NamedStrictDataFrame':
+        if other.__isIdentity():
+            return self
+        if self.__isIdentity():
+            return other
+        return NamedStrictDataFrame(self.__name, self._appendInternal(other))
+
+    @classmethod
+    def mconcat_many(cls, values: List['NamedStrictDataFrame']) -> 'NamedStrictDataFrame':
+        values = [value for value in values if not value.__isIdentity()]
+        if len(values) == 0:
+            return NamedStrictDataFrame()
+        return NamedStrictDataFrame(values[0].__name, HasStrictDataframe._concatInternal(values))
+
+    @staticmethod
+    def mzero() -> 'NamedStrictDataFrame':
+        return NamedStrictDataFrame()
+
+    def mplus(self, other: 'NamedStrictDataFrame') -> 'NamedStrictDataFrame':
+        return self.append(other)
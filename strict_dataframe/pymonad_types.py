@@ -11,6 +11,9 @@ from .generic_types import *
 
 class Container(object):
 	""" Represents a wrapper around an arbitrary value and a method to access it. """
+	# containers are allocated constantly (every Just, every Reader), so the whole hierarchy
+	# uses __slots__: subclasses declare their own (usually empty) __slots__ to stay dict-free
+	__slots__ = ('value',)
 
 	def __init__(self, value):
 		""" 
@@ -30,6 +33,8 @@ class Container(object):
 
 class Functor(Container):
 	""" Represents a type of values which can be "mapped over." """
+	__slots__ = ()
+
 
 	def __init__(self, value):
 		""" Stores 'value' as the contents of the Functor. """
@@ -66,6 +71,8 @@ class Applicative(Functor):
 	a type like integers, strings, etc.
 
 	"""
+	__slots__ = ()
+
 
 	def __init__(self, function):
 		""" Stores 'function' as the functors value. """
@@ -92,6 +99,8 @@ class Monad(Applicative):
 	while maintaining the context of that specific monad.
 
 	"""
+	__slots__ = ()
+
 
 	def __init__(self, value):
 		""" Wraps 'value' in the Monad's context. """
@@ -122,6 +131,8 @@ class Monad(Applicative):
 
 class Reader(Monad):
 	""" Represents a Functor for functions allowing authors to map functions over other functions. """
+	__slots__ = ()
+
 
 	def __init__(self, functionOrValue) -> None:
 		""" 
@@ -216,6 +227,68 @@ class Reader(Monad):
 	def unit(cls, value):
 		return Reader(lambda _: value)
 
+class _CurriedFunction(Reader):
+	"""
+	A curried function: the target function together with the arguments accumulated so far.
+
+	Partially applying a curried function returns a new (compact) _CurriedFunction holding
+	the extended argument tuple; once all arguments are supplied the target function is called
+	directly with them. Arguments can be supplied positionally or by keyword, in any number
+	of steps:
+		func(1, 2, 3)
+		func(1)(2, 3)
+		func(1, z=3)(2)
+		func(x=1)(y=2)(z=3)
+
+	"""
+	__slots__ = ('function', 'arity', 'names', 'args', 'kwargs')
+
+	def __init__(self, function, arity, names, args=(), kwargs={}):
+		# Reader.__init__ is not called: a curried function is its own value (see 'value' below)
+		self.function = function
+		self.arity = arity
+		self.names = names
+		self.args = args
+		self.kwargs = kwargs
+
+	@property
+	def value(self):
+		""" The function stored by the Reader: applying it to one argument partially applies self. """
+		return self
+
+	def __call__(self, *args, **kwargs):
+		"""
+		Applies arguments to the curried function.
+
+		Returns the result of the function if all arguments are passed. If fewer than
+		the full argument set is passed in, returns a curried function which expects the
+		remaining arguments.
+
+		"""
+		args = self.args + args
+		if kwargs:
+			kwargs = dict(self.kwargs, **kwargs)
+		else:
+			kwargs = self.kwargs
+		supplied = len(args)
+		if kwargs:
+			supplied += sum(1 for name in self.names[len(args):] if name in kwargs)
+		if supplied < self.arity:
+			return _CurriedFunction(self.function, self.arity, self.names, args, kwargs)
+
+		result = self.function(*args[:self.arity], **kwargs)
+		for a in args[self.arity:]:
+			# surplus arguments are applied to the (curried) function returned by the target
+			try:
+				result = result(a)
+			except TypeError:
+				raise TypeError("Too many arguments supplied to curried function.")
+
+		if callable(result) and not isinstance(result, Reader):
+			# a function returned by a fully applied function is still usable as a Reader
+			return Reader(result)
+		return result
+
 # def curry(aFunction: Callable[[]]) -> Callable[[]]:
 def curry(aFunction: Callable):
 	""" 
@@ -226,29 +299,14 @@ def curry(aFunction: Callable):
 		def add(x, y): return x + y
 
 	"""
-	# funcName = aFunction.__code__.co_name
-	# numArgs = aFunction.__code__.co_argcount
-	argTypes = aFunction.__annotations__
-	argNames = aFunction.__code__.co_varnames 
-	# print(argTypes)
-	# print(argNames)
-	def buildReader(argValues, numArgs): #argTypes
-		if (numArgs == 0): 
-			# if all arguments have been collected, 
-			# call the original function (captured in closure) 
-			# with the accumulated arguments (argValues):
-			return aFunction(*argValues) 
-		else:
-			# else return a function that takes one function,
-			# that partially applies function and returns a reader monad
-			# that progressively asks for the remaining arguments:
-			return lambda x: buildReader(argValues + [x], numArgs - 1)
-
-	return Reader(buildReader(
-			argValues = [], 
-			numArgs   = aFunction.__code__.co_argcount
-			# argTypes  = aFunction.__annotations__
-	))
+	numArgs = aFunction.__code__.co_argcount
+	if (numArgs == 0):
+		return Reader(aFunction())
+	return _CurriedFunction(
+		function = aFunction, 
+		arity    = numArgs, 
+		names    = aFunction.__code__.co_varnames[:numArgs]
+	)
 
 
 class Monoid(Container):
@@ -264,6 +322,8 @@ class Monoid(Container):
 	   In the case of strings, mzero = "" (the empty string) and mplus = + (concatenation).
 
 	"""
+	__slots__ = ()
+
 
 	def __init__(self, value):
 		""" Initializes the monoid element to 'value'.  """
@@ -292,6 +352,9 @@ class Monoid(Container):
 		Where 'x', 'y', and 'z' are monoid values, '0' is the mzero (the identity value) and '+' 
 		is mplus.
 
+		Subclasses that can combine many values more cheaply than one mplus at a time may
+		also define a classmethod 'mconcat_many(values)', which mconcat will then use.
+
 		"""
 		raise NotImplementedError
 
@@ -326,11 +389,23 @@ def mconcat(monoid_list):
 	Takes a list of monoid values and reduces them to a single value by applying the
 	mplus operation to each all elements of the list.
 
+	If the type of the first value has a 'mconcat_many' classmethod, the whole list is handed 
+	to it so the values can be combined in one shot (e.g. a single concatenation for monoids
+	backed by dataframes). Otherwise the values are combined pairwise as a balanced tree, so
+	each value takes part in O(log n) mplus operations instead of up to n.
+
 	"""
-	result = mzero(monoid_list[0])
-	for value in monoid_list:
-		result += value
-	return result
+	mconcat_many = getattr(type(monoid_list[0]), 'mconcat_many', None)
+	if mconcat_many is not None:
+		return mconcat_many(list(monoid_list))
+	values = list(monoid_list)
+	if len(values) == 1:
+		return mzero(values[0]) + values[0]
+	while len(values) > 1:
+		# neighbours are combined in order, so only associativity is relied upon
+		paired = [values[i] + values[i + 1] for i in range(0, len(values) - 1, 2)]
+		values = paired + values[-1:] if len(values) % 2 == 1 else paired
+	return values[0]
 
 class Maybe(Monad, Monoid, Generic[T]):
 	""" 
@@ -339,6 +414,8 @@ class Maybe(Monad, Monoid, Generic[T]):
 	of 'Maybe' values: Just(something) and Nothing. 
 
 	"""
+	__slots__ = ()
+
 
 	def __init__(self, value) -> None:
 		"""
@@ -363,6 +440,8 @@ class Maybe(Monad, Monoid, Generic[T]):
 
 class Just(Maybe[T]):
 	""" The 'Maybe' type used to represent a calculation that has succeeded. """
+	__slots__ = ()
+
 
 	def __init__(self, value:T) -> None:
 		"""
@@ -370,7 +449,8 @@ class Just(Maybe[T]):
 		'value' can be any type of value, including functions.
 
 		"""
-		super(Maybe, self).__init__(value)
+		# set directly rather than through the (5 deep) chain of super().__init__ calls
+		self.value = value
 
 	def __str__(self):
 		return "Just " + str(self.getValue())
@@ -386,7 +466,7 @@ class Just(Maybe[T]):
 
 	def fmap(self, function):
 		""" Applies 'function' to the 'Just' value and returns a new 'Just' value. """
-		return Just(function(self.getValue()))
+		return Just(function(self.value))
 
 	def amap(self, functorValue):
 		""" 
@@ -402,7 +482,7 @@ class Just(Maybe[T]):
 		either 'Just(something)' or 'Nothing'.
 
 		"""
-		return function(self.getValue())
+		return function(self.value)
 
 	def mplus(self, other):
 		"""
@@ -423,8 +503,17 @@ class Just(Maybe[T]):
 
 class _Nothing(Maybe):
 	""" The 'Maybe' type used to represent a calculation that has failed. """
+	__slots__ = ()
+
+	def __new__(cls, value=None):
+		""" There is only one Nothing: every _Nothing() returns the module-level singleton. """
+		try:
+			return Nothing
+		except NameError:
+			return super(_Nothing, cls).__new__(cls)
+
 	def __init__(self, value=None):
-		super(Maybe, self).__init__(value)
+		self.value = None
 
 	def __str__(self):
 		return "Nothing"
@@ -473,6 +562,8 @@ class First(Monoid):
 	find the first non-failure value in a collection of values which may fail.
 
 	"""
+	__slots__ = ()
+
 	def __init__(self, value):
 		"""
 		Only accepts instances of the 'Maybe' monad for value. Raises 'TypeError' if
@@ -488,7 +579,7 @@ class First(Monoid):
 	@staticmethod
 	def mzero():
 		""" Returns the identity element (First(Nothing)) for the Maybe Monoid.  """
-		return First(Nothing)
+		return _FirstNothing
 
 	def mplus(self, other):
 		"""
@@ -505,6 +596,8 @@ class Last(Monoid):
 	find the final non-failure value in a collection of values which may fail.
 
 	"""
+	__slots__ = ()
+
 	def __init__(self, value):
 		"""
 		Only accepts instances of the 'Maybe' monad for value. Raises 'TypeError' if
@@ -520,7 +613,7 @@ class Last(Monoid):
 	@staticmethod
 	def mzero():
 		""" Returns the identity element (Last(Nothing)) for the Maybe Monoid.  """
-		return First(Nothing)
+		return _LastNothing
 
 	def mplus(self, other):
 		"""
@@ -530,3 +623,7 @@ class Last(Monoid):
 		"""
 		if isinstance(other.value, Just): return other
 		else: return self
+
+# the identity elements never change, so they are allocated once
+_FirstNothing = First(Nothing)
+_LastNothing = Last(Nothing)
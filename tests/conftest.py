@@ -0,0 +1,9 @@
+import pytest
+from browser_module import setLogSink
+
+@pytest.fixture(autouse=True)
+def silentLogSink():
+    # logged browser actions print by default; tests only look at the session logs
+    previous = setLogSink(None)
+    yield
+    setLogSink(previous)
@@ -0,0 +1,130 @@
+# In-memory stand-in for a selenium WebDriver: no browser, but the calls browser_module makes
+# (get, find_elements, execute_script, switch_to, cookies, quit, title) are answered and counted.
+from typing import Any, Dict, List, Optional, Tuple
+import re
+import time
+
+from selenium.common.exceptions import StaleElementReferenceException, WebDriverException
+from selenium.webdriver.remote.webelement import WebElement as SeleniumWebElement
+from browser_module.browser_cache import _RESOLVE_SCRIPT, _scriptLocator
+
+class FakeWebElement(SeleniumWebElement):
+    # subclasses selenium's WebElement so isinstance checks (wait conditions, cache) accept it
+    def __init__(self, name: str) -> None:
+        self._parent = None
+        self._id = name
+        self.clicks: int = 0
+        self.keys: List[str] = []
+        self.stale: bool = False
+
+    @property
+    def text(self) -> str:
+        return self._id
+
+    def click(self) -> None:
+        if self.stale:
+            raise StaleElementReferenceException("stale element")
+        self.clicks += 1
+
+    def send_keys(self, *keys: str) -> None:
+        if self.stale:
+            raise StaleElementReferenceException("stale element")
+        self.keys.extend(keys)
+
+    def find_element(self, by: Optional[str] = None, value: Optional[str] = None) -> 'FakeWebElement':
+        return FakeWebElement(self._id + "/" + str(value))
+
+class FakeSwitchTo:
+    def __init__(self) -> None:
+        self.frames: List[Any] = []
+
+    def frame(self, frame_element: Any) -> None:
+        self.frames.append(frame_element)
+
+    def default_content(self) -> None:
+        self.frames = []
+
+class FakeWebDriver:
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency: float = latency
+        self.elements: Dict[Tuple[str, str], List[FakeWebElement]] = {}
+        self.script_results: List[Any] = []
+        self.switch_to: FakeSwitchTo = FakeSwitchTo()
+        self.visited: List[str] = []
+        self.dead: bool = False
+        self.title_reads: int = 0
+        self.find_calls: int = 0
+        self.script_calls: int = 0
+        self.cookies_cleared: int = 0
+        self.quit_calls: int = 0
+
+    def addElements(self, by: str, value: str, count: int = 1) -> List[FakeWebElement]:
+        elements = [FakeWebElement(value + "#" + str(i)) for i in range(count)]
+        self.elements[(by, value)] = elements
+        return elements
+
+    def _command(self, name: str) -> None:
+        # every call that would reach the browser
+        if self.dead:
+            raise WebDriverException("browser has gone away")
+
+    @property
+    def title(self) -> str:
+        self.title_reads += 1
+        self._command("title")
+        return "fake"
+
+    def get(self, url: str) -> None:
+        self._command("get")
+        if self.latency > 0:
+            time.sleep(self.latency)
+        self.visited.append(url)
+
+    def find_elements(self, by: Optional[str] = None, value: Optional[str] = None) -> List[FakeWebElement]:
+        self._command("find_elements")
+        self.find_calls += 1
+        return list(self.elements.get((by, value), []))
+
+    def execute_script(self, script: str, *args: Any) -> Any:
+        self._command("execute_script")
+        self.script_calls += 1
+        if script == _RESOLVE_SCRIPT:
+            located = {_scriptLocator(find): elements for find, elements in self.elements.items()}
+            return [
+                None if kind == "css" and re.match(r"\.[0-9]", query) else # <- invalid selector, e.g. '.1st'
+                matches[0] if len(matches) == 1 else len(matches)
+                for kind, query, matches in [(kind, query, located.get((kind, query), [])) for kind, query in args[0]]
+            ]
+        return self.script_results.pop(0) if len(self.script_results) > 0 else None
+
+    def delete_all_cookies(self) -> None:
+        self._command("delete_all_cookies")
+        self.cookies_cleared += 1
+
+    def quit(self) -> None:
+        self.quit_calls += 1
+        self.dead = True
+
+    def crash(self) -> None:
+        # the browser goes away without quit()
+        self.dead = True
+
+class FakeRemoteWebDriver(FakeWebDriver):
+    # a FakeWebDriver whose calls all go through execute(), as those of selenium's remote WebDriver
+    # do, so SafeWebDriver counts them one by one
+    def execute(self, command: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        super(FakeRemoteWebDriver, self)._command(command)
+        return {}
+
+    def _command(self, name: str) -> None:
+        self.execute(name)
+
+class FakeChromeDriver(FakeWebDriver):
+    # a FakeWebDriver that also takes Chrome DevTools protocol commands
+    def __init__(self, latency: float = 0.0) -> None:
+        super(FakeChromeDriver, self).__init__(latency)
+        self.cdp_commands: List[str] = []
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: Dict[str, Any]) -> Dict[str, Any]:
+        self.cdp_commands.append(cmd)
+        return {}
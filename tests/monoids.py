@@ -0,0 +1,29 @@
+# Small monoids for tests: string concatenation (not commutative, so the order of combination
+# shows), counting every mplus
+from strict_dataframe import Monoid
+
+class Text(Monoid):
+    __slots__ = ()
+    mplus_calls = 0
+
+    def __init__(self, value: str = "") -> None:
+        super(Text, self).__init__(value)
+
+    @staticmethod
+    def mzero() -> 'Text':
+        return Text()
+
+    def mplus(self, other: 'Text') -> 'Text':
+        Text.mplus_calls += 1
+        return type(self)(self.value + other.value)
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and self.value == other.value
+
+class OtherText(Text):
+    # keyed apart from Text in a CumulativeMonoidSet (values are keyed by class name)
+    __slots__ = ()
+
+    @staticmethod
+    def mzero() -> 'OtherText':
+        return OtherText()
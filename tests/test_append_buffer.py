@@ -0,0 +1,55 @@
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+from strict_dataframe import StrictDataFrame
+
+_COLUMNS = [("n", int), ("x", float), ("label", str), ("at", "datetime64[ns]")]
+
+def _frame(start, rows):
+    return pd.DataFrame({
+        "n": np.arange(start, start + rows),
+        "x": np.arange(start, start + rows) / 2,
+        "label": ["r" + str(i) for i in range(start, start + rows)],
+        "at": pd.date_range("2020-01-01", periods=rows) + pd.Timedelta(days=start)
+    })
+
+def _strict(start, rows):
+    return StrictDataFrame(_COLUMNS, _frame(start, rows))
+
+def testAppendsMatchOneConcat():
+    result = _strict(0, 3)
+    for start in range(3, 30, 3):
+        result = result.append(_strict(start, 3))
+    expected = pd.concat([_frame(start, 3) for start in range(0, 30, 3)])
+    pd.testing.assert_frame_equal(result.getValue(), expected)
+    assert result.getConstructionPath() == "append"
+
+def testConcatMatchesSuccessiveAppends():
+    frames = [_strict(start, 2) for start in range(0, 10, 2)]
+    appended = frames[0]
+    for frame in frames[1:]:
+        appended = appended.append(frame)
+    pd.testing.assert_frame_equal(StrictDataFrame.concat(frames).getValue(), appended.getValue())
+
+def testAppendingTwiceToOneFrameBranches():
+    base = _strict(0, 2)
+    left = base.append(_strict(10, 1))
+    right = base.append(_strict(20, 1))
+    assert left.getValue()["n"].tolist() == [0, 1, 10]
+    assert right.getValue()["n"].tolist() == [0, 1, 20]
+    assert base.getValue()["n"].tolist() == [0, 1]
+
+def testMissingColumnsAreFilledWithMissingValues():
+    partial = StrictDataFrame([("x", float), ("label", str)], _frame(5, 2)[["x", "label"]])
+    result = StrictDataFrame([("x", float), ("at", "datetime64[ns]")], _frame(0, 2)[["x", "at"]]).append(partial)
+    value = result.getValue()
+    assert str(value["at"].dtype) == "datetime64[ns]"
+    assert value["at"].isna().tolist() == [False, False, True, True]
+    assert value["x"].tolist() == [0.0, 0.5, 2.5, 3.0]
+
+def testConcurrentAppendsToOneFrame():
+    base = _strict(0, 1)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda start: base.append(_strict(start, 1)), range(1, 200)))
+    for start, result in zip(range(1, 200), results):
+        assert result.getValue()["n"].tolist() == [0, start]
@@ -0,0 +1,52 @@
+import asyncio
+import threading
+from selenium.webdriver.common.by import By
+from browser_module import SafeWebDriver, BrowserSession, Do, AsyncDo, compose, composeAsync
+from .fake_driver import FakeWebDriver
+
+_BUTTON = (By.ID, "button")
+
+class _ThreadRecordingDriver(SafeWebDriver):
+    # records the threads the liveness checks (the first WebDriver call of every step) run on
+    def __init__(self, handle):
+        super(_ThreadRecordingDriver, self).__init__(handle)
+        self.threads = set()
+
+    def isUsable(self, ignore_error=False):
+        self.threads.add(threading.get_ident())
+        return super(_ThreadRecordingDriver, self).isUsable(ignore_error)
+
+def _present(find):
+    return lambda handle: handle.find_elements(*find)
+
+def _run(steps):
+    handle = FakeWebDriver()
+    handle.addElements(*_BUTTON)
+    driver = _ThreadRecordingDriver(handle)
+    async def __main():
+        session = await composeAsync(steps)(BrowserSession(driver).getValue())
+        return session, threading.get_ident()
+    session, loop_thread = asyncio.run(__main())
+    return session, driver, loop_thread
+
+def testDriverCallsStayOffTheEventLoop():
+    session, driver, loop_thread = _run([Do.goToUrl("a"), AsyncDo.wait(0.01), AsyncDo.waitUntil(_BUTTON, _present, within=1)])
+    assert not session.hasError()
+    assert len(driver.threads) > 0
+    assert loop_thread not in driver.threads
+    assert session.getLogs().getValue()["log"].tolist() == ["Complete"] * 3
+
+def testLoggedSecondsIncludeTheWait():
+    session, _, _ = _run([AsyncDo.wait(0.2)])
+    assert session.getLogs().getValue()["seconds"].tolist()[0] >= 0.2
+
+def testUnmetConditionFailsTheStep():
+    session, _, _ = _run([AsyncDo.waitUntil((By.ID, "missing"), _present, within=0.2)])
+    assert session.hasError()
+    assert session.getLogs().getValue()["seconds"].tolist()[0] >= 0.2
+
+def testNestedPipelinesAreSpliced():
+    pipeline = composeAsync([compose([Do.goToUrl("a"), Do.goToUrl("b")]), composeAsync([AsyncDo.wait(0)])])
+    assert pipeline.getStepNames() == ["goToUrl(a)", "goToUrl(b)", "wait(0)"]
+    session, _, _ = _run(list(pipeline.getSteps()))
+    assert session.getLogs().getValue()["step"].tolist() == ["goToUrl(a)", "goToUrl(b)", "wait(0)"]
@@ -0,0 +1,110 @@
+import time
+import pytest
+import pandas as pd
+from strict_dataframe import StrictDataFrame, NamedStrictDataFrame, CumulativeMonoidSet
+from browser_module import SafeWebDriver, BrowserSessionPool, Do, compose
+from .fake_driver import FakeWebDriver
+
+def _recordUrl(driver, logs, data, element):
+    url = driver.apply(lambda handle: handle.visited[-1]).getValue()
+    visits = NamedStrictDataFrame("visits", StrictDataFrame([("url", str)], pd.DataFrame({"url": [url]})))
+    return (driver, logs, data + CumulativeMonoidSet([visits]), element)
+
+def _visit(url):
+    return compose([Do.goToUrl(url), Do.customBrowserFunction(_recordUrl)])
+
+def _crashBrowser(handle):
+    # the browser goes away in the middle of a step
+    handle.crash()
+    handle.get("about:blank")
+
+def _fakeDriver():
+    return SafeWebDriver(FakeWebDriver())
+
+def _visitedUrls(data):
+    return data.getValue()["visits"].getValue()["url"].tolist()
+
+def testRunMergesDataInInputOrder():
+    urls = ["u" + str(i) for i in range(12)]
+    with BrowserSessionPool(_fakeDriver, size=3) as pool:
+        data, logs = pool.run(_visit, urls)
+        assert pool.getDriverCount() <= 3
+    assert _visitedUrls(data) == urls
+    assert len(logs) == 2 * len(urls)
+
+def testDriversStartConcurrently():
+    def __slowDriver():
+        time.sleep(0.3)
+        return _fakeDriver()
+    with BrowserSessionPool(__slowDriver, size=4) as pool:
+        started = time.perf_counter()
+        pool.map(_visit, ["a", "b", "c", "d"])
+        elapsed = time.perf_counter() - started
+        assert pool.getDriverCount() == 4
+    assert elapsed < 0.9
+
+def testDeadDriverFreesItsSlot():
+    handles = []
+    def __trackedDriver():
+        handles.append(FakeWebDriver())
+        return SafeWebDriver(handles[-1])
+    def __crash(url):
+        return compose([Do.goToUrl(url), Do.customDriverFunction(_crashBrowser)])
+    with BrowserSessionPool(__trackedDriver, size=1) as pool:
+        pool.map(__crash, ["a"])
+        data, _ = pool.run(_visit, ["b", "c"])
+    assert _visitedUrls(data) == ["b", "c"]
+    assert len(handles) == 2
+    assert handles[0].quit_calls == 1
+
+def testFailingRelaunchDoesNotHideResults():
+    launches = []
+    def __onceOnlyDriver():
+        launches.append(1)
+        if len(launches) > 1:
+            raise RuntimeError("no more browsers")
+        return _fakeDriver()
+    def __crash(url):
+        return compose([Do.goToUrl(url), Do.customDriverFunction(_crashBrowser)])
+    with BrowserSessionPool(__onceOnlyDriver, size=1) as pool:
+        (data, logs), = pool.map(__crash, ["a"])
+        assert logs.getValue()["log"].tolist() == ["Complete", "Browser became unusable"]
+        with pytest.raises(RuntimeError):
+            pool.map(_visit, ["b"])
+
+def testProcessPoolCollectsFrameData():
+    urls = ["u" + str(i) for i in range(4)]
+    with BrowserSessionPool(_fakeDriver, size=2, use_processes=True) as pool:
+        data, logs = pool.run(_visit, urls)
+    assert _visitedUrls(data) == urls
+    assert len(logs) == 2 * len(urls)
+
+def _visitAndClose(url):
+    return compose([Do.goToUrl(url), Do.customBrowserFunction(_recordUrl), Do.closeBrowser])
+
+def testClosedDriverIsRelaunched():
+    urls = ["a", "b", "c"]
+    with BrowserSessionPool(_fakeDriver, size=1) as pool:
+        data, logs = pool.run(_visitAndClose, urls)
+        assert pool.getDriverCount() == 0
+    assert _visitedUrls(data) == urls
+    assert logs.getValue()["log"].tolist() == ["Complete", "Complete", "Browser became unusable"] * len(urls)
+
+def testProcessPoolRelaunchesClosedDriver():
+    urls = ["a", "b", "c"]
+    with BrowserSessionPool(_fakeDriver, size=1, use_processes=True) as pool:
+        data, logs = pool.run(_visitAndClose, urls)
+    assert _visitedUrls(data) == urls
+    assert logs.getValue()["log"].tolist() == ["Complete", "Complete", "Browser became unusable"] * len(urls)
+
+def testDriverIsResetBetweenInputs():
+    handle = FakeWebDriver()
+    def __enterFrame(handle):
+        handle.switch_to.frame("frame")
+    def __framed(url):
+        return compose([Do.goToUrl(url), Do.customDriverFunction(__enterFrame)])
+    with BrowserSessionPool(lambda: SafeWebDriver(handle), size=1) as pool:
+        pool.map(__framed, ["a", "b"])
+    assert handle.cookies_cleared == 2
+    assert handle.switch_to.frames == []
+    assert handle.visited == ["a", "about:blank", "b", "about:blank"]
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+from strict_dataframe import StrictDataFrame
+
+_COLUMNS = [("n", int), ("x", float), ("label", str), ("flag", bool), ("small", "int8")]
+
+def _frame():
+    return pd.DataFrame({
+        "label": [1, 2, 3],
+        "n": ["4", "5", "6"],
+        "x": [1.5, 2.5, 3.5],
+        "flag": [1, 0, 1],
+        "small": [7, 8, 9],
+        "dropped": ["a", "b", "c"]
+    })
+
+def _castColumnByColumn(frame, columns):
+    # reference: one astype per column, in declared order
+    return pd.DataFrame({name: frame[name].astype(datatype) for name, datatype in columns})
+
+def testSingleCastMatchesColumnByColumnCast():
+    frame = _frame()
+    strict = StrictDataFrame(_COLUMNS, frame)
+    pd.testing.assert_frame_equal(strict.getValue(), _castColumnByColumn(frame, _COLUMNS))
+    assert strict.getValue()["label"].tolist() == ["1", "2", "3"]
+
+def testMatchingColumnsAreNotCopied():
+    frame = pd.DataFrame({"n": ["1", "2"], "x": [0.5, 1.5]})
+    value = StrictDataFrame([("n", int), ("x", float)], frame).getValue()
+    assert value["n"].tolist() == [1, 2]
+    assert np.shares_memory(value["x"].to_numpy(), frame["x"].to_numpy())
+
+def testMissingColumnsAreAddedInDeclaredOrder():
+    value = StrictDataFrame([("x", float), ("extra", float)], _frame()).getValue()
+    assert list(value.columns) == ["x", "extra"]
+    assert value["extra"].isna().all()
+
+def testUncastableColumnIsNamed():
+    frame = _frame().assign(n=["4", "five", "6"])
+    with pytest.raises(ValueError, match="Column 'n'"):
+        StrictDataFrame(_COLUMNS, frame)
+    with pytest.raises(ValueError, match="Column 'missing'"):
+        StrictDataFrame([("missing", int)], _frame())
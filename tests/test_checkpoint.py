@@ -0,0 +1,62 @@
+import os
+import pytest
+import pandas as pd
+from selenium.webdriver.common.by import By
+from strict_dataframe import StrictDataFrame, NamedStrictDataFrame, CumulativeMonoidSet
+from browser_module import SafeWebDriver, BrowserSession, Do, compose
+from .fake_driver import FakeWebDriver
+
+_SEARCH = (By.ID, "search")
+
+def _record(label):
+    def __impure__record(driver, logs, data, element):
+        rows = NamedStrictDataFrame("rows", StrictDataFrame([("label", str)], pd.DataFrame({"label": [label]})))
+        return (driver, logs, data + CumulativeMonoidSet([rows]), element)
+    return Do.customBrowserFunction(__impure__record)
+
+def _pipeline(fail):
+    def flakyStep(handle):
+        if fail:
+            raise RuntimeError("browser hiccup")
+    return compose([
+        Do.goToUrl("http://example.com"),
+        Do.sendKeys("query")(_SEARCH),
+        _record("a"),
+        Do.customDriverFunction(flakyStep),
+        Do.sendKeys("more", _SEARCH),
+        _record("b")
+    ])
+
+def _fakeBrowserValue():
+    handle = FakeWebDriver()
+    element, = handle.addElements(*_SEARCH)
+    return handle, element, BrowserSession(SafeWebDriver(handle)).getValue()
+
+def testCurriedStepNamesAreStable():
+    names = _pipeline(False).getStepNames()
+    assert names == _pipeline(False).getStepNames()
+    assert names[1] == "sendKeys(" + str(_SEARCH) + ")"
+    assert not any("0x" in name for name in names)
+
+def testResumeFromCheckpoint(tmp_path):
+    path = str(tmp_path / "pipeline.checkpoint")
+    first_handle, first_element, browser_value = _fakeBrowserValue()
+    failed = _pipeline(True).runWithCheckpoints(browser_value, path, every=1)
+    assert failed.hasError()
+    assert os.path.exists(path)
+    assert first_element.keys == ["query"]
+
+    handle, element, browser_value = _fakeBrowserValue()
+    resumed = _pipeline(False).runWithCheckpoints(browser_value, path, every=1)
+    assert not resumed.hasError()
+    assert not os.path.exists(path)
+    # only the navigation is replayed, the completed sendKeys isn't sent again
+    assert handle.visited == ["http://example.com"]
+    assert element.keys == ["more"]
+    assert resumed.readData("rows").getValue()["label"].tolist() == ["a", "b"]
+    assert resumed.getLogs().getValue()["log"].tolist() == ["Complete"] * 6
+
+def testCheckpointIntervalMustBePositive(tmp_path):
+    _, _, browser_value = _fakeBrowserValue()
+    with pytest.raises(ValueError):
+        _pipeline(False).runWithCheckpoints(browser_value, str(tmp_path / "checkpoint"), every=0)
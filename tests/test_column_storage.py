@@ -0,0 +1,33 @@
+import pandas as pd
+from strict_dataframe import StrictDataFrame
+
+_COLUMNS = [("bank", "category"), ("description", "interned"), ("label", str)]
+
+def _frame(banks, descriptions):
+    return pd.DataFrame({"bank": banks, "description": descriptions, "label": [str(i) for i in range(len(banks))]})
+
+def testStoredValuesMatchStr():
+    frame = _frame(["b1", "b2", "b1"], ["rent", 12, "rent"])
+    value = StrictDataFrame(_COLUMNS, frame).getValue()
+    assert str(value["bank"].dtype) == "category"
+    assert value["bank"].astype(str).tolist() == frame["bank"].astype(str).tolist()
+    assert value["description"].tolist() == frame["description"].astype(str).tolist()
+
+def testInternedValuesShareOneObject():
+    descriptions = ["".join(["re", "nt"]), "".join(["ren", "t"]), "fee"]
+    assert descriptions[0] is not descriptions[1]
+    value = StrictDataFrame(_COLUMNS, _frame(["b1", "b2", "b3"], descriptions)).getValue()
+    assert value["description"].iloc[0] is value["description"].iloc[1]
+
+def testCategoricalFrameConformsWithoutCast():
+    frame = _frame(["b1", "b2"], ["a", "b"]).astype({"bank": "category"})
+    strict = StrictDataFrame([("bank", "category"), ("label", str)], frame[["bank", "label"]])
+    assert strict.getConstructionPath() == "zero_copy"
+
+def testAppendsUnionCategories():
+    first = StrictDataFrame(_COLUMNS, _frame(["b1", "b2"], ["a", "b"]))
+    second = StrictDataFrame(_COLUMNS, _frame(["b3", "b1"], ["c", "a"]))
+    value = first.append(second).getValue()
+    assert value["bank"].tolist() == ["b1", "b2", "b3", "b1"]
+    assert list(value["bank"].cat.categories) == ["b1", "b2", "b3"]
+    assert value["description"].tolist() == ["a", "b", "c", "a"]
@@ -0,0 +1,70 @@
+import sys
+from functools import reduce
+from selenium.webdriver.common.by import By
+from browser_module import SafeWebDriver, BrowserSession, BrowserPipeline, Do, compose
+from .fake_driver import FakeWebDriver
+
+_SEARCH = (By.ID, "search")
+
+def _steps(fail):
+    def flakyStep(handle):
+        if fail:
+            raise RuntimeError("browser hiccup")
+    return [
+        Do.goToUrl("http://example.com"),
+        Do.sendKeys("query", _SEARCH),
+        Do.customDriverFunction(flakyStep),
+        Do.sendKeys("more", _SEARCH)
+    ]
+
+def _run(run):
+    handle = FakeWebDriver()
+    element, = handle.addElements(*_SEARCH)
+    session = run(BrowserSession(SafeWebDriver(handle)).getValue())
+    return session, handle, element
+
+def _nestedLambdas(functions):
+    # how compose built pipelines before it returned a BrowserPipeline
+    return reduce(lambda f1, f2: lambda browser_value: f1(browser_value) >> f2, functions + [BrowserSession.unit])
+
+def _assertSameRun(left, right):
+    (left_session, left_handle, left_element), (right_session, right_handle, right_element) = left, right
+    assert left_session.hasError() == right_session.hasError()
+    assert left_session.getLogs().getValue()["log"].tolist() == right_session.getLogs().getValue()["log"].tolist()
+    assert left_handle.visited == right_handle.visited
+    assert left_element.keys == right_element.keys
+
+def testPipelineMatchesNestedLambdas():
+    for fail in [False, True]:
+        _assertSameRun(_run(compose(_steps(fail))), _run(_nestedLambdas(_steps(fail))))
+
+def testPipelineMatchesHandWrittenBinds():
+    for fail in [False, True]:
+        first, second, third, fourth = _steps(fail)
+        chained = lambda browser_value: BrowserSession.unit(browser_value) >> first >> second >> third >> fourth
+        _assertSameRun(_run(compose(_steps(fail))), _run(chained))
+
+def testNestedPipelinesAreSpliced():
+    first, second, third, fourth = _steps(False)
+    nested = compose([compose([first, second]), third, compose([fourth])])
+    assert isinstance(nested, BrowserPipeline)
+    assert nested.getSteps() == (first, second, third, fourth)
+    assert nested.getStepCount() == len(nested) == 4
+    _assertSameRun(_run(nested), _run(compose([first, second, third, fourth])))
+
+def testProfileTimesEveryStep():
+    pipeline = compose(_steps(False))
+    session, timings = pipeline.profile(_run(lambda browser_value: BrowserSession.unit(browser_value))[0].getValue())
+    assert not session.hasError()
+    assert timings["step"].tolist() == pipeline.getStepNames()
+    assert (timings["seconds"] >= 0).all()
+
+def testLongPipelineRunsInConstantStackDepth():
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(200)
+    try:
+        session, _, element = _run(compose([Do.sendKeys("x", _SEARCH)] * 1000))
+    finally:
+        sys.setrecursionlimit(limit)
+    assert not session.hasError()
+    assert len(element.keys) == 1000
@@ -0,0 +1,30 @@
+import pandas as pd
+from strict_dataframe import StrictDataFrame
+
+_COLUMNS = [("n", "int64"), ("label", object)]
+
+def _frame():
+    return pd.DataFrame({"n": [1, 2, 3], "label": ["a", "b", "c"]})
+
+def testConformingFrameIsWrappedWithoutCopy():
+    frame = _frame()
+    strict = StrictDataFrame(_COLUMNS, frame)
+    assert strict.getConstructionPath() == "zero_copy"
+    assert strict.getValue() is frame
+
+def testShallowCopySharesDataButNotColumns():
+    frame = _frame()
+    strict = StrictDataFrame(_COLUMNS, frame, shallow_copy=True)
+    assert strict.getConstructionPath() == "shallow_copy"
+    assert strict.getValue() is not frame
+    frame["extra"] = 0
+    frame["label"] = ["x", "y", "z"]
+    assert list(strict.getValue().columns) == ["n", "label"]
+    assert strict.getValue()["label"].tolist() == ["a", "b", "c"]
+
+def testNonConformingFrameIsRebuilt():
+    for frame in [_frame()[["label", "n"]], _frame().astype({"n": "int32"}), _frame().assign(extra=0)]:
+        strict = StrictDataFrame(_COLUMNS, frame)
+        assert strict.getConstructionPath() == "rebuild"
+        assert strict.getValue() is not frame
+        pd.testing.assert_frame_equal(strict.getValue(), _frame())
@@ -0,0 +1,39 @@
+import pytest
+from strict_dataframe import Container, Just, Nothing, First, Last, Maybe, mconcat, mzero
+from strict_dataframe.pymonad_types import _Nothing
+
+def testContainersHaveNoInstanceDict():
+    for value in [Container(1), Just(1), Nothing, First(Just(1)), Last(Nothing)]:
+        assert not hasattr(value, "__dict__")
+    with pytest.raises(AttributeError):
+        Just(1).extra = 2
+
+def testNothingIsASingleton():
+    assert _Nothing() is Nothing
+    assert _Nothing(5) is Nothing
+    assert Nothing.getValue() is None
+    assert First(Nothing).mzero() is First.mzero()
+    assert Last.mzero().getValue() is Nothing
+
+def testMaybeEqualityAndBind():
+    assert Just(1) == Just(1)
+    assert Just(1) != Just(2)
+    assert Just(1) != Nothing
+    assert Nothing == Nothing
+    with pytest.raises(TypeError):
+        Just(1) == 1
+    assert (Just(2) >> (lambda x: Just(x * 3))) == Just(6)
+    assert (Just(2) >> (lambda x: Nothing)) == Nothing
+    assert (Nothing >> (lambda x: Just(x))) is Nothing
+    assert ((lambda x: x + 1) * Just(1)) == Just(2)
+    with pytest.raises(NotImplementedError):
+        Maybe(1)
+
+def testMaybeMonoids():
+    assert Just(1) + Just(9) == Just(10)
+    assert Just([1]) + Nothing == Just([1])
+    assert Nothing + Just("a") == Just("a")
+    assert mzero(Maybe) is Nothing
+    assert mconcat([First(Nothing), First(Just(1)), First(Just(2))]).getValue() == Just(1)
+    assert mconcat([Last(Just(1)), Last(Just(2)), Last(Nothing)]).getValue() == Just(2)
+    assert mconcat([First(Nothing), First(Nothing)]).getValue() == Nothing
@@ -0,0 +1,37 @@
+import pytest
+from strict_dataframe import curry, Reader
+
+@curry
+def _add3(x, y, z):
+    return x * 100 + y * 10 + z
+
+@curry
+def _adder(x):
+    return lambda y: x + y
+
+def testEveryWayOfSupplyingArguments():
+    assert _add3(1, 2, 3) == _add3(1)(2, 3) == _add3(1, 2)(3) == _add3(1)(2)(3) == 123
+    assert _add3(1, z=3)(2) == _add3(x=1)(y=2)(z=3) == 123
+
+def testPartialApplicationsAreIndependent():
+    one = _add3(1)
+    assert isinstance(one, Reader)
+    assert one(2, 3) == 123
+    assert one(4, 5) == 145
+    one_two = one(2)
+    assert one_two(3) == 123
+    assert one_two(9) == 129
+
+def testReturnedFunctionsAreReaders():
+    add_five = _adder(5)
+    assert isinstance(add_five, Reader)
+    assert add_five(1) == 6
+    assert _adder(5, 1) == 6
+
+def testTooManyArguments():
+    with pytest.raises(TypeError):
+        _add3(1, 2, 3, 4)
+
+def testComposition():
+    composed = _adder(1) * _adder(10)
+    assert composed(100) == 111
@@ -0,0 +1,79 @@
+from selenium.webdriver.common.by import By
+from browser_module import SafeWebDriver, BrowserSession, BlankSafeWebElement, Do, compose, elementCacheOf
+from .fake_driver import FakeWebDriver
+
+def _run(handle, steps):
+    return compose(steps)(BrowserSession(SafeWebDriver(handle)).getValue())
+
+def testRepeatedLookupsAreCached():
+    handle = FakeWebDriver()
+    handle.addElements(By.ID, "name")
+    session = _run(handle, [Do.find((By.ID, "name"), within_element=False) for _ in range(5)])
+    assert not session.hasError()
+    assert handle.find_calls == 1
+    assert elementCacheOf(handle).getHits() == 4
+
+def testMissingAndAmbiguousElementsAreNotCached():
+    handle = FakeWebDriver()
+    handle.addElements(By.CSS_SELECTOR, ".row", count=2)
+    _run(handle, [Do.find(find, within_element=False) for find in [(By.ID, "missing"), (By.CSS_SELECTOR, ".row")] * 2])
+    assert handle.find_calls == 4
+    assert len(elementCacheOf(handle)) == 0
+
+def testPrefetchResolvesInOneScriptCall():
+    handle = FakeWebDriver()
+    finds = [(By.ID, "a"), (By.NAME, "b"), (By.CSS_SELECTOR, "#c"), (By.LINK_TEXT, "d")]
+    for by, value in finds:
+        handle.addElements(by, value)
+    _run(handle, [Do.prefetch(finds)] + [Do.find(find, within_element=False) for find in finds])
+    assert handle.script_calls == 1
+    assert handle.find_calls == 1 # <- link text can't be resolved by script
+    assert elementCacheOf(handle).getHits() == len(finds)
+
+def testActionsAndNavigationClearTheCache():
+    handle = FakeWebDriver()
+    button, = handle.addElements(By.ID, "button")
+    find = Do.find((By.ID, "button"), within_element=False)
+    _run(handle, [find, Do.click((By.ID, "button")), find, Do.goToUrl("next"), find])
+    assert button.clicks == 1
+    assert handle.find_calls == 3
+
+def testFramesHaveTheirOwnEntries():
+    handle = FakeWebDriver()
+    handle.addElements(By.ID, "frame")
+    handle.addElements(By.ID, "field")
+    find = Do.find((By.ID, "field"), within_element=False)
+    _run(handle, [find, Do.switchToFrame((By.ID, "frame")), find])
+    assert elementCacheOf(handle).getFramePath() == ((By.ID, "frame"),)
+    assert handle.find_calls == 3
+
+def testStaleElementIsLookedUpAgain():
+    handle = FakeWebDriver()
+    old, = handle.addElements(By.ID, "button")
+    _run(handle, [Do.find((By.ID, "button"), within_element=False)])
+    old.stale = True
+    new, = handle.addElements(By.ID, "button")
+    session = _run(handle, [Do.click((By.ID, "button"))])
+    assert not session.hasError()
+    assert (old.clicks, new.clicks) == (0, 1)
+
+def testClassNamesStartingWithADigitResolve():
+    handle = FakeWebDriver()
+    handle.addElements(By.CLASS_NAME, "1st")
+    session = _run(handle, [Do.prefetch([(By.CLASS_NAME, "1st")]), Do.find((By.CLASS_NAME, "1st"), within_element=False)])
+    assert not session.hasError()
+    assert elementCacheOf(handle).getHits() == 1
+    assert handle.find_calls == 0
+
+def testInvalidScriptQueriesFallBackToFindElements():
+    handle = FakeWebDriver()
+    handle.addElements(By.CSS_SELECTOR, ".9lives")
+    results = elementCacheOf(handle).resolve([(By.CSS_SELECTOR, ".9lives")], using=handle)
+    assert results[0] is not BlankSafeWebElement
+    assert handle.find_calls == 1
+
+def testClearingTheCacheIsNotADriverCommand():
+    handle = FakeWebDriver()
+    driver = SafeWebDriver(handle, probe_interval=0)
+    session = compose([Do.customBrowserFunction(lambda driver, logs, data, element: (driver, logs, data, element))])(BrowserSession(driver).getValue())
+    assert session.getLogs().getValue()["driver_calls"].tolist() == [0]
@@ -0,0 +1,57 @@
+from selenium.webdriver.common.by import By
+from strict_dataframe import NamedStrictDataFrame
+from browser_module import SafeWebDriver, BrowserSession, Do, compose
+from .fake_driver import FakeWebDriver
+
+_COLUMNS = [("n", int), ("label", str), ("ok", bool)]
+
+def _extractAll(*extracts):
+    # extracts: (columns, rows) read one after the other into the same name
+    handle = FakeWebDriver()
+    handle.addElements(By.ID, "table")
+    handle.script_results.extend([rows for _, rows in extracts])
+    steps = [Do.extractTable((By.ID, "table"), columns, "table") for columns, _ in extracts]
+    return compose(steps)(BrowserSession(SafeWebDriver(handle)).getValue())
+
+def _extract(rows):
+    return _extractAll((_COLUMNS, rows))
+
+def testIntegerColumnsAreNullable():
+    session = _extract([["1,000", "a", "yes"], ["", "b", "no"], ["n/a", "c", "true"]])
+    assert not session.hasError()
+    table = session.readData("table").getValue()
+    assert str(table["n"].dtype) == "Int64"
+    assert table["n"].tolist()[0] == 1000
+    assert table["n"].isna().tolist() == [False, True, True]
+    assert table["ok"].tolist() == [True, False, True]
+
+def testUncastableCellsFailTheStep():
+    session = _extract([["1.5", "a", "yes"]])
+    assert session.hasError()
+    assert session.getLogs().getValue()["log"].tolist() == ["Browser became unusable"]
+
+def testMissingTextCellsStayMissing():
+    session = _extract([["1", "a", "yes"], ["2", None, "no"]])
+    table = session.readData("table").getValue()
+    assert str(table["label"].dtype) == "string"
+    assert table["label"].isna().tolist() == [False, True]
+
+def testExtractsUnderOneNameAreAppended():
+    session = _extractAll((_COLUMNS, [["1", "a", "yes"]]), (_COLUMNS, [["2", "b", "no"]]))
+    assert not session.hasError()
+    assert session.readData("table").getValue()["n"].tolist() == [1, 2]
+
+def testExtractingOtherColumnsUnderOneNameFails():
+    session = _extractAll((_COLUMNS, [["1", "a", "yes"]]), ([("n", int)], [["2"]]))
+    assert session.hasError()
+    assert session.getLogs().getValue()["log"].tolist() == ["Complete", "Browser became unusable"]
+    assert list(session.readData("table").getValue().columns) == ["n", "label", "ok"]
+
+def testNamedFrameRoundTrip(tmp_path):
+    table = _extract([["1", "a", "yes"], ["", None, "no"]]).readData("table")
+    path = str(tmp_path / "table")
+    table.save(path)
+    loaded = NamedStrictDataFrame.load(path)
+    assert loaded.getName() == "table"
+    assert loaded.getSchema() is table.getSchema()
+    assert loaded.getValue().equals(table.getValue())
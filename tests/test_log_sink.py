@@ -0,0 +1,50 @@
+import json
+import logging
+import threading
+from browser_module import SafeWebDriver, BrowserSession, Do, compose, getLogSink, configureLogging
+from .fake_driver import FakeWebDriver
+
+def _runSteps(count):
+    compose([Do.goToUrl("u" + str(i)) for i in range(count)])(BrowserSession(SafeWebDriver(FakeWebDriver())).getValue())
+
+def _lines(path):
+    with open(path) as log_file:
+        return [json.loads(line) for line in log_file]
+
+def testEntriesAreWrittenAsJsonLines(tmp_path):
+    path = str(tmp_path / "steps.jsonl")
+    sink = configureLogging(path=path)
+    _runSteps(5)
+    sink.flush()
+    lines = _lines(path)
+    assert [line['step'] for line in lines] == ["goToUrl(u" + str(i) + ")" for i in range(5)]
+    assert {line['level'] for line in lines} == {"INFO"}
+    sink.close()
+
+def testLevelFiltersEntries(tmp_path):
+    path = str(tmp_path / "steps.jsonl")
+    sink = configureLogging(path=path, level=logging.WARNING)
+    _runSteps(3)
+    sink.close()
+    assert _lines(path) == []
+    assert sink.getWrittenCount() == 0
+
+def testClosedSinkIsUninstalledAndIgnoresEntries(tmp_path):
+    sink = configureLogging(path=str(tmp_path / "steps.jsonl"))
+    sink.close()
+    assert getLogSink() is None
+    sink({'step': "late", 'log': "Complete"})
+    sink.flush() # <- returns: nothing was queued
+    assert sink.getWrittenCount() == 0
+
+def testReconfiguringClosesThePreviousSink(tmp_path):
+    writers = lambda: [thread for thread in threading.enumerate() if thread.name == "QueuedLogSink"]
+    first = configureLogging(path=str(tmp_path / "first.jsonl"))
+    second = configureLogging(path=str(tmp_path / "second.jsonl"))
+    assert getLogSink() is second
+    assert len(writers()) == 1
+    first({'step': "late", 'log': "Complete"})
+    assert first.getWrittenCount() == 0
+    assert configureLogging() is None
+    assert getLogSink() is None
+    assert writers() == []
@@ -0,0 +1,43 @@
+from functools import reduce
+import pandas as pd
+from strict_dataframe import mconcat, CumulativeMonoidSet, NamedStrictDataFrame, StrictDataFrame
+from .monoids import Text, OtherText
+
+def _fold(values):
+    # reference: left to right, one mplus at a time
+    return reduce(lambda left, right: left + right, values)
+
+def testBalancedReductionKeepsOrder():
+    for count in range(1, 20):
+        values = [Text(chr(ord("a") + i)) for i in range(count)]
+        assert mconcat(values) == _fold(values)
+
+def testEachValueTakesPartInFewMplus():
+    Text.mplus_calls = 0
+    assert mconcat([Text("x")] * 64).value == "x" * 64
+    assert Text.mplus_calls == 63
+
+def testNaturalMonoids():
+    assert mconcat(["a", "b", "c"]) == "abc"
+    assert mconcat([[1], [2, 3]]) == [1, 2, 3]
+    assert mconcat([5]) == 5
+
+def _named(name, start):
+    return NamedStrictDataFrame(name, StrictDataFrame([("n", int)], pd.DataFrame({"n": [start, start + 1]})))
+
+def testBulkConcatMatchesFold():
+    frames = [_named("t", i * 10) for i in range(6)]
+    pd.testing.assert_frame_equal(mconcat(frames).getValue(), _fold(frames).getValue())
+    assert mconcat(frames).getName() == "t"
+
+def testMonoidSetsAreCombinedPerKey():
+    sets = [
+        CumulativeMonoidSet([Text("a"), _named("t", 0)]),
+        CumulativeMonoidSet([OtherText("x")]),
+        CumulativeMonoidSet([Text("b"), _named("t", 10), OtherText("y")])
+    ]
+    combined, folded = mconcat(sets).getValue(), _fold(sets).getValue()
+    assert list(combined) == list(folded)
+    assert combined["Text"] == folded["Text"] == Text("ab")
+    assert combined["OtherText"] == folded["OtherText"] == OtherText("xy")
+    pd.testing.assert_frame_equal(combined["t"].getValue(), folded["t"].getValue())
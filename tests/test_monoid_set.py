@@ -0,0 +1,36 @@
+from strict_dataframe import CumulativeMonoidSet
+from .monoids import Text, OtherText
+
+def _rebuilt(first, second):
+    # reference: the set rebuilt from both value lists, as append used to do
+    return CumulativeMonoidSet(first.getValueAsList() + second.getValueAsList())
+
+def _sets():
+    return [
+        CumulativeMonoidSet([Text("a"), OtherText("x")]),
+        CumulativeMonoidSet([Text("b")]),
+        CumulativeMonoidSet([OtherText("y"), Text("c")]),
+        CumulativeMonoidSet([]),
+        CumulativeMonoidSet([Text("d"), Text("e")])
+    ]
+
+def testAppendMatchesRebuild():
+    for first in _sets():
+        for second in _sets():
+            appended = first + second
+            assert appended.getValue() == _rebuilt(first, second).getValue()
+            assert list(appended.getValue()) == list(_rebuilt(first, second).getValue())
+
+def testAppendLeavesOperandsUnchanged():
+    first, second = _sets()[0], _sets()[2]
+    first + second
+    assert first.getValue() == {"Text": Text("a"), "OtherText": OtherText("x")}
+    assert second.getValue() == {"OtherText": OtherText("y"), "Text": Text("c")}
+
+def testOnlyAppendedKeysAreMerged():
+    merged = CumulativeMonoidSet([Text("a"), OtherText("x")])
+    Text.mplus_calls = 0
+    for _ in range(10):
+        merged = merged + CumulativeMonoidSet([Text("b")])
+    assert Text.mplus_calls == 10
+    assert merged.getValue() == {"Text": Text("a" + "b" * 10), "OtherText": OtherText("x")}
@@ -0,0 +1,34 @@
+import numpy as np
+import pandas as pd
+import pytest
+from strict_dataframe import StrictDataFrame, ParallelCasting
+
+_ROWS = 1000
+
+def _frame(width):
+    columns = {"c" + str(i): np.arange(_ROWS) % (i + 7) for i in range(width)}
+    columns["label"] = np.arange(_ROWS) % 5
+    columns["bank"] = ["b" + str(i % 3) for i in range(_ROWS)]
+    return pd.DataFrame(columns)
+
+def _columns(width):
+    return [("c" + str(i), float) for i in range(width)] + [("label", str), ("bank", "category")]
+
+def _cast(width, parallel):
+    return StrictDataFrame(_columns(width), _frame(width), parallel=parallel).getValue()
+
+@pytest.mark.parametrize("width", [1, 8]) # <- fewer columns than workers: by row ranges, otherwise by column groups
+@pytest.mark.parametrize("use_processes", [False, True])
+def testParallelCastMatchesSerialCast(width, use_processes):
+    parallel = ParallelCasting(workers=3, min_rows=10, use_processes=use_processes)
+    assert parallel.appliesTo(_frame(width))
+    pd.testing.assert_frame_equal(_cast(width, parallel), _cast(width, ParallelCasting()))
+
+def testSmallFramesAreCastSerially():
+    assert not ParallelCasting(workers=4, min_rows=_ROWS + 1).appliesTo(_frame(1))
+    assert not ParallelCasting(workers=1, min_rows=0).appliesTo(_frame(1))
+
+def testUncastableColumnIsNamed():
+    frame = _frame(4).assign(c2=["x"] * _ROWS)
+    with pytest.raises(ValueError, match="Column 'c2'"):
+        StrictDataFrame(_columns(4), frame, parallel=ParallelCasting(workers=2, min_rows=10))
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+from strict_dataframe import StrictDataFrame, HasStrictDataframe, Schema
+
+_COLUMNS = [
+    ("n", int), ("x", float), ("flag", bool), ("at", "datetime64[ns]"), ("label", str), 
+    ("bank", "category"), ("description", "interned"), ("count", "Int64"), ("note", "string")
+]
+
+def _strict():
+    return StrictDataFrame(_COLUMNS, pd.DataFrame({
+        "n": [1, 2, 3],
+        "x": [0.5, np.nan, 2.5],
+        "flag": [True, False, True],
+        "at": pd.to_datetime(["2020-01-01", None, "2020-01-03"]),
+        "label": ["a", "b", "a"],
+        "bank": ["b1", "b2", "b1"],
+        "description": ["rent", "fee", "rent"],
+        "count": pd.array([1, None, 3], dtype="Int64"),
+        "note": pd.array(["x", None, "z"], dtype="string")
+    }, index=[10, 20, 30]))
+
+class _Accounts(HasStrictDataframe):
+    columns = Schema.compile([("n", int), ("label", str)])
+
+    def __init__(self, dataframe=pd.DataFrame()):
+        super(_Accounts, self).__init__("_Accounts", StrictDataFrame(_Accounts.columns, dataframe))
+
+    def append(self, other):
+        return _Accounts(self._appendInternal(other))
+
+@pytest.mark.parametrize("memory_map", [True, False])
+def testRoundTrip(tmp_path, memory_map):
+    strict = _strict()
+    strict.save(str(tmp_path / "frame"))
+    loaded = StrictDataFrame.load(str(tmp_path / "frame"), memory_map=memory_map)
+    assert loaded.getSchema() is strict.getSchema()
+    assert loaded.getConstructionPath() == "load"
+    pd.testing.assert_frame_equal(loaded.getValue(), strict.getValue())
+    assert loaded.getValue()["description"].iloc[0] is loaded.getValue()["description"].iloc[2]
+
+def testMemoryMappedColumnsAreReadOnly(tmp_path):
+    _strict().save(str(tmp_path / "frame"))
+    loaded = StrictDataFrame.load(str(tmp_path / "frame")).getValue()
+    assert not loaded["n"].to_numpy().flags.writeable
+
+def testLoadChecksTheColumns(tmp_path):
+    _strict().save(str(tmp_path / "frame"))
+    assert StrictDataFrame.load(str(tmp_path / "frame"), columns=_COLUMNS).getSchema() is Schema.compile(_COLUMNS)
+    with pytest.raises(ValueError):
+        StrictDataFrame.load(str(tmp_path / "frame"), columns=[("n", int)])
+
+def testHasStrictDataframeRoundTrip(tmp_path):
+    accounts = _Accounts(pd.DataFrame({"n": [1, 2], "label": ["a", "b"]}))
+    accounts.save(str(tmp_path / "accounts"))
+    loaded = _Accounts.load(str(tmp_path / "accounts"))
+    assert isinstance(loaded, _Accounts)
+    pd.testing.assert_frame_equal(loaded.getValue(), accounts.getValue())
+    _strict().save(str(tmp_path / "other"))
+    with pytest.raises(ValueError):
+        _Accounts.load(str(tmp_path / "other"))
@@ -0,0 +1,83 @@
+import time
+from strict_dataframe import Nothing
+from browser_module import SafeWebDriver
+from .fake_driver import FakeWebDriver, FakeRemoteWebDriver
+
+def testSuccessfulApplyAnswersLivenessWithoutProbing():
+    handle = FakeWebDriver()
+    driver = SafeWebDriver(handle)
+    for _ in range(10):
+        assert driver.apply(lambda h: h.get("about:blank")).getValue() is None
+        assert driver.isAlive()
+    assert handle.title_reads == 0
+    assert driver.getProbeCount() == 0
+    assert driver.getProbesSaved() >= 10
+
+def testErrorForcesProbeOnNextCheck():
+    handle = FakeWebDriver()
+    driver = SafeWebDriver(handle)
+    driver.apply(lambda h: h.find_elements(by="id", value="x")[0])
+    assert driver.hasError()
+    assert not driver.isUsable()
+    assert driver.isUsable(ignore_error=True)
+    assert driver.getProbeCount() == 1
+    assert handle.title_reads == 1
+
+def testDeadBrowserIsNoticedByProbe():
+    handle = FakeWebDriver()
+    driver = SafeWebDriver(handle)
+    handle.crash()
+    driver.apply(lambda h: h.get("about:blank"))
+    assert not driver.isAlive()
+    assert driver.hasError()
+
+def testProbeIntervalElapsed():
+    handle = FakeWebDriver()
+    driver = SafeWebDriver(handle, probe_interval=0)
+    assert driver.isAlive()
+    assert driver.isAlive()
+    assert driver.getProbeCount() == 2
+
+def testQuitMarksDriverDeadWithoutProbing():
+    handle = FakeWebDriver()
+    driver = SafeWebDriver(handle)
+    driver.quit()
+    driver.quit()
+    assert handle.quit_calls == 1
+    assert driver.hasQuit()
+    assert not driver.isAlive()
+    assert handle.title_reads == 0
+    assert driver.apply(lambda h: h.get("about:blank")) == Nothing
+    assert handle.visited == []
+
+def testCommandsCountedPerApplyForHandlesWithoutExecute():
+    driver = SafeWebDriver(FakeWebDriver())
+    driver.apply(lambda h: h.get("a"))
+    driver.apply(lambda h: h.get("b"))
+    assert driver.getCommandCount() == 2
+
+def testCommandsCountedPerExecuteForRemoteHandles():
+    driver = SafeWebDriver(FakeRemoteWebDriver())
+    driver.apply(lambda h: (h.get("a"), h.find_elements(by="id", value="x")))
+    assert driver.getCommandCount() == 2
+
+def testApplyWithoutCommandsDoesNotConfirmLiveness():
+    handle = FakeRemoteWebDriver()
+    driver = SafeWebDriver(handle, probe_interval=0.3)
+    handle.crash()
+    time.sleep(0.2)
+    assert driver.apply(lambda h: "no browser involved").getValue() == "no browser involved"
+    time.sleep(0.2)
+    assert not driver.isAlive()
+    assert driver.getProbeCount() == 1
+
+def testApplyLocalNeitherProbesNorCounts():
+    handle = FakeRemoteWebDriver()
+    driver = SafeWebDriver(handle, probe_interval=0)
+    assert driver.applyLocal(lambda h: 42).getValue() == 42
+    assert driver.getProbeCount() == 0
+    assert driver.getCommandCount() == 0
+    assert driver.applyLocal(lambda h: 1 / 0) == Nothing
+    assert driver.hasError()
+    assert driver.applyLocal(lambda h: 42) == Nothing
+    assert driver.applyLocal(lambda h: 42, ignore_error_flag=True).getValue() == 42
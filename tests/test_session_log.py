@@ -0,0 +1,53 @@
+import pandas as pd
+from browser_module import BrowserSessionLog, BrowserSessionLogsDataFrame
+from strict_dataframe import mconcat
+
+def _entry(index):
+    return {"step": "click(" + str(index % 3) + ")", "log": "Complete", "action": "click",
+        "seconds": index / 10, "driver_calls": index, "liveness_probes": index % 2}
+
+def _log(index):
+    return BrowserSessionLog.fromEntry(**_entry(index))
+
+def _expected(indices):
+    # the log built the way it was before the column store: one concatenated DataFrame
+    frame = pd.concat([pd.DataFrame([_entry(index)]) for index in indices], ignore_index=True)
+    return BrowserSessionLogsDataFrame(frame).getValue()
+
+def _assertLog(log, indices):
+    assert len(log) == len(indices)
+    pd.testing.assert_frame_equal(log.getValue().reset_index(drop=True), _expected(indices), check_categorical=False)
+
+def testAppendsMatchOneConcat():
+    log = BrowserSessionLog()
+    for index in range(40):
+        log = log.append(_log(index))
+    _assertLog(log, range(40))
+    assert str(log.getValue()["step"].dtype) == "category"
+
+def testMonoidInterface():
+    logs = [_log(index) for index in range(5)]
+    _assertLog(mconcat(logs), range(5))
+    _assertLog(BrowserSessionLog.mconcat_many(logs), range(5))
+    _assertLog(logs[0] + BrowserSessionLog.mzero(), [0])
+    _assertLog(BrowserSessionLog.mzero() + logs[0], [0])
+    assert len(BrowserSessionLog.mzero()) == 0
+
+def testAppendingTwiceToOneLogBranches():
+    base = _log(0) + _log(1)
+    left = base + _log(2)
+    right = base + _log(3)
+    _assertLog(left, [0, 1, 2])
+    _assertLog(right, [0, 1, 3])
+    _assertLog(base, [0, 1])
+
+def testFromDataFrameMatchesEntries():
+    log = BrowserSessionLog(BrowserSessionLogsDataFrame(_expected(range(3)))) + _log(3)
+    _assertLog(log, range(4))
+
+def testRingBufferKeepsLatestEntries():
+    log = BrowserSessionLog(maxlen=4)
+    for index in range(10):
+        log = log.append(_log(index))
+        _assertLog(log, range(max(0, index - 3), index + 1))
+    assert log.getMaxlen() == 4
@@ -0,0 +1,57 @@
+import json
+import pandas as pd
+import pytest
+from strict_dataframe import StrictDataFrame, streamStrictDataFrames
+
+_COLUMNS = [("id", str), ("amount", float), ("count", int)]
+
+def _rows(count):
+    return [{"id": "00" + str(i), "amount": i / 2, "count": i, "ignored": "x"} for i in range(count)]
+
+def _joined(chunks):
+    return pd.concat([chunk.getValue() for chunk in chunks], ignore_index=True)
+
+def _expected(rows):
+    return StrictDataFrame(_COLUMNS, pd.DataFrame(rows)).getValue().reset_index(drop=True)
+
+def testCsvChunksMatchOneRead(tmp_path):
+    path = str(tmp_path / "rows.csv")
+    pd.DataFrame(_rows(25)).to_csv(path, index=False)
+    chunks = list(streamStrictDataFrames(path, _COLUMNS, chunk_size=10))
+    assert [len(chunk.getValue()) for chunk in chunks] == [10, 10, 5]
+    pd.testing.assert_frame_equal(_joined(chunks), _expected(_rows(25)))
+    assert _joined(chunks)["id"].tolist()[:2] == ["000", "001"]
+
+def testJsonLinesChunksMatchOneRead(tmp_path):
+    path = str(tmp_path / "rows.jsonl")
+    with open(path, "w") as rows_file:
+        rows_file.write("\n".join(json.dumps(row) for row in _rows(7)))
+    chunks = list(streamStrictDataFrames(path, _COLUMNS, chunk_size=3))
+    assert [len(chunk.getValue()) for chunk in chunks] == [3, 3, 1]
+    pd.testing.assert_frame_equal(_joined(chunks), _expected(_rows(7)))
+
+def testMixedRecordsAndFramesKeepOrderAndChunkSize():
+    rows = _rows(20)
+    source = rows[:3] + [pd.DataFrame(rows[3:11])] + rows[11:12] + [pd.DataFrame(rows[12:13]), pd.DataFrame()] + rows[13:]
+    chunks = list(streamStrictDataFrames(source, _COLUMNS, chunk_size=6))
+    assert [len(chunk.getValue()) for chunk in chunks] == [6, 6, 6, 2]
+    pd.testing.assert_frame_equal(_joined(chunks), _expected(rows))
+
+def testSourceErrorsReachTheConsumer():
+    def __failing():
+        yield from _rows(5)
+        raise OSError("source went away")
+    with pytest.raises(OSError):
+        list(streamStrictDataFrames(__failing(), _COLUMNS, chunk_size=2))
+
+def testStoppingEarlyStopsTheParser():
+    consumed = []
+    def __endless():
+        index = 0
+        while True:
+            consumed.append(index)
+            yield {"id": str(index), "amount": 0.0, "count": index}
+            index += 1
+    for chunk in streamStrictDataFrames(__endless(), _COLUMNS, chunk_size=5, prefetch=1):
+        break
+    assert len(consumed) < 100
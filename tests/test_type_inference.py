@@ -0,0 +1,53 @@
+import pandas as pd
+from strict_dataframe import StrictDataFrame, TypeInference
+
+def _frame():
+    return pd.DataFrame({
+        "n": [1, 2, 3, 4],
+        "x": [0.5, 1.5, None, 2.0],
+        "flag": [True, False, True, True],
+        "at": pd.to_datetime(["2020-01-01", "2020-01-02", "2020-01-03", "2020-01-04"]),
+        "label": ["a", "b", "a", "a"],
+        "counts": pd.Series([1, 2, 3, 4], dtype=object),
+        "mixed": ["a", 1, None, 2.5]
+    })
+
+def _types(strict):
+    return dict(strict.getColumns())
+
+def testColumnTypesAreInferred():
+    strict = StrictDataFrame(dataframe=_frame())
+    assert _types(strict) == {"n": int, "x": float, "flag": bool, "at": "datetime64[ns]", "label": str, "counts": int, "mixed": str}
+    assert strict.getConstructionPath() == "dataframe"
+
+def testValuesAreKeptByDefault():
+    frame = _frame().drop(columns=["counts", "mixed"])
+    pd.testing.assert_frame_equal(StrictDataFrame(dataframe=frame).getValue(), frame)
+
+def testCategoriesAreOptIn():
+    strict = StrictDataFrame(dataframe=_frame()[["label"]], inference=TypeInference(category_ratio=0.5))
+    assert _types(strict) == {"label": "category"}
+    assert strict.getValue()["label"].tolist() == ["a", "b", "a", "a"]
+
+def testDowncast():
+    strict = StrictDataFrame(dataframe=_frame()[["n", "x"]], inference=TypeInference(downcast=True))
+    assert _types(strict) == {"n": "int8", "x": "float32"}
+
+def testSampledTypeFallsBackToStrWhenItDoesNotHold():
+    # the evenly spaced sample (every other row) only sees integers
+    frame = pd.DataFrame({"code": pd.Series([1, "x", 2, "y", 3, "z"], dtype=object)})
+    strict = StrictDataFrame(dataframe=frame, inference=TypeInference(sample_size=3))
+    assert _types(strict) == {"code": str}
+    assert strict.getValue()["code"].tolist() == ["1", "x", "2", "y", "3", "z"]
+
+def testSampledTypeFallsBackToStrRatherThanLosingValues():
+    frame = pd.DataFrame({"code": pd.Series([1, 2.5, 2, 3.5, 3, 4.5], dtype=object)})
+    strict = StrictDataFrame(dataframe=frame, inference=TypeInference(sample_size=3))
+    assert _types(strict) == {"code": str}
+    assert strict.getValue()["code"].tolist() == ["1", "2.5", "2", "3.5", "3", "4.5"]
+
+def testFullScanConfirmsTheSample():
+    frame = pd.DataFrame({"code": pd.Series([1, 2.5, 2, 3.5, 3, 4.5], dtype=object)})
+    strict = StrictDataFrame(dataframe=frame, inference=TypeInference(sample_size=3, full_scan=True))
+    assert _types(strict) == {"code": float}
+    assert strict.getValue()["code"].tolist() == [1.0, 2.5, 2.0, 3.5, 3.0, 4.5]
@@ -0,0 +1,43 @@
+import time
+import threading
+import pytest
+from selenium.common.exceptions import TimeoutException
+from browser_module import WaitScheduler, BackoffPolicy
+from .fake_driver import FakeWebDriver
+
+_QUICK = BackoffPolicy(initial=0.01, factor=1.5, maximum=0.05)
+
+def testConditionResultResolvesFuture():
+    scheduler = WaitScheduler()
+    ready_at = time.monotonic() + 0.1
+    try:
+        result = scheduler.waitUntil(lambda handle: time.monotonic() >= ready_at and "ready", FakeWebDriver(), 2, _QUICK)
+    finally:
+        scheduler.close()
+    assert result == "ready"
+
+def testHungConditionDoesNotHoldUpOtherWaits():
+    release = threading.Event()
+    scheduler = WaitScheduler(checkers=2)
+    try:
+        hung = scheduler.submit(lambda handle: release.wait(), FakeWebDriver(), 0.3, _QUICK)
+        started = time.monotonic()
+        quick = [scheduler.submit(lambda handle: True, FakeWebDriver(), 1, _QUICK) for _ in range(20)]
+        assert all(future.result(timeout=1) for future in quick)
+        assert time.monotonic() - started < 0.2
+        with pytest.raises(TimeoutException):
+            hung.result(timeout=1)
+        # failed at its deadline, while its check is still running
+        assert time.monotonic() - started < 0.6
+    finally:
+        release.set()
+        scheduler.close()
+
+def testCloseFailsPendingWaits():
+    scheduler = WaitScheduler()
+    pending = scheduler.submit(lambda handle: False, FakeWebDriver(), 10, _QUICK)
+    scheduler.close()
+    with pytest.raises(TimeoutException):
+        pending.result(timeout=1)
+    with pytest.raises(RuntimeError):
+        scheduler.submit(lambda handle: True, FakeWebDriver(), 1)
@@ -0,0 +1,70 @@
+import time
+import pytest
+from browser_module import SafeWebDriver, WebDriverPool, BackoffPolicy, BrowserSession, Do, compose
+from .fake_driver import FakeWebDriver, FakeChromeDriver
+
+_QUICK_RETRY = BackoffPolicy(initial=0.01, factor=2.0, maximum=0.05)
+
+def testReleaseResetsBrowserThroughDevTools():
+    handles = []
+    def __chrome():
+        handles.append(FakeChromeDriver())
+        return SafeWebDriver(handles[-1])
+    with WebDriverPool(__chrome, size=1) as pool:
+        driver = pool.acquire(timeout=5)
+        compose([Do.goToUrl("https://example.com")])(BrowserSession(driver).getValue())
+        pool.release(driver)
+        assert pool.acquire(timeout=5) is driver
+    handle, = handles
+    assert handle.cdp_commands == ["Network.clearBrowserCookies", "Storage.clearDataForOrigin"]
+    assert handle.cookies_cleared == 0
+    assert handle.visited == ["https://example.com", "about:blank"]
+
+def testReleaseResetsCurrentOriginWithoutDevTools():
+    handle = FakeWebDriver()
+    with WebDriverPool(lambda: SafeWebDriver(handle), size=1) as pool:
+        driver = pool.acquire(timeout=5)
+        pool.release(driver)
+        assert pool.acquire(timeout=5) is driver
+    assert handle.cookies_cleared == 1
+    assert handle.script_calls == 1
+
+def testDriverRecycledAfterMaxUses():
+    with WebDriverPool(lambda: SafeWebDriver(FakeWebDriver()), size=1, max_uses=2) as pool:
+        first = pool.acquire(timeout=5)
+        pool.release(first)
+        assert pool.acquire(timeout=5) is first
+        pool.release(first)
+        second = pool.acquire(timeout=5)
+        assert second is not first
+        assert first.hasQuit()
+        assert pool.getMetrics()['recycled'] == 1
+
+def testFailingLaunchesBackOffAndSurfaceInAcquire():
+    calls = []
+    def __missingDriver():
+        calls.append(time.perf_counter())
+        raise FileNotFoundError("chromedriver")
+    pool = WebDriverPool(__missingDriver, size=1, launch_backoff=_QUICK_RETRY, max_launch_failures=4)
+    with pytest.raises(RuntimeError) as raised:
+        pool.acquire()
+    assert isinstance(raised.value.__cause__, FileNotFoundError)
+    with pytest.raises(RuntimeError):
+        pool.acquire(timeout=1)
+    time.sleep(0.1)
+    pool.close()
+    assert len(calls) == 4
+    assert calls[-1] - calls[0] >= 0.01 + 0.02 + 0.04
+
+def testLaunchRecoversFromTransientFailures():
+    attempts = []
+    def __flakyDriver():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise RuntimeError("port in use")
+        return SafeWebDriver(FakeWebDriver())
+    with WebDriverPool(__flakyDriver, size=1, launch_backoff=_QUICK_RETRY) as pool:
+        assert pool.acquire(timeout=5).isAlive()
+        metrics = pool.getMetrics()
+    assert metrics['launch_errors'] == 2
+    assert metrics['launch_failures_in_a_row'] == 0